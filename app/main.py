@@ -1,4 +1,5 @@
 # app/main.py
+import asyncio
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -23,12 +24,21 @@ from app.routers.sentinel import router as sentinel_router
 from app.routers.signal import router as signal_router
 from app.routers.webhooks import router as webhooks_router
 
-from app.utils.audit import initialize_audit
+from app.utils.async_exec import loop_lag_monitor, outbound_executor, store_executor
+from app.utils.audit import initialize_audit, shutdown_audit
 from app.utils.control_plane import control_plane_state
+from app.utils.project_supabase_signal import warm_project_signal_clients
+from app.utils.retention import retention_engine
 from app.utils.sentinel import sentinel_engine
+from app.utils.signal_batcher import signal_batcher
+from app.utils.signal_lane import signal_lane_registry
+from app.utils.signal_outbox import signal_outbox
+from app.utils.signal_verifier import signal_verifier
 from app.utils.settings import settings
-from app.utils.signal_verification_store import init_signal_verification_store
-from app.utils.webhook_store import init_webhook_store
+from app.utils.sqlite_schema import schema_registry
+from app.utils.storage_backend import get_storage_backend
+from app.utils.supabase_http import supabase_clients
+from app.utils.webhook_dedupe import webhook_dedupe
 
 log = logging.getLogger("ether_v2.main")
 
@@ -95,8 +105,13 @@ async def root():
             "/operations/cron/signal",
             "/operations/audit/recent",
             "/operations/audit/summary",
+            "/operations/storage/status",
+            "/operations/storage/retention",
+            "/operations/storage/retention/run",
             "/operations/signal/health",
             "/operations/signal/history",
+            "/operations/signal/outbox",
+            "/operations/signal/outbox/redrive",
             "/operations/signal/readiness",
             "/operations/signal/all",
             "/operations/signal/{project_slug}",
@@ -159,9 +174,33 @@ async def root():
 
 @app.on_event("startup")
 async def startup_event():
+    schema = schema_registry.bootstrap()
+    log.info("ether_schema_bootstrap=%s", schema)
     initialize_audit()
     control_plane_state.initialize()
     sentinel_engine.initialize()
-    init_webhook_store()
-    init_signal_verification_store()
+    webhook_dedupe.initialize()
+    retention_engine.start()
+    loop_lag_monitor.start()
+    await signal_lane_registry.initialize()
+    await signal_verifier.initialize()
+    await signal_outbox.initialize()
+    # Connect project Supabase clients in the background so startup never waits on the network.
+    app.state.supabase_warmup = asyncio.create_task(warm_project_signal_clients())
     log.info("Ether v2 starting — persistent audit, admin controls, Sentinel enforcement/recovery, provider webhook operations, verified signals, production gate, readiness, operations, and Circa Haus enhanced/premium routes loaded")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await signal_batcher.aclose()
+    await signal_outbox.aclose()
+    await signal_verifier.aclose()
+    await signal_lane_registry.aclose()
+    await loop_lag_monitor.stop()
+    retention_engine.stop()
+    store_executor.shutdown()
+    outbound_executor.shutdown()
+    shutdown_audit()
+    get_storage_backend().close_all()
+    await supabase_clients.aclose()
+    log.info("Ether v2 stopping — audit sink flushed and pooled store and Supabase connections closed")
@@ -62,7 +62,7 @@ async def verify_project_access(request: Request, body: ProjectVerifyRequest):
     verified_user_id = body.user_id
 
     if body.access_token:
-        verified, verification_mode, resolved_user_id = verify_project_access_token(project, body.access_token)
+        verified, verification_mode, resolved_user_id = await verify_project_access_token(project, body.access_token)
         if resolved_user_id:
             verified_user_id = resolved_user_id
     elif body.user_id:
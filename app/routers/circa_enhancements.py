@@ -8,10 +8,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
-from supabase import create_client
 
 from app.utils.audit import audit_event
 from app.utils.request_meta import extract_request_meta
+from app.utils.supabase_guard import SupabaseCallRejected, supabase_guard
+from app.utils.supabase_http import supabase_clients
 
 log = logging.getLogger("ether_v2.circa_enhancements")
 
@@ -84,12 +85,25 @@ def _env(name: str) -> Optional[str]:
     return value or None
 
 
-def _supabase_client():
+def _supabase_credentials() -> Optional[tuple[str, str]]:
     url = _env("CIRCA_HAUS_SUPABASE_URL")
     key = _env("CIRCA_HAUS_SUPABASE_SERVICE_ROLE_KEY")
     if not url or not key:
         return None
-    return create_client(url, key)
+    return url, key
+
+
+async def _execute(builder_for, credentials: tuple[str, str], target: str = "table"):
+    url, key = credentials
+    try:
+        response = await supabase_guard.call("circa_haus", target, builder_for(supabase_clients.client(url, key)).execute)
+    except SupabaseCallRejected:
+        raise
+    except Exception as exc:
+        supabase_clients.report(url, key, ok=False, exc=exc)
+        raise
+    supabase_clients.report(url, key, ok=True)
+    return response
 
 
 def _safe_error(exc: Exception) -> str:
@@ -97,9 +111,9 @@ def _safe_error(exc: Exception) -> str:
     return text[:240]
 
 
-def _insert(table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    client = _supabase_client()
-    if client is None:
+async def _insert(table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    credentials = _supabase_credentials()
+    if credentials is None:
         return {
             "attempted": False,
             "configured": False,
@@ -108,7 +122,7 @@ def _insert(table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
             "error": "CIRCA_HAUS_SUPABASE_URL or CIRCA_HAUS_SUPABASE_SERVICE_ROLE_KEY is not configured in Ether.",
         }
     try:
-        response = client.table(table).insert(payload).execute()
+        response = await _execute(lambda client: client.table(table).insert(payload), credentials)
         rows = getattr(response, "data", None) or []
         return {
             "attempted": True,
@@ -128,9 +142,9 @@ def _insert(table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def _update(table: str, row_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    client = _supabase_client()
-    if client is None:
+async def _update(table: str, row_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    credentials = _supabase_credentials()
+    if credentials is None:
         return {
             "attempted": False,
             "configured": False,
@@ -139,7 +153,7 @@ def _update(table: str, row_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
             "error": "CIRCA_HAUS_SUPABASE_URL or CIRCA_HAUS_SUPABASE_SERVICE_ROLE_KEY is not configured in Ether.",
         }
     try:
-        response = client.table(table).update(payload).eq("id", row_id).execute()
+        response = await _execute(lambda client: client.table(table).update(payload).eq("id", row_id), credentials)
         rows = getattr(response, "data", None) or []
         return {
             "attempted": True,
@@ -336,7 +350,7 @@ async def create_rights_attestation(payload: RightsAttestationRequest, request:
     record = payload.model_dump(mode="json")
     record["risk_level"] = "normal"
     record["status"] = "attested"
-    result = _insert("rights_attestations", record)
+    result = await _insert("rights_attestations", record)
     audit_event(
         action="circa.rights_attestation.create",
         project_slug="circa_haus",
@@ -352,7 +366,7 @@ async def create_copyright_claim(payload: CopyrightClaimRequest, request: Reques
     meta = extract_request_meta(request)
     record = payload.model_dump(mode="json")
     record["claim_status"] = "received"
-    result = _insert("copyright_claims", record)
+    result = await _insert("copyright_claims", record)
     audit_event(
         action="circa.copyright_claim.create",
         project_slug="circa_haus",
@@ -371,7 +385,7 @@ async def create_merch_ideation_session(payload: MerchIdeationRequest, request:
     record["rights_warning_shown"] = True
     record["status"] = "needs_revision" if risk["risk_level"] == "blocked_review" else "draft"
     record["metadata"] = {**payload.metadata, "saia_reference_risk_scan": risk}
-    result = _insert("merch_ideation_sessions", record)
+    result = await _insert("merch_ideation_sessions", record)
     audit_event(
         action="circa.merch_ideation.session_create",
         project_slug="circa_haus",
@@ -402,7 +416,7 @@ async def create_merch_concept(payload: MerchConceptRequest, request: Request):
         "image_model_configured": image_model_configured,
         "generation_mode": "credentialed_provider_required" if not image_model_configured else "ready_for_provider_generation",
     }
-    result = _insert("merch_concept_assets", record)
+    result = await _insert("merch_concept_assets", record)
     audit_event(
         action="circa.merch_concept.create",
         project_slug="circa_haus",
@@ -433,7 +447,7 @@ async def approve_merch_concept(payload: MerchConceptApprovalRequest, request: R
         update_payload["rights_attestation_id"] = str(payload.rights_attestation_id)
     if payload.merch_listing_id:
         update_payload["merch_listing_id"] = str(payload.merch_listing_id)
-    result = _update("merch_concept_assets", str(payload.concept_asset_id), update_payload)
+    result = await _update("merch_concept_assets", str(payload.concept_asset_id), update_payload)
     audit_event(
         action="circa.merch_concept.creator_approve",
         project_slug="circa_haus",
@@ -459,7 +473,7 @@ async def create_merch_preflight_review(payload: MerchPreflightRequest, request:
     record = payload.model_dump(mode="json")
     record["status"] = "passed" if passed else "needs_fix"
     record["reviewed_at"] = _utc_now()
-    result = _insert("merch_artwork_preflight_reviews", record)
+    result = await _insert("merch_artwork_preflight_reviews", record)
     audit_event(
         action="circa.merch_preflight.create",
         project_slug="circa_haus",
@@ -476,7 +490,7 @@ async def create_creator_shop(payload: CreatorShopRequest, request: Request):
     record = payload.model_dump(mode="json")
     record["shop_mode"] = "creator_native"
     record["general_ecommerce_features_enabled"] = False
-    result = _insert("creator_shops", record)
+    result = await _insert("creator_shops", record)
     audit_event(
         action="circa.creator_shop.create",
         project_slug="circa_haus",
@@ -499,7 +513,7 @@ async def create_creator_shop_item(payload: CreatorShopItemRequest, request: Req
         }
         if record["status"] == "published":
             record["status"] = "draft"
-    result = _insert("creator_shop_items", record)
+    result = await _insert("creator_shop_items", record)
     audit_event(
         action="circa.creator_shop_item.create",
         project_slug="circa_haus",
@@ -527,7 +541,7 @@ async def create_audio_license_verification(payload: AudioLicenseVerificationReq
         "allowed_surface": allowed_surface,
         "allowed_surfaces": LICENSED_AUDIO_SURFACES,
     }
-    result = _insert("audio_license_verifications", record)
+    result = await _insert("audio_license_verifications", record)
     audit_event(
         action="circa.audio_license_verification.create",
         project_slug="circa_haus",
@@ -8,10 +8,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
-from supabase import create_client
 
 from app.utils.audit import audit_event
 from app.utils.request_meta import extract_request_meta
+from app.utils.supabase_guard import SupabaseCallRejected, supabase_guard
+from app.utils.supabase_http import supabase_clients
 
 log = logging.getLogger("ether_v2.circa_premium")
 
@@ -47,12 +48,25 @@ def _env(name: str) -> Optional[str]:
     return value or None
 
 
-def _supabase_client():
+def _supabase_credentials() -> Optional[tuple[str, str]]:
     url = _env("CIRCA_HAUS_SUPABASE_URL")
     key = _env("CIRCA_HAUS_SUPABASE_SERVICE_ROLE_KEY")
     if not url or not key:
         return None
-    return create_client(url, key)
+    return url, key
+
+
+async def _execute(builder_for, credentials: tuple[str, str], target: str = "table"):
+    url, key = credentials
+    try:
+        response = await supabase_guard.call("circa_haus", target, builder_for(supabase_clients.client(url, key)).execute)
+    except SupabaseCallRejected:
+        raise
+    except Exception as exc:
+        supabase_clients.report(url, key, ok=False, exc=exc)
+        raise
+    supabase_clients.report(url, key, ok=True)
+    return response
 
 
 def _safe_error(exc: Exception) -> str:
@@ -60,9 +74,9 @@ def _safe_error(exc: Exception) -> str:
     return text[:240]
 
 
-def _insert(table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    client = _supabase_client()
-    if client is None:
+async def _insert(table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    credentials = _supabase_credentials()
+    if credentials is None:
         return {
             "ok": False,
             "attempted": False,
@@ -71,16 +85,16 @@ def _insert(table: str, payload: Dict[str, Any]) -> Dict[str, Any]:
             "error": "CIRCA_HAUS_SUPABASE_URL or CIRCA_HAUS_SUPABASE_SERVICE_ROLE_KEY is not configured in Ether.",
         }
     try:
-        response = client.table(table).insert(payload).execute()
+        response = await _execute(lambda client: client.table(table).insert(payload), credentials)
         return {"ok": True, "attempted": True, "configured": True, "table": table, "rows": getattr(response, "data", None) or []}
     except Exception as exc:
         log.warning("circa_premium_insert_failed table=%s error=%s", table, _safe_error(exc))
         return {"ok": False, "attempted": True, "configured": True, "table": table, "error": _safe_error(exc)}
 
 
-def _update(table: str, row_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    client = _supabase_client()
-    if client is None:
+async def _update(table: str, row_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    credentials = _supabase_credentials()
+    if credentials is None:
         return {
             "ok": False,
             "attempted": False,
@@ -89,16 +103,16 @@ def _update(table: str, row_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
             "error": "CIRCA_HAUS_SUPABASE_URL or CIRCA_HAUS_SUPABASE_SERVICE_ROLE_KEY is not configured in Ether.",
         }
     try:
-        response = client.table(table).update(payload).eq("id", row_id).execute()
+        response = await _execute(lambda client: client.table(table).update(payload).eq("id", row_id), credentials)
         return {"ok": True, "attempted": True, "configured": True, "table": table, "rows": getattr(response, "data", None) or []}
     except Exception as exc:
         log.warning("circa_premium_update_failed table=%s error=%s", table, _safe_error(exc))
         return {"ok": False, "attempted": True, "configured": True, "table": table, "error": _safe_error(exc)}
 
 
-def _rpc(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    client = _supabase_client()
-    if client is None:
+async def _rpc(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    credentials = _supabase_credentials()
+    if credentials is None:
         return {
             "ok": False,
             "attempted": False,
@@ -107,7 +121,7 @@ def _rpc(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
             "error": "CIRCA_HAUS_SUPABASE_URL or CIRCA_HAUS_SUPABASE_SERVICE_ROLE_KEY is not configured in Ether.",
         }
     try:
-        response = client.rpc(name, payload).execute()
+        response = await _execute(lambda client: client.rpc(name, payload), credentials, target="rpc")
         return {"ok": True, "attempted": True, "configured": True, "rpc": name, "data": getattr(response, "data", None)}
     except Exception as exc:
         log.warning("circa_premium_rpc_failed rpc=%s error=%s", name, _safe_error(exc))
@@ -255,7 +269,7 @@ async def create_saia_merch_brief(payload: SaiaMerchBriefRequest, request: Reque
     meta = extract_request_meta(request)
     record = payload.model_dump(mode="json")
     record["rights_warning_shown"] = True
-    result = _insert("saia_merch_briefs", record)
+    result = await _insert("saia_merch_briefs", record)
     audit_event(action="circa.premium.saia_merch_brief.create", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"db": result})
     return {"ok": bool(result.get("ok")), "record": record, "db": result}
 
@@ -266,7 +280,7 @@ async def create_saia_workflow_event(payload: SaiaWorkflowEventRequest, request:
     record = payload.model_dump(mode="json", exclude={"creator_confirmed"})
     if payload.creator_confirmed:
         record["creator_confirmed_at"] = _utc_now()
-    result = _insert("saia_workflow_events", record)
+    result = await _insert("saia_workflow_events", record)
     audit_event(action="circa.premium.saia_workflow_event.create", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"workflow_key": payload.workflow_key, "step_key": payload.step_key, "db": result})
     return {"ok": bool(result.get("ok")), "record": record, "db": result}
 
@@ -281,7 +295,7 @@ async def create_merch_collection(payload: MerchCollectionRequest, request: Requ
     if payload.status == "published" and payload.rights_attestation_id:
         record["approved_by_creator_at"] = _utc_now()
         record["published_at"] = _utc_now()
-    result = _insert("merch_collections", record)
+    result = await _insert("merch_collections", record)
     audit_event(action="circa.premium.collection.create", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"status": record.get("status"), "db": result})
     return {"ok": bool(result.get("ok")), "record": record, "db": result}
 
@@ -290,7 +304,7 @@ async def create_merch_collection(payload: MerchCollectionRequest, request: Requ
 async def create_merch_collection_item(payload: MerchCollectionItemRequest, request: Request):
     meta = extract_request_meta(request)
     record = payload.model_dump(mode="json")
-    result = _insert("merch_collection_items", record)
+    result = await _insert("merch_collection_items", record)
     audit_event(action="circa.premium.collection_item.create", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"collection_id": str(payload.collection_id), "db": result})
     return {"ok": bool(result.get("ok")), "record": record, "db": result}
 
@@ -300,7 +314,7 @@ async def join_merch_drop_waitlist(payload: MerchDropWaitlistRequest, request: R
     meta = extract_request_meta(request)
     record = payload.model_dump(mode="json")
     record["status"] = "waiting"
-    result = _insert("merch_drop_waitlist", record)
+    result = await _insert("merch_drop_waitlist", record)
     audit_event(action="circa.premium.drop_waitlist.join", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"source_surface": payload.source_surface, "db": result})
     return {"ok": bool(result.get("ok")), "record": record, "db": result}
 
@@ -311,7 +325,7 @@ async def create_checkout_intent(payload: CheckoutIntentRequest, request: Reques
     record = payload.model_dump(mode="json")
     if payload.source_surface not in CREATOR_NATIVE_SURFACES:
         record["metadata"] = {**payload.metadata, "surface_warning": "Source surface is outside the approved creator-native commerce surfaces."}
-    result = _insert("commerce_checkout_intents", record)
+    result = await _insert("commerce_checkout_intents", record)
     audit_event(action="circa.premium.checkout_intent.create", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"source_surface": payload.source_surface, "db": result})
     return {"ok": bool(result.get("ok")), "record": record, "db": result}
 
@@ -320,7 +334,7 @@ async def create_checkout_intent(payload: CheckoutIntentRequest, request: Reques
 async def record_premium_analytics_event(payload: PremiumAnalyticsEventRequest, request: Request):
     meta = extract_request_meta(request)
     rpc_payload = payload.model_dump(mode="json")
-    result = _rpc("circa_record_premium_event", {"payload": rpc_payload})
+    result = await _rpc("circa_record_premium_event", {"payload": rpc_payload})
     audit_event(action="circa.premium.analytics_event.record", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"event_type": payload.event_type, "db": result})
     return {"ok": bool(result.get("ok")), "payload": rpc_payload, "db": result}
 
@@ -333,7 +347,7 @@ async def create_licensed_audio_placement(payload: LicensedAudioPlacementRequest
     record["provider"] = provider
     record["placement_status"] = "verified" if payload.usage_rights_verified else "pending_verification"
     record["metadata"] = {**payload.metadata, "native_ai_music_generation_at_launch": False}
-    result = _insert("licensed_audio_placements", record)
+    result = await _insert("licensed_audio_placements", record)
     audit_event(action="circa.premium.audio_placement.create", project_slug="circa_haus", actor=meta.source, provider=provider, result="ok" if result.get("ok") else "pending_configuration", details={"surface": payload.surface, "status": record["placement_status"], "db": result})
     return {"ok": bool(result.get("ok")), "record": record, "db": result}
 
@@ -341,6 +355,6 @@ async def create_licensed_audio_placement(payload: LicensedAudioPlacementRequest
 @router.post("/merch/publish-ready")
 async def merch_publish_ready(payload: PublishReadyRequest, request: Request):
     meta = extract_request_meta(request)
-    result = _rpc("circa_shop_publish_ready", {"p_merch_listing_id": str(payload.merch_listing_id)})
+    result = await _rpc("circa_shop_publish_ready", {"p_merch_listing_id": str(payload.merch_listing_id)})
     audit_event(action="circa.premium.merch_publish_ready", project_slug="circa_haus", actor=meta.source, result="ok" if result.get("ok") else "pending_configuration", details={"merch_listing_id": str(payload.merch_listing_id), "db": result})
     return {"ok": bool(result.get("ok")), "db": result}
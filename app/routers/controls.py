@@ -5,8 +5,10 @@ from fastapi import APIRouter, Request
 
 from app.schemas.controls import ControlActionResponse, ControlRecoveryRequest, ProjectControlRequest, ProviderControlRequest
 from app.schemas.errors import EtherErrorResponse
+from app.utils.async_exec import run_store
 from app.utils.audit import audit_event, audit_snapshot, list_recent_audit_events
 from app.utils.control_plane import control_plane_state
+from app.utils.pagination import decode_cursor, next_cursor
 from app.utils.projects import get_project, list_projects
 from app.utils.provider_readiness import provider_readiness_for_project, provider_readiness_for_suite
 from app.utils.request_meta import extract_request_meta
@@ -95,10 +97,10 @@ async def list_control_state():
 @router.get("/summary")
 async def control_summary():
     controls = control_plane_state.snapshot()
-    provider_readiness = provider_readiness_for_suite()
-    signal = signal_verification_snapshot()
-    audit = audit_snapshot(limit=20)
-    projects = [_project_control_impact(project.slug) for project in list_projects()]
+    provider_readiness = await run_store(provider_readiness_for_suite)
+    signal = await run_store(signal_verification_snapshot)
+    audit = await run_store(audit_snapshot, limit=20)
+    projects = [await run_store(_project_control_impact, project.slug) for project in list_projects()]
     launch_blockers: dict[str, list[str]] = {}
     for row in projects:
         if row.get("launch_blocking"):
@@ -134,18 +136,40 @@ async def control_blockers():
 
 
 @router.get("/history")
-async def control_history(project_slug: str | None = None, provider: str | None = None, incident_id: str | None = None, limit: int = 100):
-    events = control_plane_state.events(project_slug=project_slug, provider=provider, incident_id=incident_id, limit=limit)
+async def control_history(
+    project_slug: str | None = None,
+    provider: str | None = None,
+    incident_id: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+):
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as exc:
+        return EtherErrorResponse.bad_request(code="ETHER_INVALID_CURSOR", message=str(exc))
+    events = await run_store(
+        control_plane_state.events,
+        project_slug=project_slug,
+        provider=provider,
+        incident_id=incident_id,
+        limit=limit,
+        before=before,
+        since=since,
+        until=until,
+    )
     return {
         "ok": True,
         "count": len(events),
         "events": events,
+        "next_cursor": next_cursor(events, "created_at", limit),
     }
 
 
 @router.get("/impact/{project_slug}")
 async def control_impact(project_slug: str):
-    impact = _project_control_impact(project_slug)
+    impact = await run_store(_project_control_impact, project_slug)
     if not impact.get("ok"):
         return EtherErrorResponse.not_found(
             code="ETHER_PROJECT_NOT_FOUND",
@@ -157,7 +181,7 @@ async def control_impact(project_slug: str):
 
 @router.get("/recovery/{project_slug}")
 async def recovery_diagnostics(project_slug: str):
-    impact = _project_control_impact(project_slug)
+    impact = await run_store(_project_control_impact, project_slug)
     if not impact.get("ok"):
         return EtherErrorResponse.not_found(
             code="ETHER_PROJECT_NOT_FOUND",
@@ -186,7 +210,8 @@ async def recover_controls(body: ControlRecoveryRequest, request: Request):
 
     actions = []
     if body.enable_project:
-        state = control_plane_state.enable_project(
+        state = await run_store(
+            control_plane_state.enable_project,
             project.slug,
             body.reason,
             body.details,
@@ -203,7 +228,8 @@ async def recover_controls(body: ControlRecoveryRequest, request: Request):
         actions.append({"control_type": "project", "project_slug": state.project_slug, "status": "enabled"})
 
     for provider in body.providers:
-        state = control_plane_state.enable_provider(
+        state = await run_store(
+            control_plane_state.enable_provider,
             project.slug,
             provider,
             body.reason,
@@ -225,7 +251,7 @@ async def recover_controls(body: ControlRecoveryRequest, request: Request):
         "ok": True,
         "project_slug": project.slug,
         "actions": actions,
-        "post_recovery_impact": _project_control_impact(project.slug),
+        "post_recovery_impact": await run_store(_project_control_impact, project.slug),
         "recovery_notes": _recovery_notes(project.slug),
     }
 
@@ -241,7 +267,7 @@ async def disable_project(body: ProjectControlRequest, request: Request):
             details={"project_slug": body.project_slug},
         )
 
-    state = control_plane_state.disable_project(project.slug, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
+    state = await run_store(control_plane_state.disable_project, project.slug, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
     audit_event(
         action="controls.project.disable",
         project_slug=project.slug,
@@ -272,7 +298,7 @@ async def enable_project(body: ProjectControlRequest, request: Request):
             details={"project_slug": body.project_slug},
         )
 
-    state = control_plane_state.enable_project(project.slug, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
+    state = await run_store(control_plane_state.enable_project, project.slug, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
     audit_event(
         action="controls.project.enable",
         project_slug=project.slug,
@@ -303,7 +329,7 @@ async def disable_provider(body: ProviderControlRequest, request: Request):
             details={"project_slug": body.project_slug},
         )
 
-    state = control_plane_state.disable_provider(project.slug, body.provider, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
+    state = await run_store(control_plane_state.disable_provider, project.slug, body.provider, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
     audit_event(
         action="controls.provider.disable",
         project_slug=project.slug,
@@ -336,7 +362,7 @@ async def enable_provider(body: ProviderControlRequest, request: Request):
             details={"project_slug": body.project_slug},
         )
 
-    state = control_plane_state.enable_provider(project.slug, body.provider, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
+    state = await run_store(control_plane_state.enable_provider, project.slug, body.provider, body.reason, body.details, actor=meta.source, incident_id=body.incident_id)
     audit_event(
         action="controls.provider.enable",
         project_slug=project.slug,
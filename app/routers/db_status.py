@@ -1,6 +1,7 @@
 # app/routers/db_status.py
 
 from fastapi import APIRouter
+from app.utils.async_exec import run_outbound
 from app.utils.supabase_client import get_supabase_client
 
 router = APIRouter(prefix="/db", tags=["supabase-status"])
@@ -13,7 +14,7 @@ async def supabase_status():
     try:
         client = get_supabase_client()
         # minimal call — no table access needed
-        result = client.auth.get_session()
+        result = await run_outbound(client.auth.get_session)
         return {
             "supabase_url_configured": True,
             "health_ok": True,
@@ -1,6 +1,7 @@
 # app/routers/db_test.py
 
 from fastapi import APIRouter
+from app.utils.async_exec import run_outbound
 from app.utils.supabase_client import get_supabase_client
 
 router = APIRouter(prefix="/db", tags=["supabase-db-test"])
@@ -13,7 +14,7 @@ async def list_test_table():
     """
     client = get_supabase_client()
     try:
-        result = client.table("ether_test").select("*", count="exact").limit(10).execute()
+        result = await run_outbound(client.table("ether_test").select("*", count="exact").limit(10).execute)
         return {
             "connected": True,
             "table": "ether_test",
@@ -34,7 +35,7 @@ async def write_test():
     """
     client = get_supabase_client()
     try:
-        result = client.table("ether_test").insert({"ts": "now"}).execute()
+        result = await run_outbound(client.table("ether_test").insert({"ts": "now"}).execute)
         return {"inserted": True, "response": result.data}
     except Exception as e:
         return {"inserted": False, "error": str(e)}
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 from app.db.supabase import get_supabase_client
+from app.utils.async_exec import run_outbound
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -32,7 +33,7 @@ async def deep_health():
         checks["supabase_client"] = True
 
         # lightweight read (table existence + connectivity)
-        resp = supabase.table("ether_test").select("*").limit(1).execute()
+        resp = await run_outbound(supabase.table("ether_test").select("*").limit(1).execute)
         _ = resp.data
         checks["db_read"] = True
     except Exception:
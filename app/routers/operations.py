@@ -1,17 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
 
+from app.schemas.errors import EtherErrorResponse
+from app.utils.async_exec import async_status, run_store
 from app.utils.audit import audit_event, audit_snapshot, list_recent_audit_events
+from app.utils.audit_sink import audit_sink
+from app.utils.pagination import decode_cursor, next_cursor
 from app.utils.production_gate import production_gate_snapshot
 from app.utils.project_supabase_signal import build_signal_payload, project_signal_readiness, record_and_verify_project_signal
 from app.utils.projects import get_project, list_projects
 from app.utils.request_meta import extract_request_meta
+from app.utils.retention import retention_engine
+from app.utils.signal_batcher import signal_batcher
+from app.utils.signal_keepalive import signal_keepalive
 from app.utils.signal_lane import signal_lane_registry
-from app.utils.signal_verification_store import list_signal_runs, signal_verification_snapshot
+from app.utils.signal_outbox import signal_outbox
+from app.utils.signal_outbox_store import OUTBOX_STATUSES
+from app.utils.signal_ticket import lane_tickets
+from app.utils.signal_verifier import signal_verifier
+from app.utils.signal_verification_store import (
+    list_signal_runs_async,
+    save_signal_run_async,
+    signal_latency_snapshot_async,
+    signal_verification_snapshot_async,
+)
+from app.utils.sqlite_schema import schema_registry
+from app.utils.storage_backend import storage_status as storage_backend_status
+from app.utils.supabase_guard import supabase_guard
+from app.utils.supabase_http import supabase_clients
+
+log = logging.getLogger("ether_v2.operations")
 
 router = APIRouter(prefix="/operations", tags=["operations"])
 
@@ -19,6 +46,38 @@ router = APIRouter(prefix="/operations", tags=["operations"])
 CORE_SIGNAL_PROJECTS = ["circa_haus", "exclusivity"]
 
 
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _float_env(key: str, default: float) -> float:
+    try:
+        return float(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _fanout_concurrency() -> int:
+    return max(1, _int_env("ETHER_SIGNAL_FANOUT_CONCURRENCY", 4))
+
+
+def _project_deadline_seconds() -> float:
+    return max(0.1, _float_env("ETHER_SIGNAL_PROJECT_DEADLINE_SECONDS", 20.0))
+
+
+def _latency_windows_minutes() -> List[int]:
+    windows: List[int] = []
+    for part in os.getenv("ETHER_SIGNAL_LATENCY_WINDOWS_MINUTES", "15,60,1440").split(","):
+        try:
+            windows.append(max(1, int(part.strip())))
+        except ValueError:
+            continue
+    return windows or [15, 60, 1440]
+
+
 class ProjectSignalOperationRequest(BaseModel):
     signal_kind: str = "manual"
     status: str = "ok"
@@ -41,6 +100,17 @@ class SuiteSmokeTestRequest(BaseModel):
     meta: Dict[str, Any] = Field(default_factory=dict)
 
 
+class RetentionRunRequest(BaseModel):
+    tables: List[str] = Field(default_factory=list)
+    dry_run: bool = False
+    convert_auto_vacuum: bool = False
+
+
+class SignalOutboxRedriveRequest(BaseModel):
+    project_slug: Optional[str] = None
+    ids: List[int] = Field(default_factory=list)
+
+
 class CronSignalRequest(BaseModel):
     project_slugs: List[str] = Field(default_factory=lambda: list(CORE_SIGNAL_PROJECTS))
     signal_kind: str = "cron_keepalive"
@@ -49,7 +119,8 @@ class CronSignalRequest(BaseModel):
     meta: Dict[str, Any] = Field(default_factory=dict)
 
 
-def _project_status_rows() -> tuple[list[dict[str, Any]], dict[str, Any]]:
+async def _project_status_rows() -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    # Lane registry and breaker state belong to the event loop; only the store read goes to the executor.
     projects = list_projects()
     rows: list[dict[str, Any]] = []
     ready_count = 0
@@ -57,9 +128,10 @@ def _project_status_rows() -> tuple[list[dict[str, Any]], dict[str, Any]]:
     active_lane_count = 0
     core_ready_count = 0
 
-    verification = signal_verification_snapshot()
+    verification = await signal_verification_snapshot_async()
     last_success = verification.get("last_success_by_project", {})
     last_failure = verification.get("last_failure_by_project", {})
+    outbound = supabase_guard.snapshot()
 
     for project in projects:
         readiness = project_signal_readiness(project.slug).to_dict()
@@ -90,6 +162,8 @@ def _project_status_rows() -> tuple[list[dict[str, Any]], dict[str, Any]]:
                 },
                 "recent_lanes": lanes,
                 "recent_lane_count": len(lanes),
+                "cached_lane_count": signal_lane_registry.lane_count(project.slug),
+                "outbound": outbound["projects"].get(project.slug, {}),
             }
         )
 
@@ -102,13 +176,14 @@ def _project_status_rows() -> tuple[list[dict[str, Any]], dict[str, Any]]:
         "core_ready_for_real_signal_count": core_ready_count,
         "core_ready_for_cron": core_ready_count == len(CORE_SIGNAL_PROJECTS),
         "core_last_verified_count": sum(1 for slug in CORE_SIGNAL_PROJECTS if last_success.get(slug)),
+        "open_circuits": outbound["open_circuits"],
     }
     return rows, summary
 
 
 @router.get("/production/gate")
 async def production_gate():
-    result = production_gate_snapshot()
+    result = await run_store(production_gate_snapshot)
     audit_event(
         action="operations.production_gate",
         result=result.get("decision", "unknown"),
@@ -123,7 +198,7 @@ async def production_gate():
 
 @router.get("/production/checklist")
 async def production_checklist():
-    gate = production_gate_snapshot()
+    gate = await run_store(production_gate_snapshot)
     return {
         "ok": True,
         "decision": gate.get("decision"),
@@ -148,15 +223,16 @@ async def production_checklist():
 
 @router.get("/suite/status")
 async def suite_operations_status():
-    rows, summary = _project_status_rows()
+    rows, summary = await _project_status_rows()
     suite_ready = summary["core_ready_for_cron"]
     return {
         "ok": True,
         "suite_ready_for_core_signal": suite_ready,
         "summary": summary,
-        "production_gate": production_gate_snapshot(include_soft_warnings=False),
-        "signal_verification": signal_verification_snapshot(),
-        "audit": audit_snapshot(limit=12),
+        "production_gate": await run_store(production_gate_snapshot, include_soft_warnings=False),
+        "signal_verification": await signal_verification_snapshot_async(),
+        "audit": await run_store(audit_snapshot, limit=12),
+        "outbound": supabase_guard.snapshot(),
         "cron": {
             "ready": suite_ready,
             "status_route": "/operations/cron/status",
@@ -177,8 +253,8 @@ async def suite_operations_status():
 
 @router.get("/cron/status")
 async def cron_status():
-    rows, summary = _project_status_rows()
-    verification = signal_verification_snapshot()
+    rows, summary = await _project_status_rows()
+    verification = await signal_verification_snapshot_async()
     last_success = verification.get("last_success_by_project", {})
     ready_projects = [row["slug"] for row in rows if row["slug"] in CORE_SIGNAL_PROJECTS and row["signal_readiness"].get("ready_for_real_signal")]
     verified_projects = [slug for slug in CORE_SIGNAL_PROJECTS if last_success.get(slug)]
@@ -201,6 +277,8 @@ async def cron_status():
             "suite_smoke": "/operations/suite/smoke",
             "suite_status": "/operations/suite/status",
             "signal_history": "/operations/signal/history",
+            "signal_outbox": "/operations/signal/outbox",
+            "signal_outbox_redrive": "/operations/signal/outbox/redrive",
             "signal_health": "/operations/signal/health",
             "audit_summary": "/operations/audit/summary",
         },
@@ -228,7 +306,7 @@ async def cron_signal(body: CronSignalRequest, request: Request):
             **body.meta,
         },
     )
-    result = _trigger_many(signal_body, meta.source or "cron")
+    result = await _trigger_many(signal_body, meta.source or "cron")
     audit_event(
         action="operations.cron_signal",
         actor=meta.source or "cron",
@@ -243,9 +321,9 @@ async def cron_signal(body: CronSignalRequest, request: Request):
         "ok": bool(result.get("ok")),
         "cron_ready_after_run": bool(result.get("ok")),
         "signal": result,
-        "signal_verification": signal_verification_snapshot(),
-        "production_gate": production_gate_snapshot(include_soft_warnings=False),
-        "audit": audit_snapshot(limit=12),
+        "signal_verification": await signal_verification_snapshot_async(),
+        "production_gate": await run_store(production_gate_snapshot, include_soft_warnings=False),
+        "audit": await run_store(audit_snapshot, limit=12),
         "operator_notes": [
             "If ok is true, write + readback verification succeeded for every requested project.",
             "If ok is false, check readiness, Render env vars, Supabase SQL, service-role permissions, and readback failure reasons.",
@@ -259,12 +337,29 @@ async def recent_audit_events(
     project_slug: Optional[str] = None,
     action: Optional[str] = None,
     result: Optional[str] = None,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
 ):
-    events = list_recent_audit_events(limit=limit, project_slug=project_slug, action=action, result=result)
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as exc:
+        return EtherErrorResponse.bad_request(code="ETHER_INVALID_CURSOR", message=str(exc))
+    events = await run_store(
+        list_recent_audit_events,
+        limit=limit,
+        project_slug=project_slug,
+        action=action,
+        result=result,
+        before=before,
+        since=since,
+        until=until,
+    )
     return {
         "ok": True,
         "count": len(events),
         "events": events,
+        "next_cursor": next_cursor(events, "ts", limit),
         "note": "Persistent audit events are used when available, with in-memory fallback.",
     }
 
@@ -273,15 +368,67 @@ async def recent_audit_events(
 async def audit_summary(limit: int = 50):
     return {
         "ok": True,
-        "audit": audit_snapshot(limit=limit),
+        "audit": await run_store(audit_snapshot, limit=limit),
     }
 
 
+@router.get("/storage/status")
+async def storage_status():
+    return {
+        "ok": True,
+        "storage": await run_store(storage_backend_status),
+        "schema": await run_store(schema_registry.status),
+        "audit_sink": audit_sink.stats(),
+        "async": async_status(),
+    }
+
+
+@router.get("/storage/retention")
+async def storage_retention_status():
+    return {
+        "ok": True,
+        "retention": await run_store(retention_engine.status),
+    }
+
+
+@router.post("/storage/retention/run")
+async def storage_retention_run(body: RetentionRunRequest, request: Request):
+    meta = extract_request_meta(request)
+    result = await run_store(
+        retention_engine.run,
+        tables=[table.strip().lower() for table in body.tables if table.strip()],
+        dry_run=body.dry_run,
+        convert_auto_vacuum=body.convert_auto_vacuum,
+    )
+    audit_event(
+        action="operations.storage_retention",
+        actor=meta.source,
+        result="ok" if result.get("ok") else "failed",
+        details={
+            "dry_run": body.dry_run,
+            "tables": body.tables,
+            "archived_rows": result.get("archived_rows"),
+            "reclaimed_bytes": result.get("reclaimed_bytes"),
+            "error": result.get("error"),
+        },
+    )
+    return result
+
+
 @router.get("/signal/health")
 async def signal_health(project_slug: Optional[str] = None):
-    snapshot = signal_verification_snapshot(project_slug=project_slug)
+    snapshot, outbox, latency = await asyncio.gather(
+        signal_verification_snapshot_async(project_slug=project_slug),
+        signal_outbox.snapshot(project_slug),
+        signal_latency_snapshot_async(
+            project_slugs=[project_slug] if project_slug else [project.slug for project in list_projects()],
+            windows_minutes=_latency_windows_minutes(),
+            sample_max=max(1, _int_env("ETHER_SIGNAL_LATENCY_SAMPLE_MAX", 5000)),
+        ),
+    )
     last_success = snapshot.get("last_success_by_project", {})
     last_failure = snapshot.get("last_failure_by_project", {})
+    dead_letters = {slug: item.get("dead_letters", 0) for slug, item in (outbox.get("by_project") or {}).items()}
     launch_blockers: list[str] = []
     if project_slug:
         slug = project_slug.strip().lower()
@@ -289,28 +436,86 @@ async def signal_health(project_slug: Optional[str] = None):
             launch_blockers.append(f"No verified signal run exists for {slug}.")
         if last_failure.get(slug) and not last_success.get(slug):
             launch_blockers.append(f"Latest available signal state for {slug} includes failure: {last_failure[slug].get('error')}")
+        if dead_letters.get(slug):
+            launch_blockers.append(f"{dead_letters[slug]} signal write(s) for {slug} are dead-lettered in the outbox.")
     else:
         for slug in CORE_SIGNAL_PROJECTS:
             if not last_success.get(slug):
                 launch_blockers.append(f"No verified signal run exists for core project {slug}.")
+            if dead_letters.get(slug):
+                launch_blockers.append(f"{dead_letters[slug]} signal write(s) for core project {slug} are dead-lettered in the outbox.")
     return {
         "ok": True,
         "launch_blocking": bool(launch_blockers),
         "launch_blockers": launch_blockers,
         "snapshot": snapshot,
+        "supabase_clients": supabase_clients.stats(),
+        "supabase_guard": supabase_guard.snapshot(project_slug),
+        "signal_batcher": signal_batcher.stats(),
+        "signal_verifier": signal_verifier.stats(),
+        "signal_lanes": signal_lane_registry.stats(),
+        "lane_tickets": lane_tickets.stats(),
+        "keepalive": signal_keepalive.stats(project_slug),
+        "outbox": outbox,
+        "latency": latency,
     }
 
 
 @router.get("/signal/history")
-async def signal_history(project_slug: Optional[str] = None, verified_ok: Optional[bool] = None, limit: int = 50):
-    runs = list_signal_runs(project_slug=project_slug, verified_ok=verified_ok, limit=limit)
+async def signal_history(
+    project_slug: Optional[str] = None,
+    verified_ok: Optional[bool] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+):
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as exc:
+        return EtherErrorResponse.bad_request(code="ETHER_INVALID_CURSOR", message=str(exc))
+    runs = await list_signal_runs_async(
+        project_slug=project_slug,
+        verified_ok=verified_ok,
+        limit=limit,
+        before=before,
+        since=since,
+        until=until,
+    )
     return {
         "ok": True,
         "count": len(runs),
         "runs": runs,
+        "next_cursor": next_cursor(runs, "recorded_at", limit),
     }
 
 
+@router.get("/signal/outbox")
+async def signal_outbox_items(status: str = "dead", project_slug: Optional[str] = None, limit: int = 50):
+    status = status.strip().lower()
+    if status not in OUTBOX_STATUSES:
+        return EtherErrorResponse.bad_request(
+            code="ETHER_INVALID_OUTBOX_STATUS",
+            message=f"Outbox status must be one of: {', '.join(OUTBOX_STATUSES)}.",
+        )
+    items = await signal_outbox.items(status=status, project_slug=project_slug, limit=limit)
+    return {"ok": True, "status": status, "count": len(items), "items": items}
+
+
+@router.post("/signal/outbox/redrive")
+async def signal_outbox_redrive(body: SignalOutboxRedriveRequest, request: Request):
+    meta = extract_request_meta(request)
+    redriven = await signal_outbox.redrive(project_slug=body.project_slug, ids=body.ids)
+    audit_event(
+        action="operations.signal_outbox_redrive",
+        project_slug=body.project_slug,
+        actor=meta.source,
+        result="ok",
+        details={"ids": body.ids, "redriven": redriven},
+    )
+    return {"ok": True, "redriven": redriven}
+
+
 @router.get("/signal/readiness")
 async def signal_readiness_index():
     return {
@@ -326,6 +531,8 @@ async def signal_readiness_index():
             "signal_history": "/operations/signal/history",
             "audit_recent": "/operations/audit/recent",
             "audit_summary": "/operations/audit/summary",
+            "storage_status": "/operations/storage/status",
+            "storage_retention": "/operations/storage/retention",
             "all_project_readiness": "/readiness",
             "project_readiness": "/readiness/{project_slug}",
             "manual_project_signal": "/operations/signal/{project_slug}",
@@ -335,7 +542,7 @@ async def signal_readiness_index():
     }
 
 
-def _trigger_for_project(project_slug: str, body: ProjectSignalOperationRequest, actor: Optional[str]) -> Dict[str, Any]:
+async def _trigger_for_project(project_slug: str, body: ProjectSignalOperationRequest, actor: Optional[str]) -> Dict[str, Any]:
     project = get_project(project_slug)
     if project is None:
         audit_event(
@@ -373,7 +580,12 @@ def _trigger_for_project(project_slug: str, body: ProjectSignalOperationRequest,
     )
     payload["signal_kind"] = body.signal_kind.strip() or "manual"
 
-    result = record_and_verify_project_signal(project_slug=project.slug, payload=payload).to_dict()
+    verification = await record_and_verify_project_signal(project_slug=project.slug, payload=payload)
+    signal_keepalive.record_write(project.slug, verification=verification.verification)
+    outboxed = await signal_outbox.capture(project_slug=project.slug, payload=payload, result=verification)
+    result = verification.to_dict()
+    if outboxed:
+        result["outbox"] = {"queued": True, "id": outboxed.get("id"), "next_attempt_at": outboxed.get("next_attempt_at")}
     audit_event(
         action="operations.project_signal",
         project_slug=project.slug,
@@ -401,28 +613,107 @@ def _trigger_for_project(project_slug: str, body: ProjectSignalOperationRequest,
     }
 
 
-def _trigger_many(body: MultiProjectSignalOperationRequest, actor: Optional[str]) -> Dict[str, Any]:
+async def _record_deadline_exceeded(project_slug: str, body: ProjectSignalOperationRequest, deadline: float) -> Dict[str, Any]:
+    error = f"Project signal did not finish within {deadline:g}s."
+    try:
+        await save_signal_run_async(
+            project_slug=project_slug,
+            signal_kind=body.signal_kind.strip() or "manual",
+            lane_id=body.lane_id or f"operations:{project_slug}",
+            status="failed",
+            write_ok=False,
+            readback_ok=False,
+            verified_ok=False,
+            write_mode="deadline_exceeded",
+            write_target=None,
+            readback_mode="not_attempted_deadline_exceeded",
+            readback_target=None,
+            error=error,
+            write_result={},
+            readback_result={},
+            payload_summary={"signal_kind": body.signal_kind, "status": body.status},
+            recorded_at=datetime.now(timezone.utc).isoformat(),
+        )
+    except Exception as exc:
+        log.warning("ether_signal_deadline_run_save_failed=%s", exc)
+    return {
+        "ok": False,
+        "project_slug": project_slug,
+        "timed_out": True,
+        "error": {
+            "code": "ETHER_SIGNAL_DEADLINE_EXCEEDED",
+            "message": error,
+            "project_slug": project_slug,
+        },
+    }
+
+
+async def _trigger_within_deadline(
+    slug: str,
+    body: ProjectSignalOperationRequest,
+    actor: Optional[str],
+    limiter: asyncio.Semaphore,
+    deadline: float,
+) -> Dict[str, Any]:
+    submitted = time.perf_counter()
+    async with limiter:
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(_trigger_for_project(slug, body, actor), timeout=deadline)
+        except asyncio.TimeoutError:
+            result = await _record_deadline_exceeded(slug, body, deadline)
+            audit_event(
+                action="operations.project_signal",
+                project_slug=slug,
+                actor=actor,
+                result="deadline-exceeded",
+                details={"deadline_seconds": deadline, "signal_kind": body.signal_kind},
+            )
+        finished = time.perf_counter()
+    stages = (result.get("project_signal") or {}).get("timings") or {}
+    result["timing"] = {
+        "queued_ms": round((started - submitted) * 1000.0, 3),
+        "run_ms": round((finished - started) * 1000.0, 3),
+        **stages,
+    }
+    return result
+
+
+async def _trigger_many(body: MultiProjectSignalOperationRequest, actor: Optional[str]) -> Dict[str, Any]:
+    """
+    Signal every requested project concurrently.
+
+    At most ``ETHER_SIGNAL_FANOUT_CONCURRENCY`` projects run at once and each gets
+    ``ETHER_SIGNAL_PROJECT_DEADLINE_SECONDS``, so one hung Supabase project costs at
+    most its deadline instead of stalling the whole run. Results keep the requested
+    order.
+    """
     requested = [slug.strip().lower() for slug in body.project_slugs if slug.strip()]
     if not requested:
         requested = [project.slug for project in list_projects()]
 
-    results = []
-    for slug in requested:
+    started = time.perf_counter()
+    concurrency = _fanout_concurrency()
+    deadline = _project_deadline_seconds()
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def _one(slug: str) -> Dict[str, Any]:
         readiness = project_signal_readiness(slug).to_dict()
         if not body.include_unconfigured and not readiness.get("ready_for_real_signal"):
-            results.append(
-                {
-                    "ok": False,
-                    "project_slug": slug,
-                    "skipped": True,
-                    "reason": "Project signal configuration is incomplete.",
-                    "readiness": readiness,
-                }
-            )
-            continue
-        results.append(_trigger_for_project(slug, body, actor))
+            return {
+                "ok": False,
+                "project_slug": slug,
+                "skipped": True,
+                "reason": "Project signal configuration is incomplete.",
+                "readiness": readiness,
+            }
+        return await _trigger_within_deadline(slug, body, actor, limiter, deadline)
+
+    results = list(await asyncio.gather(*(_one(slug) for slug in requested)))
+    elapsed_ms = round((time.perf_counter() - started) * 1000.0, 3)
 
     ok_count = sum(1 for item in results if item.get("ok"))
+    timed_out = [item["project_slug"] for item in results if item.get("timed_out")]
     audit_event(
         action="operations.project_signal_all",
         actor=actor,
@@ -431,12 +722,18 @@ def _trigger_many(body: MultiProjectSignalOperationRequest, actor: Optional[str]
             "requested": requested,
             "ok_count": ok_count,
             "total": len(results),
+            "timed_out": timed_out,
+            "elapsed_ms": elapsed_ms,
         },
     )
     return {
         "ok": bool(results) and ok_count == len(results),
         "ok_count": ok_count,
         "total": len(results),
+        "timed_out": timed_out,
+        "elapsed_ms": elapsed_ms,
+        "concurrency": concurrency,
+        "deadline_seconds": deadline,
         "results": results,
     }
 
@@ -444,7 +741,7 @@ def _trigger_many(body: MultiProjectSignalOperationRequest, actor: Optional[str]
 @router.post("/suite/smoke")
 async def suite_smoke_test(body: SuiteSmokeTestRequest, request: Request):
     meta = extract_request_meta(request)
-    before_rows, before_summary = _project_status_rows()
+    before_rows, before_summary = await _project_status_rows()
     signal_body = MultiProjectSignalOperationRequest(
         project_slugs=body.project_slugs,
         include_unconfigured=body.include_unconfigured,
@@ -455,9 +752,9 @@ async def suite_smoke_test(body: SuiteSmokeTestRequest, request: Request):
             **body.meta,
         },
     )
-    signal_result = _trigger_many(signal_body, meta.source)
-    after_rows, after_summary = _project_status_rows()
-    audit = audit_snapshot(limit=25)
+    signal_result = await _trigger_many(signal_body, meta.source)
+    after_rows, after_summary = await _project_status_rows()
+    audit = await run_store(audit_snapshot, limit=25)
     ok = bool(signal_result.get("ok"))
     audit_event(
         action="operations.suite_smoke_test",
@@ -476,8 +773,8 @@ async def suite_smoke_test(body: SuiteSmokeTestRequest, request: Request):
         "before": {"summary": before_summary, "projects": before_rows},
         "signal": signal_result,
         "after": {"summary": after_summary, "projects": after_rows},
-        "signal_verification": signal_verification_snapshot(),
-        "production_gate": production_gate_snapshot(include_soft_warnings=False),
+        "signal_verification": await signal_verification_snapshot_async(),
+        "production_gate": await run_store(production_gate_snapshot, include_soft_warnings=False),
         "audit": audit,
         "operator_notes": [
             "If signal.ok is false because projects are not configured, wire Render env vars and apply Supabase SQL first.",
@@ -491,10 +788,10 @@ async def suite_smoke_test(body: SuiteSmokeTestRequest, request: Request):
 @router.post("/signal/all")
 async def trigger_all_project_signals(body: MultiProjectSignalOperationRequest, request: Request):
     meta = extract_request_meta(request)
-    return _trigger_many(body, meta.source)
+    return await _trigger_many(body, meta.source)
 
 
 @router.post("/signal/{project_slug}")
 async def trigger_project_signal(project_slug: str, body: ProjectSignalOperationRequest, request: Request):
     meta = extract_request_meta(request)
-    return _trigger_for_project(project_slug, body, meta.source)
+    return await _trigger_for_project(project_slug, body, meta.source)
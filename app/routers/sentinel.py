@@ -19,8 +19,10 @@ from app.schemas.sentinel import (
     ThreatReviewResponse,
 )
 from app.utils.admin_ai import admin_ai_reviewer
+from app.utils.async_exec import run_store
 from app.utils.audit import audit_event
 from app.utils.control_plane import control_plane_state
+from app.utils.pagination import decode_cursor, next_cursor
 from app.utils.projects import resolve_project
 from app.utils.request_meta import extract_request_meta
 from app.utils.sentinel import QuarantineRecord, ThreatRecord, sentinel_engine
@@ -70,7 +72,8 @@ def _sentinel_launch_blockers(project_slug: str | None = None) -> tuple[bool, li
     blockers: list[str] = []
     open_threats = int(snapshot.get("threat_status_counts", {}).get("open", 0) or 0)
     active_quarantines = int(snapshot.get("quarantine_status_counts", {}).get("active", 0) or 0)
-    quarantine_dispositions = int(snapshot.get("disposition_counts", {}).get("quarantine", 0) or 0)
+    # Disposition totals are lifetime; only recent quarantine-level incidents block launch.
+    quarantine_dispositions = int((snapshot.get("window") or {}).get("disposition_counts", {}).get("quarantine", 0) or 0)
 
     if open_threats > 0:
         blockers.append(f"{open_threats} open Sentinel threat(s) require review.")
@@ -94,8 +97,8 @@ def _recovery_guidance(project_slug: str) -> list[str]:
 
 @router.get("/status", response_model=SentinelStatusResponse)
 async def sentinel_status(project_slug: str | None = None):
-    snapshot = sentinel_engine.snapshot(project_slug=project_slug)
-    launch_blocking, blockers = _sentinel_launch_blockers(project_slug=project_slug)
+    snapshot = await run_store(sentinel_engine.snapshot, project_slug=project_slug)
+    launch_blocking, blockers = await run_store(_sentinel_launch_blockers, project_slug=project_slug)
     return SentinelStatusResponse(
         ok=True,
         project_slug=project_slug,
@@ -116,7 +119,8 @@ async def enforce_action(request: Request, body: EnforcementCheckRequest):
             details={"project_slug": body.project_slug},
         )
 
-    decision = sentinel_engine.evaluate_enforcement(
+    decision = await run_store(
+        sentinel_engine.evaluate_enforcement,
         project_slug=project.slug,
         action=body.action,
         actor_id=body.actor_id,
@@ -153,8 +157,8 @@ async def sentinel_recovery_diagnostics(project_slug: str):
             message="Project could not be resolved for Sentinel recovery diagnostics.",
             details={"project_slug": project_slug},
         )
-    snapshot = sentinel_engine.snapshot(project_slug=project.slug)
-    launch_blocking, blockers = _sentinel_launch_blockers(project_slug=project.slug)
+    snapshot = await run_store(sentinel_engine.snapshot, project_slug=project.slug)
+    launch_blocking, blockers = await run_store(_sentinel_launch_blockers, project_slug=project.slug)
     active_quarantines = [q for q in snapshot.get("recent_quarantines", []) if q.get("status") == "active"]
     open_threats = [t for t in snapshot.get("recent_threats", []) if t.get("status") == "open"]
     return {
@@ -184,7 +188,8 @@ async def sentinel_recovery(request: Request, body: SentinelRecoveryRequest):
     released = []
     reviewed = []
     for quarantine_id in body.release_quarantine_ids:
-        record = sentinel_engine.release_quarantine(
+        record = await run_store(
+            sentinel_engine.release_quarantine,
             quarantine_id=quarantine_id,
             released_by=meta.source,
             release_reason=body.reason,
@@ -200,7 +205,8 @@ async def sentinel_recovery(request: Request, body: SentinelRecoveryRequest):
             )
 
     for threat_id in body.review_threat_ids:
-        record = sentinel_engine.review_threat(
+        record = await run_store(
+            sentinel_engine.review_threat,
             threat_id=threat_id,
             reviewer=meta.source,
             status=body.review_status,
@@ -216,8 +222,8 @@ async def sentinel_recovery(request: Request, body: SentinelRecoveryRequest):
                 details={"threat_id": threat_id, "reason": body.reason, "details": body.details},
             )
 
-    snapshot = sentinel_engine.snapshot(project_slug=project.slug)
-    launch_blocking, blockers = _sentinel_launch_blockers(project_slug=project.slug)
+    snapshot = await run_store(sentinel_engine.snapshot, project_slug=project.slug)
+    launch_blocking, blockers = await run_store(_sentinel_launch_blockers, project_slug=project.slug)
     audit_event(
         action="sentinel.recovery",
         project_slug=project.slug,
@@ -266,7 +272,8 @@ async def record_threat_event(request: Request, body: ThreatEventRequest):
             },
         )
 
-    record = sentinel_engine.record_threat(
+    record = await run_store(
+        sentinel_engine.record_threat,
         project_slug=project.slug,
         event_type=body.event_type,
         severity=body.severity,
@@ -276,7 +283,8 @@ async def record_threat_event(request: Request, body: ThreatEventRequest):
     )
 
     if record.quarantined and body.details.get("auto_disable_project"):
-        control_plane_state.disable_project(
+        await run_store(
+            control_plane_state.disable_project,
             project.slug,
             reason=f"Auto-disabled after sentinel event: {body.event_type}",
             details={"risk_score": record.risk_score, "threat_id": record.id, **body.details},
@@ -285,7 +293,8 @@ async def record_threat_event(request: Request, body: ThreatEventRequest):
         )
     provider_name = str(body.details.get("provider") or "").strip().lower()
     if record.quarantined and provider_name and body.details.get("auto_disable_provider"):
-        control_plane_state.disable_provider(
+        await run_store(
+            control_plane_state.disable_provider,
             project.slug,
             provider_name,
             reason=f"Auto-disabled after sentinel event: {body.event_type}",
@@ -322,19 +331,32 @@ async def record_threat_event(request: Request, body: ThreatEventRequest):
 
 
 @router.get("/events")
-async def list_threat_events(project_slug: str | None = None, status: str | None = None, limit: int = 25):
-    records = sentinel_engine.list_threats(project_slug=project_slug, status=status, limit=limit)
+async def list_threat_events(
+    project_slug: str | None = None,
+    status: str | None = None,
+    limit: int = 25,
+    cursor: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+):
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as exc:
+        return EtherErrorResponse.bad_request(code="ETHER_INVALID_CURSOR", message=str(exc))
+    records = await run_store(sentinel_engine.list_threats, project_slug=project_slug, status=status, limit=limit, before=before, since=since, until=until)
+    threats = [_threat_payload(record) for record in records]
     return {
         "ok": True,
         "count": len(records),
-        "threats": [_threat_payload(record) for record in records],
+        "threats": threats,
+        "next_cursor": next_cursor(threats, "created_at", limit),
     }
 
 
 @router.post("/review", response_model=ThreatReviewResponse)
 async def review_threats(body: ThreatReviewRequest):
-    threats = sentinel_engine.list_threats(project_slug=body.project_slug, limit=body.recent_limit)
-    quarantines = sentinel_engine.list_quarantines(project_slug=body.project_slug)
+    threats = await run_store(sentinel_engine.list_threats, project_slug=body.project_slug, limit=body.recent_limit)
+    quarantines = await run_store(sentinel_engine.list_quarantines, project_slug=body.project_slug)
     review = admin_ai_reviewer.review(
         project_slug=body.project_slug,
         threats=threats,
@@ -353,7 +375,8 @@ async def review_threats(body: ThreatReviewRequest):
 @router.post("/review/manual")
 async def manual_review_threat(request: Request, body: ThreatManualReviewRequest):
     meta = extract_request_meta(request)
-    record = sentinel_engine.review_threat(
+    record = await run_store(
+        sentinel_engine.review_threat,
         threat_id=body.threat_id,
         reviewer=meta.source,
         status=body.status,
@@ -386,7 +409,8 @@ async def quarantine_target(request: Request, body: QuarantineRequest):
             details={"project_slug": body.project_slug},
         )
 
-    record = sentinel_engine.add_quarantine(
+    record = await run_store(
+        sentinel_engine.add_quarantine,
         project_slug=project.slug,
         target_type=body.target_type,
         target_id=body.target_id,
@@ -415,7 +439,8 @@ async def quarantine_target(request: Request, body: QuarantineRequest):
 @router.post("/quarantine/release")
 async def release_quarantine_route(request: Request, body: QuarantineReleaseRequest):
     meta = extract_request_meta(request)
-    record = sentinel_engine.release_quarantine(
+    record = await run_store(
+        sentinel_engine.release_quarantine,
         quarantine_id=body.quarantine_id,
         released_by=meta.source,
         release_reason=body.reason,
@@ -437,10 +462,23 @@ async def release_quarantine_route(request: Request, body: QuarantineReleaseRequ
 
 
 @router.get("/quarantines")
-async def list_quarantines(project_slug: str | None = None, status: str | None = None, limit: int = 100):
-    records = sentinel_engine.list_quarantines(project_slug=project_slug, status=status, limit=limit)
+async def list_quarantines(
+    project_slug: str | None = None,
+    status: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+):
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as exc:
+        return EtherErrorResponse.bad_request(code="ETHER_INVALID_CURSOR", message=str(exc))
+    records = await run_store(sentinel_engine.list_quarantines, project_slug=project_slug, status=status, limit=limit, before=before, since=since, until=until)
+    quarantines = [_quarantine_payload(record) for record in records]
     return {
         "ok": True,
         "count": len(records),
-        "quarantines": [_quarantine_payload(record) for record in records],
+        "quarantines": quarantines,
+        "next_cursor": next_cursor(quarantines, "created_at", limit),
     }
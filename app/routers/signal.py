@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any, Dict, Optional, Tuple
+
 from fastapi import APIRouter, Request
 
 from app.schemas.errors import EtherErrorResponse
@@ -11,10 +13,19 @@ from app.schemas.signal import (
 )
 from app.utils.audit import audit_event
 from app.utils.control_plane import control_plane_state
-from app.utils.project_supabase_signal import build_signal_payload, record_and_verify_project_signal
-from app.utils.projects import resolve_project
+from app.utils.project_supabase_signal import (
+    ProjectSignalVerificationResult,
+    ProjectSignalWriteResult,
+    build_signal_payload,
+)
+from app.utils.projects import ProjectRecord, resolve_project
 from app.utils.request_meta import extract_request_meta
-from app.utils.signal_lane import signal_lane_registry
+from app.utils.signal_batcher import signal_batcher
+from app.utils.signal_keepalive import signal_keepalive
+from app.utils.signal_lane import SignalLaneRecord, signal_lane_registry
+from app.utils.signal_outbox import signal_outbox
+from app.utils.signal_ticket import lane_tickets
+from app.utils.signal_verifier import signal_verifier
 
 router = APIRouter(prefix="/signal", tags=["signal"])
 
@@ -27,6 +38,34 @@ def _provider_controls(project_slug: str, providers: dict[str, bool]) -> dict[st
     }
 
 
+def _issue_ticket(project: ProjectRecord, record: SignalLaneRecord) -> Optional[Tuple[str, str]]:
+    return lane_tickets.issue(
+        project,
+        lane_id=record.lane_id,
+        app_id=record.app_id,
+        instance_id=record.instance_id,
+        verification_mode=record.verification_mode,
+        proof_required=record.proof_required,
+    )
+
+
+async def _settle_heartbeat_signal(
+    project_slug: str,
+    written: Dict[str, Any],
+    write: ProjectSignalWriteResult,
+) -> ProjectSignalVerificationResult:
+    # Called by the batcher once per written lane, however many heartbeats were coalesced into it.
+    try:
+        result = await signal_verifier.verify(project_slug=project_slug, payload=written, write=write)
+    except BaseException:
+        signal_keepalive.record_write(project_slug, verification="failed")
+        raise
+    signal_keepalive.record_write(project_slug, verification=result.verification)
+    if result.ok is False:
+        await signal_outbox.capture(project_slug=project_slug, payload=written, result=result)
+    return result
+
+
 @router.post("/handshake", response_model=SignalHandshakeResponse)
 async def signal_handshake(request: Request, body: SignalHandshakeRequest):
     meta = extract_request_meta(request)
@@ -59,7 +98,7 @@ async def signal_handshake(request: Request, body: SignalHandshakeRequest):
             details={"project_slug": project.slug},
         )
 
-    record = signal_lane_registry.handshake(
+    record = await signal_lane_registry.handshake(
         project_slug=project.slug,
         app_id=body.app_id or meta.app_id,
         instance_id=body.instance_id,
@@ -84,6 +123,8 @@ async def signal_handshake(request: Request, body: SignalHandshakeRequest):
         },
     )
 
+    ticket = _issue_ticket(project, record) if record.accepted and record.verified else None
+
     resolved_by = "project_slug" if (body.project_slug or meta.project_slug) else "app_id" if (body.app_id or meta.app_id) else "domain_or_source"
     return SignalHandshakeResponse(
         ok=True,
@@ -100,6 +141,8 @@ async def signal_handshake(request: Request, body: SignalHandshakeRequest):
         control_state={"project_disabled": False},
         provider_controls=_provider_controls(project.slug, project.provider_set),
         feature_flags=project.feature_flags,
+        lane_ticket=ticket[0] if ticket else None,
+        lane_ticket_expires_at=ticket[1] if ticket else None,
     )
 
 
@@ -108,41 +151,65 @@ async def signal_heartbeat(request: Request, body: SignalHeartbeatRequest):
     meta = extract_request_meta(request)
     host = (request.headers.get("host") or "").strip() or None
 
-    project = resolve_project(
-        project_slug=body.project_slug or meta.project_slug,
-        source=meta.source,
-        app_domain=body.domain or host,
-        app_id=body.app_id or meta.app_id,
-    )
-    if project is None:
-        return EtherErrorResponse.not_found(
-            code="ETHER_PROJECT_NOT_FOUND",
-            message="Project could not be resolved for signal heartbeat.",
-            details={
-                "project_slug": body.project_slug or meta.project_slug,
-                "app_id": body.app_id or meta.app_id,
-                "domain": body.domain or host,
-                "source": meta.source,
-            },
+    # A valid lane ticket proves the lane without resolving the project or reading the lane.
+    check = lane_tickets.verify(body.lane_ticket, lane_id=body.lane_id, project_slug=body.project_slug or meta.project_slug)
+    ticket = None
+    if check.valid and check.project is not None and check.claims is not None:
+        project = check.project
+        result = await signal_lane_registry.ticket_heartbeat(
+            project_slug=project.slug,
+            lane_id=body.lane_id,
+            app_id=body.app_id or meta.app_id or check.claims.app_id,
+            instance_id=body.instance_id or check.claims.instance_id,
+            verification_mode=check.claims.verification_mode,
+            proof_required=check.claims.proof_required,
+            status=body.status,
+            client_nonce=body.client_nonce,
+            presented_proof=body.presented_proof,
+            meta=body.meta,
+        )
+        if lane_tickets.should_renew(check.claims):
+            ticket = _issue_ticket(project, result.record)
+    else:
+        resolved = resolve_project(
+            project_slug=body.project_slug or meta.project_slug,
+            source=meta.source,
+            app_domain=body.domain or host,
+            app_id=body.app_id or meta.app_id,
         )
+        if resolved is None:
+            return EtherErrorResponse.not_found(
+                code="ETHER_PROJECT_NOT_FOUND",
+                message="Project could not be resolved for signal heartbeat.",
+                details={
+                    "project_slug": body.project_slug or meta.project_slug,
+                    "app_id": body.app_id or meta.app_id,
+                    "domain": body.domain or host,
+                    "source": meta.source,
+                },
+            )
+        project = resolved
 
-    result = signal_lane_registry.heartbeat(
-        project_slug=project.slug,
-        lane_id=body.lane_id,
-        app_id=body.app_id or meta.app_id,
-        instance_id=body.instance_id,
-        status=body.status,
-        signal_secret=project.signal_secret_value,
-        client_nonce=body.client_nonce,
-        presented_proof=body.presented_proof,
-        meta=body.meta,
-    )
-    if result is None:
-        return EtherErrorResponse.bad_request(
-            code="ETHER_SIGNAL_LANE_UNKNOWN",
-            message="Signal lane could not be resolved for heartbeat.",
-            details={"project_slug": project.slug, "lane_id": body.lane_id},
+        slow_result = await signal_lane_registry.heartbeat(
+            project_slug=project.slug,
+            lane_id=body.lane_id,
+            app_id=body.app_id or meta.app_id,
+            instance_id=body.instance_id,
+            status=body.status,
+            signal_secret=project.signal_secret_value,
+            client_nonce=body.client_nonce,
+            presented_proof=body.presented_proof,
+            meta=body.meta,
         )
+        if slow_result is None:
+            return EtherErrorResponse.bad_request(
+                code="ETHER_SIGNAL_LANE_UNKNOWN",
+                message="Signal lane could not be resolved for heartbeat.",
+                details={"project_slug": project.slug, "lane_id": body.lane_id, "lane_ticket": check.status},
+            )
+        result = slow_result
+        if result.accepted and result.verified:
+            ticket = _issue_ticket(project, result.record)
 
     project_signal = {
         "ok": False,
@@ -151,7 +218,11 @@ async def signal_heartbeat(request: Request, body: SignalHeartbeatRequest):
         "error": None,
     }
 
-    if result.accepted:
+    keepalive = signal_keepalive.decide(project.slug, status_changed=result.status_changed) if result.accepted else None
+    if keepalive is not None and not keepalive.write:
+        # A write inside the project's keepalive window already proves the project active.
+        project_signal = {**project_signal, "ok": True, "mode": "suppressed", "suppressed": True, "keepalive": keepalive.to_dict()}
+    elif result.accepted:
         payload = build_signal_payload(
             project_slug=project.slug,
             lane_id=body.lane_id,
@@ -163,17 +234,33 @@ async def signal_heartbeat(request: Request, body: SignalHeartbeatRequest):
             verified=result.verified,
             meta=body.meta,
         )
-        project_signal = record_and_verify_project_signal(project_slug=project.slug, payload=payload).to_dict()
+        pending = signal_batcher.submit(project.slug, payload, settle=_settle_heartbeat_signal)
+        if body.wait_for_signal:
+            project_signal = (await pending).to_dict()
+        else:
+            project_signal = {**project_signal, "mode": "queued", "queued": True}
+        if keepalive is not None:
+            project_signal["keepalive"] = keepalive.to_dict()
 
+    if project_signal.get("suppressed"):
+        outcome = "suppressed"
+    elif project_signal.get("ok"):
+        outcome = "verified"
+    elif project_signal.get("ok") is None:
+        # Written, but the readback is deferred or was skipped.
+        outcome = "deferred"
+    else:
+        outcome = "awaiting-proof" if not result.accepted else "failed"
     audit_event(
         action="signal.heartbeat",
         project_slug=project.slug,
         actor=meta.source,
-        result="verified" if project_signal.get("ok") else "awaiting-proof" if not result.accepted else "failed",
+        result=outcome,
         details={
             "lane_id": body.lane_id,
             "verification_mode": result.verification_mode,
             "status": body.status,
+            "lane_ticket": check.status,
             "project_signal": project_signal,
         },
     )
@@ -186,12 +273,15 @@ async def signal_heartbeat(request: Request, body: SignalHeartbeatRequest):
         verified=result.verified,
         verification_mode=result.verification_mode,
         proof_required=result.proof_required,
-        keepalive_recorded=result.keepalive_recorded and bool(project_signal.get("ok")),
+        keepalive_recorded=result.keepalive_recorded and project_signal.get("ok") is not False,
         server_nonce=result.record.server_nonce,
         next_heartbeat_seconds=60,
         control_state={"project_disabled": control_plane_state.project_disabled(project.slug)},
         provider_controls=_provider_controls(project.slug, project.provider_set),
         project_signal=project_signal,
+        lane_ticket=ticket[0] if ticket else None,
+        lane_ticket_expires_at=ticket[1] if ticket else None,
+        lane_ticket_status=check.status,
     )
 
 
@@ -202,4 +292,5 @@ async def list_signal_lanes(project_slug: str | None = None, limit: int = 50):
         "ok": True,
         "count": len(lanes),
         "lanes": lanes,
+        "memory": signal_lane_registry.memory(),
     }
@@ -2,24 +2,28 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Body, Request
 
 from app.schemas.errors import EtherErrorResponse
 from app.utils.audit import audit_event
 from app.utils.control_plane import control_plane_state
+from app.utils.pagination import decode_cursor, next_cursor
 from app.utils.projects import get_project, list_projects
 from app.utils.provider_broker import provider_enabled
 from app.utils.request_meta import extract_request_meta
+from app.utils.webhook_dedupe import webhook_dedupe
 from app.utils.webhook_signature import verify_webhook_signature
 from app.utils.webhook_store import (
     canonical_payload_hash,
-    event_exists,
-    list_webhook_events,
+    find_webhook_event_async,
+    get_webhook_payload_async,
+    list_webhook_events_async,
     make_event_uid,
-    save_webhook_event,
-    webhook_snapshot,
+    payload_storage_stats_async,
+    record_webhook_event_async,
+    webhook_snapshot_async,
 )
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
@@ -132,7 +136,7 @@ def _signature_should_reject(validation: Dict[str, Any]) -> bool:
     return bool(signature.get("configured") and not signature.get("verified"))
 
 
-def _persist_webhook_attempt(
+async def _persist_webhook_attempt(
     *,
     project_slug: str,
     provider: str,
@@ -143,11 +147,11 @@ def _persist_webhook_attempt(
     duplicate: bool,
     validation: Dict[str, Any],
     notes: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> Tuple[Dict[str, Any], bool]:
     payload_hash = canonical_payload_hash(payload)
     provider_event_id = validation.get("provider_event_id")
     event_uid = make_event_uid(project_slug=project_slug, provider=provider, provider_event_id=provider_event_id, payload_hash=payload_hash)
-    return save_webhook_event(
+    stored, created = await record_webhook_event_async(
         event_uid=event_uid,
         project_slug=project_slug,
         provider=provider,
@@ -163,20 +167,54 @@ def _persist_webhook_attempt(
         received_at=_now(),
         notes=notes,
     )
+    webhook_dedupe.add(event_uid)
+    return stored, created
+
+
+def _duplicate_response(
+    *,
+    project_slug: str,
+    provider: str,
+    actor: str,
+    stored: Dict[str, Any],
+    event_uid: str,
+    validation: Dict[str, Any],
+) -> Dict[str, Any]:
+    audit_event(
+        action="webhook.ingest",
+        project_slug=project_slug,
+        actor=actor,
+        provider=provider,
+        result="duplicate_verified" if validation.get("signature_verified") else "duplicate",
+        details={"webhook_event_id": stored.get("id"), "event_uid": event_uid},
+    )
+    return {
+        "ok": True,
+        "accepted": True,
+        "duplicate": True,
+        "trusted": bool(validation.get("signature_verified")),
+        "project_slug": project_slug,
+        "provider": provider,
+        "webhook_event_id": stored.get("id"),
+        "event_uid": event_uid,
+    }
 
 
 @router.get("/status")
 async def webhook_suite_status(project_slug: Optional[str] = None):
     if project_slug:
-        return {"ok": True, "snapshot": webhook_snapshot(project_slug=project_slug.strip().lower())}
-    snapshots = {project.slug: webhook_snapshot(project_slug=project.slug) for project in list_projects()}
+        return {"ok": True, "snapshot": await webhook_snapshot_async(project_slug=project_slug.strip().lower())}
+    snapshots = {project.slug: await webhook_snapshot_async(project_slug=project.slug) for project in list_projects()}
     return {
         "ok": True,
         "projects": snapshots,
+        "payload_storage": await payload_storage_stats_async(),
+        "duplicate_filter": webhook_dedupe.stats(),
         "routes": {
             "suite_status": "/webhooks/status",
             "project_status": "/webhooks/status?project_slug=circa_haus",
             "recent_events": "/webhooks/events",
+            "event_payload": "/webhooks/payloads/{payload_hash}",
             "provider_project_ingest": "/webhooks/{provider}/{project_slug}",
         },
     }
@@ -188,15 +226,45 @@ async def webhook_events(
     provider: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = 50,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    include_payload: bool = False,
 ):
-    events = list_webhook_events(project_slug=project_slug, provider=provider, status=status, limit=limit)
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as exc:
+        return EtherErrorResponse.bad_request(code="ETHER_INVALID_CURSOR", message=str(exc))
+    events = await list_webhook_events_async(
+        project_slug=project_slug,
+        provider=provider,
+        status=status,
+        limit=limit,
+        before=before,
+        since=since,
+        until=until,
+        include_payload=include_payload,
+    )
     return {
         "ok": True,
         "count": len(events),
         "events": events,
+        "next_cursor": next_cursor(events, "received_at", limit),
     }
 
 
+@router.get("/payloads/{payload_hash}")
+async def webhook_payload(payload_hash: str):
+    payload = await get_webhook_payload_async(payload_hash.strip().lower())
+    if payload is None:
+        return EtherErrorResponse.not_found(
+            code="ETHER_WEBHOOK_PAYLOAD_NOT_FOUND",
+            message="No stored webhook payload matches this hash.",
+            details={"payload_hash": payload_hash},
+        )
+    return {"ok": True, "payload_hash": payload_hash.strip().lower(), "payload": payload}
+
+
 @router.post("/{provider}/{project_slug}")
 async def ingest_webhook(
     provider: str,
@@ -225,7 +293,7 @@ async def ingest_webhook(
 
     project = get_project(normalized_project_slug)
     if project is None:
-        stored = _persist_webhook_attempt(
+        stored, _ = await _persist_webhook_attempt(
             project_slug=normalized_project_slug,
             provider=normalized_provider,
             request=request,
@@ -251,7 +319,7 @@ async def ingest_webhook(
         )
 
     if _signature_should_reject(validation):
-        stored = _persist_webhook_attempt(
+        stored, _ = await _persist_webhook_attempt(
             project_slug=project.slug,
             provider=normalized_provider,
             request=request,
@@ -276,133 +344,92 @@ async def ingest_webhook(
             details={"project_slug": project.slug, "provider": normalized_provider, "webhook_event_id": stored.get("id")},
         )
 
-    if event_exists(event_uid):
-        stored = _persist_webhook_attempt(
-            project_slug=project.slug,
-            provider=normalized_provider,
-            request=request,
-            payload=payload,
-            status="duplicate_verified" if validation.get("signature_verified") else "duplicate",
-            accepted=True,
-            duplicate=True,
-            validation=validation,
-            notes="Duplicate provider event detected and idempotently accepted.",
-        )
-        audit_event(
-            action="webhook.ingest",
-            project_slug=project.slug,
-            actor=meta.source,
-            provider=normalized_provider,
-            result="duplicate_verified" if validation.get("signature_verified") else "duplicate",
-            details={"webhook_event_id": stored.get("id"), "event_uid": event_uid},
-        )
-        return {
-            "ok": True,
-            "accepted": True,
-            "duplicate": True,
-            "trusted": bool(validation.get("signature_verified")),
-            "project_slug": project.slug,
-            "provider": normalized_provider,
-            "webhook_event_id": stored.get("id"),
-            "event_uid": event_uid,
+    # Retries of stored events are answered from a read-only lookup; uids the filter
+    # has never seen skip it and go straight to the idempotent insert.
+    if webhook_dedupe.might_contain(event_uid):
+        existing = await find_webhook_event_async(event_uid)
+        webhook_dedupe.record_confirmation(existing is not None)
+        if existing is not None:
+            return _duplicate_response(
+                project_slug=project.slug,
+                provider=normalized_provider,
+                actor=meta.source,
+                stored=existing,
+                event_uid=event_uid,
+                validation=validation,
+            )
+
+    # Control-state rejections are recorded like acceptances: the insert below both
+    # stores the attempt and decides whether this event_uid was already seen.
+    rejection: Optional[Dict[str, str]] = None
+    if control_plane_state.project_disabled(project.slug):
+        rejection = {
+            "status": "project_disabled",
+            "notes": "Project is disabled by Ether control plane.",
+            "code": "ETHER_PROJECT_DISABLED",
+            "message": "Project is currently disabled by Ether control state.",
+        }
+    elif control_plane_state.provider_disabled(project.slug, normalized_provider):
+        rejection = {
+            "status": "provider_disabled_by_control",
+            "notes": "Provider is disabled by Ether control plane.",
+            "code": "ETHER_PROVIDER_DISABLED_BY_CONTROL",
+            "message": "Provider is currently disabled by Ether control state.",
+        }
+    elif not provider_enabled(project.slug, normalized_provider):
+        rejection = {
+            "status": "provider_not_enabled",
+            "notes": "Provider is not enabled for this project registry.",
+            "code": "ETHER_PROVIDER_DISABLED",
+            "message": "Provider is not enabled for this project.",
         }
 
-    if control_plane_state.project_disabled(project.slug):
-        stored = _persist_webhook_attempt(
-            project_slug=project.slug,
-            provider=normalized_provider,
-            request=request,
-            payload=payload,
-            status="project_disabled",
-            accepted=False,
-            duplicate=False,
-            validation=validation,
-            notes="Project is disabled by Ether control plane.",
-        )
-        audit_event(
-            action="webhook.ingest",
-            project_slug=project.slug,
-            actor=meta.source,
-            provider=normalized_provider,
-            result="project_disabled",
-            details={"webhook_event_id": stored.get("id"), "event_uid": event_uid},
-        )
-        return EtherErrorResponse.forbidden(
-            code="ETHER_PROJECT_DISABLED",
-            message="Project is currently disabled by Ether control state.",
-            details={"project_slug": project.slug, "provider": normalized_provider, "webhook_event_id": stored.get("id")},
-        )
+    configured_route = project.webhook_routes.get(normalized_provider)
+    if rejection is not None:
+        status = rejection["status"]
+    elif validation.get("signature_verified"):
+        status = "accepted_verified"
+    elif validation.get("warnings"):
+        status = "accepted_with_warnings"
+    else:
+        status = "accepted"
+    stored, created = await _persist_webhook_attempt(
+        project_slug=project.slug,
+        provider=normalized_provider,
+        request=request,
+        payload=payload,
+        status=status,
+        accepted=rejection is None,
+        duplicate=False,
+        validation=validation,
+        notes=rejection["notes"] if rejection is not None else "Webhook accepted into Ether provider operations store.",
+    )
 
-    if control_plane_state.provider_disabled(project.slug, normalized_provider):
-        stored = _persist_webhook_attempt(
+    if not created:
+        return _duplicate_response(
             project_slug=project.slug,
             provider=normalized_provider,
-            request=request,
-            payload=payload,
-            status="provider_disabled_by_control",
-            accepted=False,
-            duplicate=False,
-            validation=validation,
-            notes="Provider is disabled by Ether control plane.",
-        )
-        audit_event(
-            action="webhook.ingest",
-            project_slug=project.slug,
             actor=meta.source,
-            provider=normalized_provider,
-            result="provider_disabled_by_control",
-            details={"webhook_event_id": stored.get("id"), "event_uid": event_uid},
-        )
-        return EtherErrorResponse.forbidden(
-            code="ETHER_PROVIDER_DISABLED_BY_CONTROL",
-            message="Provider is currently disabled by Ether control state.",
-            details={"project_slug": project.slug, "provider": normalized_provider, "webhook_event_id": stored.get("id")},
-        )
-
-    if not provider_enabled(project.slug, normalized_provider):
-        stored = _persist_webhook_attempt(
-            project_slug=project.slug,
-            provider=normalized_provider,
-            request=request,
-            payload=payload,
-            status="provider_not_enabled",
-            accepted=False,
-            duplicate=False,
+            stored=stored,
+            event_uid=event_uid,
             validation=validation,
-            notes="Provider is not enabled for this project registry.",
         )
+
+    if rejection is not None:
         audit_event(
             action="webhook.ingest",
             project_slug=project.slug,
             actor=meta.source,
             provider=normalized_provider,
-            result="provider_not_enabled",
+            result=status,
             details={"webhook_event_id": stored.get("id"), "event_uid": event_uid},
         )
         return EtherErrorResponse.forbidden(
-            code="ETHER_PROVIDER_DISABLED",
-            message="Provider is not enabled for this project.",
+            code=rejection["code"],
+            message=rejection["message"],
             details={"project_slug": project.slug, "provider": normalized_provider, "webhook_event_id": stored.get("id")},
         )
 
-    configured_route = project.webhook_routes.get(normalized_provider)
-    if validation.get("signature_verified"):
-        status = "accepted_verified"
-    elif validation.get("warnings"):
-        status = "accepted_with_warnings"
-    else:
-        status = "accepted"
-    stored = _persist_webhook_attempt(
-        project_slug=project.slug,
-        provider=normalized_provider,
-        request=request,
-        payload=payload,
-        status=status,
-        accepted=True,
-        duplicate=False,
-        validation=validation,
-        notes="Webhook accepted into Ether provider operations store.",
-    )
     audit_event(
         action="webhook.ingest",
         project_slug=project.slug,
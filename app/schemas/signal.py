@@ -32,6 +32,8 @@ class SignalHandshakeResponse(BaseModel):
     control_state: Dict[str, bool]
     provider_controls: Dict[str, bool]
     feature_flags: Dict[str, bool]
+    lane_ticket: Optional[str] = None
+    lane_ticket_expires_at: Optional[str] = None
 
 
 class SignalHeartbeatRequest(BaseModel):
@@ -43,7 +45,9 @@ class SignalHeartbeatRequest(BaseModel):
     status: str = "ok"
     client_nonce: Optional[str] = None
     presented_proof: Optional[str] = None
+    lane_ticket: Optional[str] = None
     meta: Dict[str, Any] = Field(default_factory=dict)
+    wait_for_signal: bool = True
 
 
 class SignalHeartbeatResponse(BaseModel):
@@ -60,3 +64,6 @@ class SignalHeartbeatResponse(BaseModel):
     control_state: Dict[str, bool]
     provider_controls: Dict[str, bool]
     project_signal: Dict[str, Any] = Field(default_factory=dict)
+    lane_ticket: Optional[str] = None
+    lane_ticket_expires_at: Optional[str] = None
+    lane_ticket_status: str = "absent"
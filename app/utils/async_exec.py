@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+log = logging.getLogger("ether_v2.async_exec")
+
+T = TypeVar("T")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+class BlockingExecutor:
+    """
+    Named, sized thread pool for blocking work called from ``async def`` routes.
+
+    ``store`` runs SQLite/psycopg store calls; ``outbound`` runs synchronous SDK
+    calls (supabase-py auth and legacy clients). Keeping them apart means a slow
+    provider cannot occupy the threads local store reads need, and neither shares
+    the default loop executor that FastAPI uses for sync dependencies.
+    """
+
+    def __init__(self, name: str, env_key: str, default_workers: int) -> None:
+        self.name = name
+        self._env_key = env_key
+        self._default_workers = default_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "active": 0,
+            "max_active": 0,
+            "queue_wait_total_ms": 0.0,
+            "queue_wait_max_ms": 0.0,
+            "run_total_ms": 0.0,
+        }
+
+    @property
+    def workers(self) -> int:
+        return max(1, _int_env(self._env_key, self._default_workers))
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is not None:
+            return self._executor
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"ether-{self.name}")
+            return self._executor
+
+    def _call(self, submitted: float, context: contextvars.Context, fn: Callable[..., T], args: Any, kwargs: Any) -> T:
+        started = time.perf_counter()
+        waited_ms = (started - submitted) * 1000.0
+        with self._lock:
+            self._stats["active"] += 1
+            self._stats["max_active"] = max(self._stats["max_active"], self._stats["active"])
+            self._stats["queue_wait_total_ms"] += waited_ms
+            self._stats["queue_wait_max_ms"] = max(self._stats["queue_wait_max_ms"], waited_ms)
+        ok = False
+        try:
+            result = context.run(fn, *args, **kwargs)
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self._stats["active"] -= 1
+                self._stats["completed" if ok else "failed"] += 1
+                self._stats["run_total_ms"] += (time.perf_counter() - started) * 1000.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._stats["submitted"] += 1
+        call = functools.partial(self._call, time.perf_counter(), contextvars.copy_context(), fn, args, kwargs)
+        return await loop.run_in_executor(self._pool(), call)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        finished = int(stats["completed"]) + int(stats["failed"])
+        return {
+            "workers": self.workers,
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()},
+            "queued": max(0, int(stats["submitted"]) - finished - int(stats["active"])),
+            "queue_wait_avg_ms": round(float(stats["queue_wait_total_ms"]) / finished, 3) if finished else 0.0,
+            "run_avg_ms": round(float(stats["run_total_ms"]) / finished, 3) if finished else 0.0,
+        }
+
+
+store_executor = BlockingExecutor("store", "ETHER_STORE_EXECUTOR_WORKERS", 8)
+outbound_executor = BlockingExecutor("outbound", "ETHER_OUTBOUND_EXECUTOR_WORKERS", 16)
+
+
+async def run_store(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    return await store_executor.run(fn, *args, **kwargs)
+
+
+async def run_outbound(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    return await outbound_executor.run(fn, *args, **kwargs)
+
+
+def store_async(fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Async variant of a blocking store function, run on the store executor."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await store_executor.run(fn, *args, **kwargs)
+
+    return wrapper
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag: a task sleeps ``interval`` and records how late it
+    wakes up. Lag above ``ETHER_LOOP_LAG_THRESHOLD_MS`` means something ran on the
+    loop without yielding (blocking I/O or heavy CPU) and is logged and kept in a
+    short stall history.
+    """
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task[None]] = None
+        self._lock = threading.Lock()
+        self._stalls: Deque[Dict[str, Any]] = deque(maxlen=50)
+        self._stats: Dict[str, Any] = {"samples": 0, "stalls": 0, "lag_max_ms": 0.0, "lag_last_ms": 0.0, "lag_total_ms": 0.0}
+
+    @property
+    def interval_ms(self) -> int:
+        return max(10, _int_env("ETHER_LOOP_LAG_INTERVAL_MS", 250))
+
+    @property
+    def threshold_ms(self) -> int:
+        return max(1, _int_env("ETHER_LOOP_LAG_THRESHOLD_MS", 100))
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="ether-loop-lag")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            interval = self.interval_ms / 1000.0
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.record(max(0.0, (loop.time() - expected) * 1000.0))
+
+    def record(self, lag_ms: float) -> None:
+        with self._lock:
+            self._stats["samples"] += 1
+            self._stats["lag_last_ms"] = lag_ms
+            self._stats["lag_total_ms"] += lag_ms
+            self._stats["lag_max_ms"] = max(self._stats["lag_max_ms"], lag_ms)
+            if lag_ms < self.threshold_ms:
+                return
+            self._stats["stalls"] += 1
+            self._stalls.append({"at": time.time(), "lag_ms": round(lag_ms, 1)})
+        log.warning("ether_event_loop_stall_ms=%.1f", lag_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stalls = list(self._stalls)
+        samples = int(stats["samples"])
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_ms": self.interval_ms,
+            "threshold_ms": self.threshold_ms,
+            "samples": samples,
+            "stalls": stats["stalls"],
+            "lag_last_ms": round(stats["lag_last_ms"], 3),
+            "lag_max_ms": round(stats["lag_max_ms"], 3),
+            "lag_avg_ms": round(stats["lag_total_ms"] / samples, 3) if samples else 0.0,
+            "recent_stalls": stalls[-10:],
+        }
+
+
+loop_lag_monitor = LoopLagMonitor()
+
+
+def async_status() -> Dict[str, Any]:
+    return {
+        "executors": {executor.name: executor.stats() for executor in (store_executor, outbound_executor)},
+        "event_loop": loop_lag_monitor.stats(),
+    }
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import logging
+import os
 from collections import deque
 from datetime import datetime, timezone
 from threading import Lock
 from typing import Any, Dict, List, Optional
 
+from app.utils.audit_sink import audit_sink
 from app.utils.audit_store import (
     init_audit_store,
     list_persistent_audit_events,
-    persist_audit_event,
     persistent_audit_snapshot,
 )
+from app.utils.pagination import Keyset
+from app.utils.storage_backend import get_storage_backend
 
 log = logging.getLogger("ether_v2.audit")
 
@@ -40,25 +43,43 @@ def audit_event(
     with _recent_events_lock:
         _recent_events.appendleft(event)
     try:
-        persist_audit_event(event)
+        audit_sink.submit(event)
     except Exception as exc:
         log.warning("ether_audit_persist_failed=%s", exc)
     log.info("ether_audit_event=%s", event)
     return event
 
 
+def _write_behind_enabled() -> bool:
+    return os.getenv("ETHER_AUDIT_WRITE_BEHIND", "true").strip().lower() == "true"
+
+
 def initialize_audit() -> None:
     try:
         init_audit_store()
+        if _write_behind_enabled():
+            audit_sink.start()
         audit_event(
             action="audit.initialize",
             result="ok",
-            details={"storage": "sqlite", "mode": "persistent-plus-memory"},
+            details={
+                "storage": get_storage_backend().name,
+                "mode": "persistent-plus-memory",
+                "write_behind": audit_sink.running,
+                "overflow_policy": audit_sink.overflow,
+            },
         )
     except Exception as exc:
         log.warning("ether_audit_initialize_failed=%s", exc)
 
 
+def shutdown_audit() -> None:
+    try:
+        audit_sink.stop()
+    except Exception as exc:
+        log.warning("ether_audit_shutdown_flush_failed=%s", exc)
+
+
 def list_recent_audit_events(
     *,
     limit: int = 50,
@@ -66,10 +87,21 @@ def list_recent_audit_events(
     action: Optional[str] = None,
     result: Optional[str] = None,
     include_persistent: bool = True,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     if include_persistent:
         try:
-            return list_persistent_audit_events(limit=limit, project_slug=project_slug, action=action, result=result)
+            return list_persistent_audit_events(
+                limit=limit,
+                project_slug=project_slug,
+                action=action,
+                result=result,
+                before=before,
+                since=since,
+                until=until,
+            )
         except Exception as exc:
             log.warning("ether_audit_persistent_read_failed=%s", exc)
 
@@ -89,6 +121,13 @@ def list_recent_audit_events(
             continue
         if result_filter and (event.get("result") or "").strip().lower() != result_filter:
             continue
+        ts = str(event.get("ts") or "")
+        if since and ts < since.strip():
+            continue
+        if until and ts > until.strip():
+            continue
+        if before is not None and ts >= before[0]:
+            continue
         filtered.append(event)
         if len(filtered) >= safe_limit:
             break
@@ -100,7 +139,11 @@ def audit_snapshot(limit: int = 25, include_persistent: bool = True) -> Dict[str
         try:
             snapshot = persistent_audit_snapshot(limit=limit)
             snapshot["fallback_memory_recent_count"] = len(_recent_events)
-            snapshot["retention"] = "persistent sqlite audit store plus in-memory recent buffer; move to managed Postgres/Supabase audit table when production scale requires it"
+            snapshot["sink"] = audit_sink.stats()
+            snapshot["retention"] = (
+                f"persistent {snapshot['storage']} audit store plus in-memory recent buffer; "
+                "set ETHER_STORAGE_BACKEND=postgres to share the audit trail across instances"
+            )
             return snapshot
         except Exception as exc:
             log.warning("ether_audit_persistent_snapshot_failed=%s", exc)
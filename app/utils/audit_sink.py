@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from app.utils.audit_store import persist_audit_event, persist_audit_events
+
+log = logging.getLogger("ether_v2.audit_sink")
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _overflow_policy() -> str:
+    value = os.getenv("ETHER_AUDIT_OVERFLOW", "spill").strip().lower() or "spill"
+    return value if value in OVERFLOW_POLICIES else "spill"
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _spill_path() -> Path:
+    raw = os.getenv("ETHER_AUDIT_SPILL_PATH", "").strip() or "runtime/ether_audit_spill.ndjson"
+    return Path(raw)
+
+
+class AuditSink:
+    """
+    Write-behind audit persistence.
+
+    ``submit`` places events on a bounded in-memory queue; a background writer
+    drains it and commits batches with ``executemany`` every ``batch_size`` events
+    or ``flush_ms`` milliseconds, whichever comes first. When the queue is full the
+    overflow policy decides between blocking the caller, dropping the oldest queued
+    event, or spilling to an NDJSON file that the writer re-ingests once it catches
+    up. The event loop is never blocked: under ``block`` a caller on the loop spills
+    instead. ``stop`` flushes everything still queued or spilled.
+    """
+
+    def __init__(self) -> None:
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._spill_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._configure()
+        self._stats: Dict[str, Any] = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "spill_recovered": 0,
+            "blocked": 0,
+            "overflow_sync_writes": 0,
+            "write_failures": 0,
+            "max_queue_depth": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+            "last_flush_at": None,
+        }
+
+    def _configure(self) -> None:
+        self.max_queue = max(1, _int_env("ETHER_AUDIT_QUEUE_MAX", 10000))
+        self.batch_size = max(1, _int_env("ETHER_AUDIT_BATCH_SIZE", 200))
+        self.flush_ms = max(1, _int_env("ETHER_AUDIT_FLUSH_MS", 250))
+        self.block_timeout_ms = max(0, _int_env("ETHER_AUDIT_BLOCK_TIMEOUT_MS", 1000))
+        self.overflow = _overflow_policy()
+        self.spill_path = _spill_path()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._configure()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="ether-audit-sink", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        thread.join(timeout=timeout)
+        self._thread = None
+        # Anything the writer could not reach before the deadline is written inline.
+        remaining = self._take(len(self._queue))
+        if remaining:
+            self._write(remaining)
+        self._recover_spill()
+
+    def submit(self, event: Dict[str, Any]) -> None:
+        if not self.running:
+            persist_audit_event(event)
+            return
+        with self._cond:
+            if len(self._queue) >= self.max_queue and not self._make_room():
+                overflow_event = event
+            else:
+                overflow_event = None
+                self._queue.append(event)
+                self._stats["enqueued"] += 1
+                depth = len(self._queue)
+                if depth > self._stats["max_queue_depth"]:
+                    self._stats["max_queue_depth"] = depth
+                if depth >= self.batch_size:
+                    self._cond.notify_all()
+        if overflow_event is not None:
+            self._overflow(overflow_event)
+
+    def _make_room(self) -> bool:
+        # Called with the condition held. Returns True when the event may be queued.
+        if self.overflow == "drop_oldest":
+            self._queue.popleft()
+            self._stats["dropped"] += 1
+            return True
+        if self.overflow == "block" and not _on_event_loop():
+            self._stats["blocked"] += 1
+            self._cond.notify_all()
+            deadline = time.monotonic() + self.block_timeout_ms / 1000.0
+            while len(self._queue) >= self.max_queue and self.running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return len(self._queue) < self.max_queue
+        return False
+
+    def _overflow(self, event: Dict[str, Any]) -> None:
+        if self.overflow == "spill" or (self.overflow == "block" and _on_event_loop()):
+            try:
+                self._spill([event])
+                return
+            except Exception as exc:
+                log.warning("ether_audit_spill_failed=%s", exc)
+        # Block timeout or spill failure: keep the event by writing it on the caller.
+        self._stats["overflow_sync_writes"] += 1
+        persist_audit_event(event)
+
+    def _spill(self, events: List[Dict[str, Any]]) -> None:
+        with self._spill_lock:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.spill_path.open("a", encoding="utf-8") as handle:
+                for event in events:
+                    handle.write(json.dumps(event, sort_keys=True, default=str) + "\n")
+        self._stats["spilled"] += len(events)
+
+    @property
+    def _draining_path(self) -> Path:
+        return self.spill_path.with_suffix(self.spill_path.suffix + ".draining")
+
+    def _spill_pending(self) -> bool:
+        return self.spill_path.exists() or self._draining_path.exists()
+
+    def _recover_spill(self) -> None:
+        draining = self._draining_path
+        with self._spill_lock:
+            # A draining file left by a failed or interrupted recovery is finished first.
+            if not draining.exists():
+                if not self.spill_path.exists() or self.spill_path.stat().st_size == 0:
+                    return
+                self.spill_path.replace(draining)
+        events: List[Dict[str, Any]] = []
+        with draining.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    log.warning("ether_audit_spill_line_unreadable")
+        for start in range(0, len(events), self.batch_size):
+            if not self._write(events[start : start + self.batch_size], spill_on_failure=False):
+                # Keep what has not been persisted for the next attempt.
+                self._stats["spill_recovered"] += start
+                remainder = draining.with_suffix(draining.suffix + ".tmp")
+                with remainder.open("w", encoding="utf-8") as handle:
+                    for event in events[start:]:
+                        handle.write(json.dumps(event, sort_keys=True, default=str) + "\n")
+                remainder.replace(draining)
+                return
+        self._stats["spill_recovered"] += len(events)
+        draining.unlink(missing_ok=True)
+
+    def _take(self, count: int) -> List[Dict[str, Any]]:
+        with self._cond:
+            batch = [self._queue.popleft() for _ in range(min(count, len(self._queue)))]
+            self._cond.notify_all()
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]], *, spill_on_failure: bool = True) -> bool:
+        started = time.perf_counter()
+        try:
+            persist_audit_events(batch)
+        except Exception as exc:
+            self._stats["write_failures"] += 1
+            log.warning("ether_audit_batch_persist_failed=%s size=%s", exc, len(batch))
+            if spill_on_failure:
+                try:
+                    self._spill(batch)
+                except Exception as spill_exc:
+                    log.warning("ether_audit_spill_failed=%s", spill_exc)
+            return False
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        size = len(batch)
+        self._stats["written"] += size
+        self._stats["batches"] += 1
+        self._stats["last_batch_size"] = size
+        self._stats["max_batch_size"] = max(self._stats["max_batch_size"], size)
+        self._stats["last_flush_ms"] = elapsed_ms
+        self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], elapsed_ms)
+        self._stats["total_flush_ms"] += elapsed_ms
+        self._stats["last_flush_at"] = time.time()
+        return True
+
+    def _run(self) -> None:
+        flush_s = self.flush_ms / 1000.0
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait(flush_s)
+                    if not self._queue and self._spill_pending():
+                        break
+                deadline = time.monotonic() + flush_s
+                while len(self._queue) < self.batch_size and not self._stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                stopping = self._stopping
+            batch = self._take(self.batch_size)
+            if batch:
+                self._write(batch)
+            elif self._spill_pending():
+                try:
+                    self._recover_spill()
+                except Exception as exc:
+                    log.warning("ether_audit_spill_recover_failed=%s", exc)
+            if stopping and not self._queue:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            depth = len(self._queue)
+        stats = dict(self._stats)
+        batches = int(stats["batches"]) or 0
+        return {
+            "running": self.running,
+            "mode": "write-behind" if self.running else "synchronous",
+            "overflow_policy": self.overflow,
+            "max_queue": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_ms": self.flush_ms,
+            "queue_depth": depth,
+            "spill_pending": self._spill_pending(),
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()},
+            "avg_batch_size": round(int(stats["written"]) / batches, 2) if batches else 0.0,
+            "avg_flush_ms": round(float(stats["total_flush_ms"]) / batches, 3) if batches else 0.0,
+        }
+
+
+audit_sink = AuditSink()
@@ -3,32 +3,29 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
-from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Sequence
+
+from app.utils.pagination import Keyset, keyset_clauses, page_limit
+from app.utils.sqlite_pool import resolve_db_path
+from app.utils.sqlite_schema import Migration, schema_registry
+from app.utils.storage_backend import get_storage_backend
+from app.utils.store_counters import counter_statements, read_counters
 
 
 def _db_path() -> Path:
-    raw = os.getenv("ETHER_AUDIT_DB_PATH", "runtime/ether_audit.sqlite3").strip() or "runtime/ether_audit.sqlite3"
-    path = Path(raw)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return path
+    return resolve_db_path()
 
 
-@contextmanager
-def _connect() -> Iterator[sqlite3.Connection]:
-    conn = sqlite3.connect(_db_path())
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+def _connect(*, write: bool = False) -> ContextManager[Any]:
+    return get_storage_backend().connection(_db_path(), write=write)
 
 
-def init_audit_store() -> None:
-    with _connect() as conn:
-        conn.execute(
+AUDIT_MIGRATIONS = (
+    Migration(
+        version=1,
+        name="baseline",
+        statements=(
             """
             create table if not exists audit_events (
               id integer primary key autoincrement,
@@ -40,33 +37,111 @@ def init_audit_store() -> None:
               result text not null,
               details_json text not null default '{}'
             )
+            """,
+            "create index if not exists audit_events_ts_idx on audit_events (ts desc)",
+            "create index if not exists audit_events_project_idx on audit_events (project_slug, ts desc)",
+            "create index if not exists audit_events_action_idx on audit_events (action, ts desc)",
+            "create index if not exists audit_events_result_idx on audit_events (result, ts desc)",
+        ),
+    ),
+    Migration(
+        version=2,
+        name="audit_counters",
+        statements=counter_statements(
+            table="audit_events",
+            counter_table="audit_counters",
+            ts_column="ts",
+            project="coalesce({row}.project_slug, 'suite')",
+            dimensions={"action": "{row}.action", "result": "{row}.result"},
+        ),
+    ),
+    Migration(
+        version=3,
+        name="normalized_filter_keys",
+        statements=(
+            "alter table audit_events add column project_key text",
+            "alter table audit_events add column action_key text",
+            "alter table audit_events add column result_key text",
             """
-        )
-        conn.execute("create index if not exists audit_events_ts_idx on audit_events (ts desc)")
-        conn.execute("create index if not exists audit_events_project_idx on audit_events (project_slug, ts desc)")
-        conn.execute("create index if not exists audit_events_action_idx on audit_events (action, ts desc)")
-        conn.execute("create index if not exists audit_events_result_idx on audit_events (result, ts desc)")
+            update audit_events set
+              project_key = lower(trim(project_slug)),
+              action_key = lower(trim(action)),
+              result_key = lower(trim(result))
+            """,
+            "drop index if exists audit_events_project_idx",
+            "drop index if exists audit_events_action_idx",
+            "drop index if exists audit_events_result_idx",
+            "create index if not exists audit_events_project_key_idx on audit_events (project_key, ts desc)",
+            "create index if not exists audit_events_action_key_idx on audit_events (action_key, ts desc)",
+            "create index if not exists audit_events_result_key_idx on audit_events (result_key, ts desc)",
+            "create index if not exists audit_events_project_action_key_idx on audit_events (project_key, action_key, ts desc)",
+        ),
+    ),
+)
 
+schema_registry.register("audit", _db_path, AUDIT_MIGRATIONS)
 
-def persist_audit_event(event: Dict[str, Any]) -> None:
-    init_audit_store()
+
+def init_audit_store() -> None:
+    schema_registry.ensure("audit")
+
+
+_AUDIT_COLUMNS = (
+    "ts",
+    "action",
+    "project_slug",
+    "actor",
+    "provider",
+    "result",
+    "details_json",
+    "project_key",
+    "action_key",
+    "result_key",
+)
+
+_INSERT_AUDIT_EVENT = f"""
+    insert into audit_events ({", ".join(_AUDIT_COLUMNS)})
+    values ({", ".join("?" for _ in _AUDIT_COLUMNS)})
+"""
+
+
+def _filter_key(value: Optional[str]) -> Optional[str]:
+    # Filter columns are stored lowercased so lookups are plain equality on an index.
+    return value.strip().lower() if value else None
+
+
+def _event_params(event: Dict[str, Any]) -> tuple:
     details = event.get("details") if isinstance(event.get("details"), dict) else {}
-    with _connect() as conn:
-        conn.execute(
-            """
-            insert into audit_events (ts, action, project_slug, actor, provider, result, details_json)
-            values (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event.get("ts") or "",
-                event.get("action") or "unknown",
-                event.get("project_slug"),
-                event.get("actor"),
-                event.get("provider"),
-                event.get("result") or "unknown",
-                json.dumps(details, sort_keys=True),
-            ),
-        )
+    action = event.get("action") or "unknown"
+    result = event.get("result") or "unknown"
+    return (
+        event.get("ts") or "",
+        action,
+        event.get("project_slug"),
+        event.get("actor"),
+        event.get("provider"),
+        result,
+        json.dumps(details, sort_keys=True),
+        _filter_key(event.get("project_slug")),
+        _filter_key(action),
+        _filter_key(result),
+    )
+
+
+def persist_audit_event(event: Dict[str, Any]) -> None:
+    schema_registry.ensure("audit")
+    with _connect(write=True) as conn:
+        conn.execute(_INSERT_AUDIT_EVENT, _event_params(event))
+
+
+def persist_audit_events(events: Sequence[Dict[str, Any]]) -> int:
+    if not events:
+        return 0
+    schema_registry.ensure("audit")
+    rows = [_event_params(event) for event in events]
+    backend = get_storage_backend()
+    with backend.connection(_db_path(), write=True) as conn:
+        return backend.bulk_insert(conn, "audit_events", _AUDIT_COLUMNS, rows)
 
 
 def _row_to_event(row: sqlite3.Row) -> Dict[str, Any]:
@@ -92,22 +167,28 @@ def list_persistent_audit_events(
     project_slug: Optional[str] = None,
     action: Optional[str] = None,
     result: Optional[str] = None,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    init_audit_store()
+    schema_registry.ensure("audit")
     clauses: list[str] = []
     params: list[Any] = []
     if project_slug:
-        clauses.append("lower(project_slug) = lower(?)")
-        params.append(project_slug.strip())
+        clauses.append("project_key = ?")
+        params.append(_filter_key(project_slug))
     if action:
-        clauses.append("lower(action) = lower(?)")
-        params.append(action.strip())
+        clauses.append("action_key = ?")
+        params.append(_filter_key(action))
     if result:
-        clauses.append("lower(result) = lower(?)")
-        params.append(result.strip())
+        clauses.append("result_key = ?")
+        params.append(_filter_key(result))
 
+    keyset, keyset_params = keyset_clauses("ts", before=before, since=since, until=until)
+    clauses.extend(keyset)
+    params.extend(keyset_params)
     where = f"where {' and '.join(clauses)}" if clauses else ""
-    safe_limit = max(1, min(limit, 500))
+    safe_limit = page_limit(limit)
     query = f"select * from audit_events {where} order by ts desc, id desc limit ?"
     params.append(safe_limit)
     with _connect() as conn:
@@ -117,22 +198,22 @@ def list_persistent_audit_events(
 
 def persistent_audit_snapshot(limit: int = 100) -> Dict[str, Any]:
     events = list_persistent_audit_events(limit=limit)
-    action_counts: Dict[str, int] = {}
-    project_counts: Dict[str, int] = {}
-    result_counts: Dict[str, int] = {}
-    for event in events:
-        action_key = event.get("action") or "unknown"
-        project_key = event.get("project_slug") or "suite"
-        result_key = event.get("result") or "unknown"
-        action_counts[action_key] = action_counts.get(action_key, 0) + 1
-        project_counts[project_key] = project_counts.get(project_key, 0) + 1
-        result_counts[result_key] = result_counts.get(result_key, 0) + 1
+    with _connect() as conn:
+        counters = read_counters(conn, "audit_counters")
+    window = counters["window"]
     return {
-        "storage": "sqlite",
+        "storage": get_storage_backend().name,
         "db_path_configured": bool(os.getenv("ETHER_AUDIT_DB_PATH", "").strip()),
         "included_events": len(events),
-        "action_counts": action_counts,
-        "project_counts": project_counts,
-        "result_counts": result_counts,
+        "event_count": counters["total"],
+        "action_counts": counters["lifetime"].get("action", {}),
+        "project_counts": counters["projects"],
+        "result_counts": counters["lifetime"].get("result", {}),
+        "window": {
+            "days": counters["window_days"],
+            "event_count": counters["window_total"],
+            "action_counts": window.get("action", {}),
+            "result_counts": window.get("result", {}),
+        },
         "recent_events": events,
     }
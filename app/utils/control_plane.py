@@ -14,6 +14,7 @@ from app.utils.control_store import (
     save_project_control,
     save_provider_control,
 )
+from app.utils.pagination import Keyset
 
 log = logging.getLogger("ether_v2.control_plane")
 
@@ -263,9 +264,20 @@ class ControlPlaneState:
         provider: Optional[str] = None,
         incident_id: Optional[str] = None,
         limit: int = 100,
+        before: Optional[Keyset] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         try:
-            return list_control_events(project_slug=project_slug, provider=provider, incident_id=incident_id, limit=limit)
+            return list_control_events(
+                project_slug=project_slug,
+                provider=provider,
+                incident_id=incident_id,
+                limit=limit,
+                before=before,
+                since=since,
+                until=until,
+            )
         except Exception as exc:
             log.warning("ether_control_plane_events_read_failed=%s", exc)
             return []
@@ -1,34 +1,29 @@
 from __future__ import annotations
 
 import json
-import os
 import sqlite3
-from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional
+
+from app.utils.pagination import Keyset, keyset_clauses, page_limit
+from app.utils.sqlite_pool import resolve_db_path
+from app.utils.sqlite_schema import Migration, schema_registry
+from app.utils.storage_backend import get_storage_backend
 
 
 def _db_path() -> Path:
-    raw = os.getenv("ETHER_CONTROL_DB_PATH", os.getenv("ETHER_AUDIT_DB_PATH", "runtime/ether_audit.sqlite3")).strip() or "runtime/ether_audit.sqlite3"
-    path = Path(raw)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return path
+    return resolve_db_path("ETHER_CONTROL_DB_PATH")
 
 
-@contextmanager
-def _connect() -> Iterator[sqlite3.Connection]:
-    conn = sqlite3.connect(_db_path())
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+def _connect(*, write: bool = False) -> ContextManager[Any]:
+    return get_storage_backend().connection(_db_path(), write=write)
 
 
-def init_control_store() -> None:
-    with _connect() as conn:
-        conn.execute(
+CONTROL_MIGRATIONS = (
+    Migration(
+        version=1,
+        name="baseline",
+        statements=(
             """
             create table if not exists project_controls (
               project_slug text primary key,
@@ -37,9 +32,7 @@ def init_control_store() -> None:
               details_json text not null default '{}',
               updated_at text not null
             )
-            """
-        )
-        conn.execute(
+            """,
             """
             create table if not exists provider_controls (
               project_slug text not null,
@@ -50,9 +43,7 @@ def init_control_store() -> None:
               updated_at text not null,
               primary key (project_slug, provider)
             )
-            """
-        )
-        conn.execute(
+            """,
             """
             create table if not exists control_events (
               id integer primary key autoincrement,
@@ -66,19 +57,34 @@ def init_control_store() -> None:
               details_json text not null default '{}',
               created_at text not null
             )
-            """
-        )
-        conn.execute("create index if not exists provider_controls_project_idx on provider_controls (project_slug)")
-        conn.execute("create index if not exists project_controls_disabled_idx on project_controls (disabled)")
-        conn.execute("create index if not exists provider_controls_disabled_idx on provider_controls (disabled)")
-        conn.execute("create index if not exists control_events_project_idx on control_events (project_slug, created_at desc)")
-        conn.execute("create index if not exists control_events_provider_idx on control_events (provider, created_at desc)")
-        conn.execute("create index if not exists control_events_incident_idx on control_events (incident_id, created_at desc)")
+            """,
+            "create index if not exists provider_controls_project_idx on provider_controls (project_slug)",
+            "create index if not exists project_controls_disabled_idx on project_controls (disabled)",
+            "create index if not exists provider_controls_disabled_idx on provider_controls (disabled)",
+            "create index if not exists control_events_project_idx on control_events (project_slug, created_at desc)",
+            "create index if not exists control_events_provider_idx on control_events (provider, created_at desc)",
+            "create index if not exists control_events_incident_idx on control_events (incident_id, created_at desc)",
+        ),
+    ),
+    Migration(
+        version=2,
+        name="keyset_pagination_indexes",
+        statements=(
+            "create index if not exists control_events_created_idx on control_events (created_at desc)",
+        ),
+    ),
+)
+
+schema_registry.register("control", _db_path, CONTROL_MIGRATIONS)
+
+
+def init_control_store() -> None:
+    schema_registry.ensure("control")
 
 
 def save_project_control(*, project_slug: str, disabled: bool, reason: Optional[str], details: Dict[str, Any], updated_at: str) -> None:
-    init_control_store()
-    with _connect() as conn:
+    schema_registry.ensure("control")
+    with _connect(write=True) as conn:
         conn.execute(
             """
             insert into project_controls (project_slug, disabled, reason, details_json, updated_at)
@@ -94,8 +100,8 @@ def save_project_control(*, project_slug: str, disabled: bool, reason: Optional[
 
 
 def save_provider_control(*, project_slug: str, provider: str, disabled: bool, reason: Optional[str], details: Dict[str, Any], updated_at: str) -> None:
-    init_control_store()
-    with _connect() as conn:
+    schema_registry.ensure("control")
+    with _connect(write=True) as conn:
         conn.execute(
             """
             insert into provider_controls (project_slug, provider, disabled, reason, details_json, updated_at)
@@ -122,13 +128,14 @@ def save_control_event(
     details: Dict[str, Any],
     created_at: str,
 ) -> Dict[str, Any]:
-    init_control_store()
-    with _connect() as conn:
+    schema_registry.ensure("control")
+    with _connect(write=True) as conn:
         cursor = conn.execute(
             """
             insert into control_events (
               control_type, action, project_slug, provider, reason, actor, incident_id, details_json, created_at
             ) values (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            returning *
             """,
             (
                 control_type.strip().lower(),
@@ -142,7 +149,7 @@ def save_control_event(
                 created_at,
             ),
         )
-        row = conn.execute("select * from control_events where id = ?", (cursor.lastrowid,)).fetchone()
+        row = cursor.fetchone()
     return _event_row(row) if row else {}
 
 
@@ -175,8 +182,11 @@ def list_control_events(
     provider: Optional[str] = None,
     incident_id: Optional[str] = None,
     limit: int = 100,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    init_control_store()
+    schema_registry.ensure("control")
     clauses: list[str] = []
     params: list[Any] = []
     if project_slug:
@@ -188,15 +198,18 @@ def list_control_events(
     if incident_id:
         clauses.append("incident_id = ?")
         params.append(incident_id.strip())
+    keyset, keyset_params = keyset_clauses("created_at", before=before, since=since, until=until)
+    clauses.extend(keyset)
+    params.extend(keyset_params)
     where = f"where {' and '.join(clauses)}" if clauses else ""
-    params.append(max(1, min(limit, 500)))
+    params.append(page_limit(limit))
     with _connect() as conn:
         rows = conn.execute(f"select * from control_events {where} order by created_at desc, id desc limit ?", params).fetchall()
     return [_event_row(row) for row in rows]
 
 
 def load_control_snapshot() -> Dict[str, Any]:
-    init_control_store()
+    schema_registry.ensure("control")
     with _connect() as conn:
         project_rows = conn.execute("select * from project_controls").fetchall()
         provider_rows = conn.execute("select * from provider_controls").fetchall()
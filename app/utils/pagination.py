@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+MAX_PAGE_SIZE = 500
+
+Keyset = Tuple[str, int]
+
+
+def page_limit(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(ts: str, row_id: int) -> str:
+    raw = json.dumps([ts, int(row_id)], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Keyset]:
+    """
+    Decode an opaque ``(ts, id)`` cursor. Raises ``ValueError`` for anything that
+    was not produced by ``encode_cursor``.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor.strip() + "=" * (-len(cursor.strip()) % 4)
+        ts, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(ts, str) or not isinstance(row_id, int):
+            raise ValueError("cursor fields have the wrong type")
+        return ts, row_id
+    except Exception as exc:
+        raise ValueError("Cursor is malformed or was not issued by Ether.") from exc
+
+
+def keyset_clauses(
+    ts_column: str,
+    *,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Tuple[List[str], List[Any]]:
+    """
+    WHERE fragments for newest-first ``order by <ts_column> desc, id desc`` pages.
+
+    The ``<ts_column> <= ?`` bound keeps the keyset step a range scan on the
+    existing ``(…, <ts_column> desc)`` indexes.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    if before is not None:
+        ts, row_id = before
+        clauses.append(f"{ts_column} <= ? and ({ts_column} < ? or id < ?)")
+        params.extend([ts, ts, row_id])
+    if since:
+        clauses.append(f"{ts_column} >= ?")
+        params.append(since.strip())
+    if until:
+        clauses.append(f"{ts_column} <= ?")
+        params.append(until.strip())
+    return clauses, params
+
+
+def next_cursor(rows: Sequence[Dict[str, Any]], ts_key: str, limit: int) -> Optional[str]:
+    if not rows or len(rows) < page_limit(limit):
+        return None
+    last = rows[-1]
+    if last.get(ts_key) is None or last.get("id") is None:
+        return None
+    return encode_cursor(str(last[ts_key]), int(last["id"]))
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
+log = logging.getLogger("ether_v2.postgres_pool")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def postgres_dsn() -> str:
+    return os.getenv("ETHER_POSTGRES_DSN", "").strip() or os.getenv("DATABASE_URL", "").strip()
+
+
+def redacted_dsn(dsn: str) -> str:
+    try:
+        parts = urlsplit(dsn)
+        host = parts.hostname or "localhost"
+        port = f":{parts.port}" if parts.port else ""
+        return f"{parts.scheme}://{host}{port}{parts.path}"
+    except Exception:
+        return "postgres"
+
+
+@lru_cache(maxsize=512)
+def translate_placeholders(sql: str) -> str:
+    """
+    Rewrite sqlite ``?`` parameters to psycopg ``%s`` and escape literal ``%``.
+    Characters inside single-quoted string literals are left alone.
+    """
+    out: List[str] = []
+    in_string = False
+    for char in sql:
+        if char == "'":
+            in_string = not in_string
+            out.append(char)
+        elif char == "%":
+            out.append("%%")
+        elif char == "?" and not in_string:
+            out.append("%s")
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+class PostgresRow:
+    """Row that, like ``sqlite3.Row``, supports both ``row["column"]`` and ``row[0]``."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: Sequence[Any]) -> None:
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        if isinstance(key, int):
+            return self._values[key]
+        return self._values[self._index[key]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def keys(self) -> List[str]:
+        return list(self._index)
+
+
+def _row_factory(cursor: Any) -> Any:
+    index = {column.name: position for position, column in enumerate(cursor.description or ())}
+    return lambda values: PostgresRow(index, values)
+
+
+class PostgresConnection:
+    """
+    Thin adapter exposing the ``sqlite3.Connection`` surface the stores use
+    (``execute``/``executemany`` with ``?`` parameters) on a psycopg connection.
+    """
+
+    def __init__(self, raw: Any) -> None:
+        self.raw = raw
+
+    def execute(self, sql: str, params: Optional[Sequence[Any]] = None) -> Any:
+        if not params:
+            return self.raw.execute(sql)
+        return self.raw.execute(translate_placeholders(sql), tuple(params))
+
+    def executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> Any:
+        cursor = self.raw.cursor()
+        cursor.executemany(translate_placeholders(sql), [tuple(row) for row in rows])
+        return cursor
+
+    def copy_rows(self, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> int:
+        with self.raw.cursor() as cursor:
+            with cursor.copy(f"copy {table} ({', '.join(columns)}) from stdin") as copy:
+                for row in rows:
+                    copy.write_row(row)
+        return len(rows)
+
+
+class PostgresPool:
+    """
+    Pooled psycopg connections for the Ether operational stores.
+
+    Connections are autocommit; write blocks open an explicit transaction. As with
+    the SQLite pool, nested blocks on one thread reuse the outer connection and
+    share its transaction, so store helpers can call each other inside a write.
+    """
+
+    def __init__(self) -> None:
+        self._pool: Any = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Union[int, float]] = {
+            "checkouts": 0,
+            "reuses": 0,
+            "write_transactions": 0,
+            "rollbacks": 0,
+            "checkout_wait_total_ms": 0.0,
+            "checkout_wait_max_ms": 0.0,
+            "copy_batches": 0,
+            "copy_rows": 0,
+        }
+
+    def _bump(self, key: str, amount: Union[int, float] = 1) -> None:
+        with self._lock:
+            self._stats[key] = self._stats.get(key, 0) + amount
+
+    def _ensure_pool(self) -> Any:
+        if self._pool is not None:
+            return self._pool
+        with self._lock:
+            if self._pool is not None:
+                return self._pool
+            try:
+                from psycopg_pool import ConnectionPool
+            except ImportError as exc:
+                raise RuntimeError("ETHER_STORAGE_BACKEND=postgres requires the psycopg[binary,pool] package.") from exc
+            dsn = postgres_dsn()
+            if not dsn:
+                raise RuntimeError("ETHER_STORAGE_BACKEND=postgres requires ETHER_POSTGRES_DSN (or DATABASE_URL).")
+            self._pool = ConnectionPool(
+                dsn,
+                min_size=max(1, _int_env("ETHER_POSTGRES_POOL_MIN", 1)),
+                max_size=max(1, _int_env("ETHER_POSTGRES_POOL_MAX", 10)),
+                timeout=max(1, _int_env("ETHER_POSTGRES_POOL_TIMEOUT_SECONDS", 30)),
+                kwargs={"autocommit": True, "row_factory": _row_factory},
+                name="ether-stores",
+                open=True,
+            )
+        return self._pool
+
+    @contextmanager
+    def connection(self, *, write: bool = False) -> Iterator[PostgresConnection]:
+        current: Optional[PostgresConnection] = getattr(self._local, "conn", None)
+        if current is not None:
+            self._bump("reuses")
+            self._bump("checkouts")
+            if write and not getattr(self._local, "in_transaction", False):
+                with self._transaction(current):
+                    yield current
+            else:
+                yield current
+            return
+
+        pool = self._ensure_pool()
+        started = time.perf_counter()
+        with pool.connection() as raw:
+            waited_ms = (time.perf_counter() - started) * 1000.0
+            with self._lock:
+                self._stats["checkouts"] += 1
+                self._stats["checkout_wait_total_ms"] += waited_ms
+                if waited_ms > self._stats["checkout_wait_max_ms"]:
+                    self._stats["checkout_wait_max_ms"] = waited_ms
+            conn = PostgresConnection(raw)
+            self._local.conn = conn
+            try:
+                if write:
+                    with self._transaction(conn):
+                        yield conn
+                else:
+                    yield conn
+            finally:
+                self._local.conn = None
+
+    @contextmanager
+    def _transaction(self, conn: PostgresConnection) -> Iterator[None]:
+        self._local.in_transaction = True
+        self._bump("write_transactions")
+        try:
+            with conn.raw.transaction():
+                yield
+        except BaseException:
+            self._bump("rollbacks")
+            raise
+        finally:
+            self._local.in_transaction = False
+
+    def record_copy(self, rows: int) -> None:
+        with self._lock:
+            self._stats["copy_batches"] += 1
+            self._stats["copy_rows"] += rows
+
+    def close_all(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            try:
+                pool.close()
+            except Exception as exc:
+                log.warning("ether_postgres_pool_close_failed=%s", exc)
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            pool = self._pool
+        pool_stats: Dict[str, Any] = {}
+        if pool is not None:
+            try:
+                pool_stats = dict(pool.get_stats())
+            except Exception as exc:
+                log.warning("ether_postgres_pool_stats_failed=%s", exc)
+        checkouts = int(stats["checkouts"]) or 0
+        return {
+            "dsn": redacted_dsn(postgres_dsn()),
+            "pool_open": pool is not None,
+            "pool_min": max(1, _int_env("ETHER_POSTGRES_POOL_MIN", 1)),
+            "pool_max": max(1, _int_env("ETHER_POSTGRES_POOL_MAX", 10)),
+            "pool": pool_stats,
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()},
+            "checkout_wait_avg_ms": round(float(stats["checkout_wait_total_ms"]) / checkouts, 3) if checkouts else 0.0,
+        }
+
+
+postgres_pool = PostgresPool()
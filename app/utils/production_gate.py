@@ -8,6 +8,7 @@ from app.utils.control_plane import control_plane_state
 from app.utils.provider_readiness import provider_readiness_for_suite
 from app.utils.sentinel import sentinel_engine
 from app.utils.signal_verification_store import signal_verification_snapshot
+from app.utils.supabase_guard import supabase_guard
 from app.utils.webhook_store import webhook_snapshot
 
 CORE_PROJECTS = ["circa_haus", "exclusivity"]
@@ -59,7 +60,8 @@ def _sentinel_status(project_slug: Optional[str] = None) -> Dict[str, Any]:
     blockers: List[str] = []
     open_threats = int(snapshot.get("threat_status_counts", {}).get("open", 0) or 0)
     active_quarantines = int(snapshot.get("quarantine_status_counts", {}).get("active", 0) or 0)
-    quarantine_dispositions = int(snapshot.get("disposition_counts", {}).get("quarantine", 0) or 0)
+    # Disposition totals are lifetime; only recent quarantine-level incidents block launch.
+    quarantine_dispositions = int((snapshot.get("window") or {}).get("disposition_counts", {}).get("quarantine", 0) or 0)
     if open_threats:
         blockers.append(f"{open_threats} open Sentinel threat(s) require review.")
     if active_quarantines:
@@ -87,6 +89,20 @@ def _signal_status() -> Dict[str, Any]:
     }
 
 
+def _outbound_status() -> Dict[str, Any]:
+    snapshot = supabase_guard.snapshot()
+    blockers: List[str] = []
+    for slug in CORE_PROJECTS:
+        for target, breaker in ((snapshot["projects"].get(slug) or {}).get("breakers") or {}).items():
+            if breaker["state"] != "closed":
+                blockers.append(f"Supabase circuit is {breaker['state']} for {slug} {target}: {breaker.get('last_error')}")
+    return {
+        "ready": not blockers,
+        "blockers": blockers,
+        "snapshot": snapshot,
+    }
+
+
 def _control_status() -> Dict[str, Any]:
     snapshot = control_plane_state.snapshot()
     blockers = []
@@ -118,7 +134,7 @@ def _webhook_status() -> Dict[str, Any]:
     snapshots = {slug: webhook_snapshot(project_slug=slug) for slug in CORE_PROJECTS}
     blockers: List[str] = []
     for slug, snapshot in snapshots.items():
-        status_counts = snapshot.get("status_counts") or {}
+        status_counts = (snapshot.get("window") or {}).get("status_counts") or {}
         invalid = int(status_counts.get("signature_invalid", 0) or 0)
         provider_disabled = int(status_counts.get("provider_disabled_by_control", 0) or 0)
         project_disabled = int(status_counts.get("project_disabled", 0) or 0)
@@ -158,6 +174,7 @@ def production_gate_snapshot(*, include_soft_warnings: bool = True) -> Dict[str,
     providers = _provider_status()
     sentinel_suite = _sentinel_status()
     signal = _signal_status()
+    outbound = _outbound_status()
     webhooks = _webhook_status()
     audit = audit_snapshot(limit=30)
 
@@ -167,6 +184,7 @@ def production_gate_snapshot(*, include_soft_warnings: bool = True) -> Dict[str,
     blockers.extend(providers["blockers"])
     blockers.extend(sentinel_suite["blockers"])
     blockers.extend(signal["blockers"])
+    blockers.extend(outbound["blockers"])
     blockers.extend(webhooks["blockers"])
 
     sections = {
@@ -175,6 +193,7 @@ def production_gate_snapshot(*, include_soft_warnings: bool = True) -> Dict[str,
         "providers": providers,
         "sentinel": sentinel_suite,
         "signal": signal,
+        "outbound": outbound,
         "webhooks": webhooks,
         "audit": audit,
     }
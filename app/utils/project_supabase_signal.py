@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from dataclasses import asdict, dataclass
+import time
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from supabase import create_client
-
-from app.utils.signal_verification_store import save_signal_run
+from app.utils.projects import list_projects
+from app.utils.signal_verification_store import save_signal_run_async
+from app.utils.supabase_guard import SupabaseCallRejected, supabase_guard
+from app.utils.supabase_http import supabase_clients
 
 log = logging.getLogger("ether_v2.project_supabase_signal")
 
@@ -22,9 +25,17 @@ class ProjectSignalWriteResult:
     mode: str
     target: Optional[str] = None
     error: Optional[str] = None
+    batch_size: int = 1
+    rpc_ms: Optional[float] = None
+    table_ms: Optional[float] = None
+    # Rows the signal RPC reported inserting (id, received_at, lane_id); empty for legacy RPCs.
+    receipts: Tuple[Dict[str, Any], ...] = ()
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data = asdict(self)
+        # Each run keeps only its own receipt, on the readback result.
+        data.pop("receipts")
+        return data
 
 
 @dataclass(frozen=True)
@@ -38,6 +49,7 @@ class ProjectSignalReadbackResult:
     matched_id: Optional[str] = None
     matched_received_at: Optional[str] = None
     error: Optional[str] = None
+    readback_ms: Optional[float] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -45,7 +57,8 @@ class ProjectSignalReadbackResult:
 
 @dataclass(frozen=True)
 class ProjectSignalVerificationResult:
-    ok: bool
+    # None while a deferred or sampled write has not been read back yet.
+    ok: Optional[bool]
     project_slug: str
     signal_kind: str
     lane_id: Optional[str]
@@ -53,6 +66,9 @@ class ProjectSignalVerificationResult:
     readback: Dict[str, Any]
     run: Dict[str, Any]
     error: Optional[str] = None
+    # verified, failed, deferred (readback queued) or skipped (not sampled / queue full)
+    verification: str = "verified"
+    timings: Dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -153,10 +169,84 @@ def build_signal_payload(
     }
 
 
+def _credentials(slug: str) -> tuple[Optional[str], Optional[str]]:
+    return _env(slug, "SUPABASE_URL"), _env(slug, "SUPABASE_SERVICE_ROLE_KEY")
+
+
+def _report(slug: str, *, ok: bool, exc: Optional[BaseException] = None) -> None:
+    url, key = _credentials(slug)
+    if url and key:
+        supabase_clients.report(url, key, ok=ok, exc=exc)
+
+
+async def _execute(slug: str, target: str, request: Any) -> Any:
+    """Execute one PostgREST request through the project's breaker and bulkhead."""
+    try:
+        response = await supabase_guard.call(slug, target, request.execute)
+    except SupabaseCallRejected:
+        raise
+    except Exception as exc:
+        _report(slug, ok=False, exc=exc)
+        raise
+    _report(slug, ok=True)
+    return response
+
+
+def _receipts(data: Any) -> Tuple[Dict[str, Any], ...]:
+    """Inserted rows reported by ``ether_signal`` / ``ether_signal_batch``; legacy RPCs report none."""
+    receipts: List[Dict[str, Any]] = []
+    for item in data if isinstance(data, list) else [data]:
+        if isinstance(item, dict) and item.get("id") is not None and item.get("received_at") is not None:
+            receipts.append({"id": str(item["id"]), "received_at": str(item["received_at"]), "lane_id": item.get("lane_id")})
+    return tuple(receipts)
+
+
+def _same_instant(left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        return False
+    if str(left) == str(right):
+        return True
+    try:
+        parsed = [datetime.fromisoformat(str(value)) for value in (left, right)]
+    except ValueError:
+        return False
+    parsed = [value if value.tzinfo else value.replace(tzinfo=timezone.utc) for value in parsed]
+    return parsed[0] == parsed[1]
+
+
+def signal_receipt(write: ProjectSignalWriteResult, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The RPC's receipt for ``payload``'s row, which verifies the write without a readback."""
+    if not write.ok:
+        return None
+    for receipt in write.receipts:
+        if receipt.get("lane_id") is not None and str(receipt["lane_id"]) != str(payload.get("lane_id")):
+            continue
+        if _same_instant(receipt.get("received_at"), payload.get("received_at")):
+            return receipt
+    return None
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
+def _attempt_ms(exc: Exception, started: float) -> Optional[float]:
+    # A call rejected by the breaker or bulkhead never reached Supabase; it has no latency.
+    return None if isinstance(exc, SupabaseCallRejected) else _elapsed_ms(started)
+
+
+def _failed_mode(exc: Exception) -> str:
+    return exc.reason if isinstance(exc, SupabaseCallRejected) else "failed"
+
+
+def _bulkhead_full(exc: Exception) -> bool:
+    # The table fallback would wait on the same project bulkhead again.
+    return isinstance(exc, SupabaseCallRejected) and exc.reason == "bulkhead_full"
+
+
 def _client_for_project(project_slug: str):
     slug = project_slug.strip().lower()
-    url = _env(slug, "SUPABASE_URL")
-    key = _env(slug, "SUPABASE_SERVICE_ROLE_KEY")
+    url, key = _credentials(slug)
     if not url or not key:
         return None, ProjectSignalWriteResult(
             attempted=False,
@@ -167,7 +257,7 @@ def _client_for_project(project_slug: str):
             error="Project Supabase URL or service role key is not configured.",
         )
     try:
-        return create_client(url, key), None
+        return supabase_clients.client(url, key), None
     except Exception as exc:
         return None, ProjectSignalWriteResult(
             attempted=True,
@@ -179,13 +269,13 @@ def _client_for_project(project_slug: str):
         )
 
 
-def record_project_signal(
+async def record_project_signal(
     *,
     project_slug: str,
     payload: Dict[str, Any],
 ) -> ProjectSignalWriteResult:
     """
-    Best-effort real Supabase keepalive/signal write.
+    Best-effort real Supabase keepalive/signal write over the shared async pool.
     """
     slug = project_slug.strip().lower()
     rpc_name = _env(slug, "SIGNAL_RPC", "ether_signal") or "ether_signal"
@@ -194,8 +284,9 @@ def record_project_signal(
     if client_error is not None:
         return client_error
 
+    started = time.perf_counter()
     try:
-        client.rpc(rpc_name, {"payload": payload}).execute()
+        response = await _execute(slug, "rpc", client.rpc(rpc_name, {"payload": payload}))
         return ProjectSignalWriteResult(
             attempted=True,
             configured=True,
@@ -203,12 +294,27 @@ def record_project_signal(
             project_slug=slug,
             mode="rpc",
             target=rpc_name,
+            rpc_ms=_elapsed_ms(started),
+            receipts=_receipts(getattr(response, "data", None)),
         )
     except Exception as rpc_exc:
+        rpc_ms = _attempt_ms(rpc_exc, started)
+        if _bulkhead_full(rpc_exc):
+            return ProjectSignalWriteResult(
+                attempted=True,
+                configured=True,
+                ok=False,
+                project_slug=slug,
+                mode="bulkhead_full",
+                target=rpc_name,
+                error=_safe_error(rpc_exc),
+                rpc_ms=rpc_ms,
+            )
         log.info("Project signal RPC failed for %s; falling back to table insert: %s", slug, _safe_error(rpc_exc))
 
+    started = time.perf_counter()
     try:
-        client.table(table_name).insert(payload).execute()
+        await _execute(slug, "table", client.table(table_name).insert(payload))
         return ProjectSignalWriteResult(
             attempted=True,
             configured=True,
@@ -216,6 +322,8 @@ def record_project_signal(
             project_slug=slug,
             mode="table",
             target=table_name,
+            rpc_ms=rpc_ms,
+            table_ms=_elapsed_ms(started),
         )
     except Exception as table_exc:
         return ProjectSignalWriteResult(
@@ -223,13 +331,96 @@ def record_project_signal(
             configured=True,
             ok=False,
             project_slug=slug,
-            mode="failed",
+            mode=_failed_mode(table_exc),
             target=f"{rpc_name} or {table_name}",
             error=_safe_error(table_exc),
+            rpc_ms=rpc_ms,
+            table_ms=_attempt_ms(table_exc, started),
+        )
+
+
+async def record_project_signals(
+    *,
+    project_slug: str,
+    payloads: List[Dict[str, Any]],
+) -> ProjectSignalWriteResult:
+    """
+    Write several signal payloads in one round trip.
+
+    Tries the batch RPC (``ether_signal_batch``) first and falls back to a single
+    multi-row insert into the signal table. Both are one statement on the Supabase
+    side, so the batch succeeds or fails as a whole. One payload goes through the
+    regular single-signal path.
+    """
+    if len(payloads) == 1:
+        return await record_project_signal(project_slug=project_slug, payload=payloads[0])
+    slug = project_slug.strip().lower()
+    batch_rpc_name = _env(slug, "SIGNAL_BATCH_RPC", "ether_signal_batch") or "ether_signal_batch"
+    table_name = _env(slug, "SIGNAL_TABLE", "ether_signals") or "ether_signals"
+    client, client_error = _client_for_project(slug)
+    if client_error is not None:
+        return replace(client_error, batch_size=len(payloads))
+
+    started = time.perf_counter()
+    try:
+        response = await _execute(slug, "rpc", client.rpc(batch_rpc_name, {"payloads": payloads}))
+        return ProjectSignalWriteResult(
+            attempted=True,
+            configured=True,
+            ok=True,
+            project_slug=slug,
+            mode="rpc_batch",
+            target=batch_rpc_name,
+            batch_size=len(payloads),
+            rpc_ms=_elapsed_ms(started),
+            receipts=_receipts(getattr(response, "data", None)),
+        )
+    except Exception as rpc_exc:
+        rpc_ms = _attempt_ms(rpc_exc, started)
+        if _bulkhead_full(rpc_exc):
+            return ProjectSignalWriteResult(
+                attempted=True,
+                configured=True,
+                ok=False,
+                project_slug=slug,
+                mode="bulkhead_full",
+                target=batch_rpc_name,
+                error=_safe_error(rpc_exc),
+                batch_size=len(payloads),
+                rpc_ms=rpc_ms,
+            )
+        log.info("Project signal batch RPC failed for %s; falling back to bulk insert: %s", slug, _safe_error(rpc_exc))
+
+    started = time.perf_counter()
+    try:
+        await _execute(slug, "table", client.table(table_name).insert(payloads))
+        return ProjectSignalWriteResult(
+            attempted=True,
+            configured=True,
+            ok=True,
+            project_slug=slug,
+            mode="table_batch",
+            target=table_name,
+            batch_size=len(payloads),
+            rpc_ms=rpc_ms,
+            table_ms=_elapsed_ms(started),
+        )
+    except Exception as table_exc:
+        return ProjectSignalWriteResult(
+            attempted=True,
+            configured=True,
+            ok=False,
+            project_slug=slug,
+            mode=_failed_mode(table_exc),
+            target=f"{batch_rpc_name} or {table_name}",
+            error=_safe_error(table_exc),
+            batch_size=len(payloads),
+            rpc_ms=rpc_ms,
+            table_ms=_attempt_ms(table_exc, started),
         )
 
 
-def readback_project_signal(
+async def readback_project_signal(
     *,
     project_slug: str,
     payload: Dict[str, Any],
@@ -253,6 +444,7 @@ def readback_project_signal(
     heartbeat_count = payload.get("heartbeat_count")
     app_slug = payload.get("app_slug") or slug
 
+    started = time.perf_counter()
     try:
         query = (
             client.table(table_name)
@@ -262,7 +454,8 @@ def readback_project_signal(
             .order("received_at", desc=True)
             .limit(5)
         )
-        response = query.execute()
+        response = await _execute(slug, "table", query)
+        readback_ms = _elapsed_ms(started)
         rows = getattr(response, "data", None) or []
         for row in rows:
             if str(row.get("heartbeat_count")) == str(heartbeat_count) or str(row.get("received_at")) == str(received_at):
@@ -275,6 +468,7 @@ def readback_project_signal(
                     target=table_name,
                     matched_id=str(row.get("id")) if row.get("id") is not None else None,
                     matched_received_at=str(row.get("received_at")) if row.get("received_at") is not None else None,
+                    readback_ms=readback_ms,
                 )
         return ProjectSignalReadbackResult(
             attempted=True,
@@ -284,6 +478,7 @@ def readback_project_signal(
             mode="table_readback_no_match",
             target=table_name,
             error="Signal write was not visible in readback query.",
+            readback_ms=readback_ms,
         )
     except Exception as exc:
         return ProjectSignalReadbackResult(
@@ -294,27 +489,110 @@ def readback_project_signal(
             mode="table_readback_failed",
             target=table_name,
             error=_safe_error(exc),
+            readback_ms=_attempt_ms(exc, started),
         )
 
 
-def record_and_verify_project_signal(
+def _readback_match(rows: List[Dict[str, Any]], payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    for row in rows:
+        if row.get("lane_id") != payload.get("lane_id"):
+            continue
+        if str(row.get("heartbeat_count")) == str(payload.get("heartbeat_count")) or str(row.get("received_at")) == str(payload.get("received_at")):
+            return row
+    return None
+
+
+async def readback_project_signals(
     *,
     project_slug: str,
-    payload: Dict[str, Any],
-) -> ProjectSignalVerificationResult:
+    payloads: List[Dict[str, Any]],
+) -> List[ProjectSignalReadbackResult]:
+    """
+    Read back several signal writes of one project with a single query.
+
+    Selects the project's rows for all the lanes involved, received no earlier than
+    the oldest payload, and matches each payload like ``readback_project_signal``.
+    """
+    if len(payloads) == 1:
+        return [await readback_project_signal(project_slug=project_slug, payload=payloads[0])]
     slug = project_slug.strip().lower()
-    write = record_project_signal(project_slug=slug, payload=payload)
-    readback = readback_project_signal(project_slug=slug, payload=payload) if write.ok else ProjectSignalReadbackResult(
-        attempted=False,
-        configured=write.configured,
-        ok=False,
-        project_slug=slug,
-        mode="not_attempted_write_failed",
-        error=write.error,
-    )
-    verified_ok = bool(write.ok and readback.ok)
-    error = None if verified_ok else (readback.error or write.error or "Signal verification failed.")
-    payload_summary = {
+    table_name = _env(slug, "SIGNAL_TABLE", "ether_signals") or "ether_signals"
+    client, client_error = _client_for_project(slug)
+    if client_error is not None:
+        failed = ProjectSignalReadbackResult(
+            attempted=client_error.attempted,
+            configured=client_error.configured,
+            ok=False,
+            project_slug=slug,
+            mode=client_error.mode,
+            target=client_error.target,
+            error=client_error.error,
+        )
+        return [failed for _ in payloads]
+
+    lanes = sorted({str(payload.get("lane_id")) for payload in payloads if payload.get("lane_id") is not None})
+    oldest = min(str(payload.get("received_at") or "") for payload in payloads)
+    started = time.perf_counter()
+    try:
+        query = (
+            client.table(table_name)
+            .select("id, app_slug, lane_id, heartbeat_count, received_at, signal_kind, status")
+            .eq("app_slug", payloads[0].get("app_slug") or slug)
+            .in_("lane_id", lanes)
+        )
+        if oldest:
+            query = query.gte("received_at", oldest)
+        response = await _execute(slug, "table", query.order("received_at", desc=True).limit(len(payloads) * 5))
+    except Exception as exc:
+        failed = ProjectSignalReadbackResult(
+            attempted=True,
+            configured=True,
+            ok=False,
+            project_slug=slug,
+            mode="table_readback_failed",
+            target=table_name,
+            error=_safe_error(exc),
+            readback_ms=_attempt_ms(exc, started),
+        )
+        return [failed for _ in payloads]
+
+    readback_ms = _elapsed_ms(started)
+    rows = getattr(response, "data", None) or []
+    results: List[ProjectSignalReadbackResult] = []
+    for payload in payloads:
+        row = _readback_match(rows, payload)
+        if row is None:
+            results.append(
+                ProjectSignalReadbackResult(
+                    attempted=True,
+                    configured=True,
+                    ok=False,
+                    project_slug=slug,
+                    mode="table_readback_no_match",
+                    target=table_name,
+                    error="Signal write was not visible in readback query.",
+                    readback_ms=readback_ms,
+                )
+            )
+            continue
+        results.append(
+            ProjectSignalReadbackResult(
+                attempted=True,
+                configured=True,
+                ok=True,
+                project_slug=slug,
+                mode="table_readback_batch",
+                target=table_name,
+                matched_id=str(row.get("id")) if row.get("id") is not None else None,
+                matched_received_at=str(row.get("received_at")) if row.get("received_at") is not None else None,
+                readback_ms=readback_ms,
+            )
+        )
+    return results
+
+
+def signal_payload_summary(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
         "signal_kind": payload.get("signal_kind"),
         "lane_id": payload.get("lane_id"),
         "status": payload.get("status"),
@@ -323,7 +601,63 @@ def record_and_verify_project_signal(
         "heartbeat_count": payload.get("heartbeat_count"),
         "received_at": payload.get("received_at"),
     }
-    run = save_signal_run(
+
+
+async def record_and_verify_project_signal(
+    *,
+    project_slug: str,
+    payload: Dict[str, Any],
+) -> ProjectSignalVerificationResult:
+    slug = project_slug.strip().lower()
+    started = time.perf_counter()
+    write = await record_project_signal(project_slug=slug, payload=payload)
+    write_ms = _elapsed_ms(started)
+    result = await verify_project_signal_write(project_slug=slug, payload=payload, write=write)
+    return replace(result, timings={"write_ms": write_ms, **result.timings})
+
+
+async def verify_project_signal_write(
+    *,
+    project_slug: str,
+    payload: Dict[str, Any],
+    write: ProjectSignalWriteResult,
+) -> ProjectSignalVerificationResult:
+    """
+    Verify an already attempted write and persist the signal run.
+
+    An RPC receipt for the payload's row verifies the write as is; writes without
+    one (table fallback, legacy RPCs) are read back from the signal table.
+    """
+    slug = project_slug.strip().lower()
+    started = time.perf_counter()
+    receipt = signal_receipt(write, payload)
+    if receipt is not None:
+        readback = ProjectSignalReadbackResult(
+            attempted=False,
+            configured=True,
+            ok=True,
+            project_slug=slug,
+            mode="rpc_receipt",
+            target=write.target,
+            matched_id=receipt["id"],
+            matched_received_at=receipt["received_at"],
+        )
+    elif write.ok:
+        readback = await readback_project_signal(project_slug=slug, payload=payload)
+    else:
+        readback = ProjectSignalReadbackResult(
+            attempted=False,
+            configured=write.configured,
+            ok=False,
+            project_slug=slug,
+            mode="not_attempted_write_failed",
+            error=write.error,
+        )
+    verified_ok = bool(write.ok and readback.ok)
+    error = None if verified_ok else (readback.error or write.error or "Signal verification failed.")
+    payload_summary = signal_payload_summary(payload)
+    readback_done = time.perf_counter()
+    run = await save_signal_run_async(
         project_slug=slug,
         signal_kind=str(payload.get("signal_kind") or "unknown"),
         lane_id=str(payload.get("lane_id")) if payload.get("lane_id") is not None else None,
@@ -340,6 +674,9 @@ def record_and_verify_project_signal(
         readback_result=readback.to_dict(),
         payload_summary=payload_summary,
         recorded_at=_utc_now_iso(),
+        rpc_ms=write.rpc_ms,
+        table_ms=write.table_ms,
+        readback_ms=readback.readback_ms,
     )
     return ProjectSignalVerificationResult(
         ok=verified_ok,
@@ -350,4 +687,28 @@ def record_and_verify_project_signal(
         readback=readback.to_dict(),
         run=run,
         error=error,
+        verification="verified" if verified_ok else "failed",
+        timings={
+            "readback_ms": round((readback_done - started) * 1000.0, 3),
+            "persist_ms": round((time.perf_counter() - readback_done) * 1000.0, 3),
+        },
     )
+
+
+async def warm_project_signal_clients() -> Dict[str, bool]:
+    """Build and connect the pooled client of every project with signal credentials."""
+    targets = []
+    for project in list_projects():
+        url, key = _credentials(project.slug)
+        if url and key:
+            table_name = _env(project.slug, "SIGNAL_TABLE", "ether_signals") or "ether_signals"
+            targets.append((project.slug, _warm_up(project.slug, url, key, table_name)))
+    results = await asyncio.gather(*(warm for _, warm in targets))
+    return {slug: ok for (slug, _), ok in zip(targets, results)}
+
+
+async def _warm_up(slug: str, url: str, key: str, table_name: str) -> bool:
+    try:
+        return await supabase_guard.call(slug, "table", lambda: supabase_clients.warm_up(url, key, table_name))
+    except Exception:
+        return False
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Importing the stores registers their schemas with schema_registry.
+from app.utils import audit_store, control_store, sentinel_store, signal_outbox_store, signal_verification_store, webhook_store  # noqa: F401
+from app.utils.sqlite_pool import sqlite_pool
+from app.utils.sqlite_schema import schema_registry
+from app.utils.storage_backend import get_storage_backend
+
+log = logging.getLogger("ether_v2.retention")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    table: str
+    component: str
+    ts_column: str
+    max_age_days: int
+    max_rows: int
+    keep_where: Optional[str] = None
+
+    @classmethod
+    def from_env(
+        cls,
+        *,
+        table: str,
+        component: str,
+        ts_column: str,
+        max_age_days: int,
+        max_rows: int,
+        keep_where: Optional[str] = None,
+    ) -> "RetentionPolicy":
+        prefix = f"ETHER_RETENTION_{table.upper()}"
+        return cls(
+            table=table,
+            component=component,
+            ts_column=ts_column,
+            max_age_days=max(0, _int_env(f"{prefix}_MAX_AGE_DAYS", max_age_days)),
+            max_rows=max(0, _int_env(f"{prefix}_MAX_ROWS", max_rows)),
+            keep_where=keep_where,
+        )
+
+
+def retention_policies() -> List[RetentionPolicy]:
+    """
+    Per-table retention. ``0`` disables a limit. Open Sentinel threats are never
+    archived regardless of age.
+    """
+    return [
+        RetentionPolicy.from_env(table="audit_events", component="audit", ts_column="ts", max_age_days=90, max_rows=1_000_000),
+        RetentionPolicy.from_env(table="signal_runs", component="signal_verification", ts_column="recorded_at", max_age_days=30, max_rows=500_000),
+        RetentionPolicy.from_env(table="webhook_events", component="webhook", ts_column="received_at", max_age_days=30, max_rows=250_000),
+        RetentionPolicy.from_env(
+            table="sentinel_threats",
+            component="sentinel",
+            ts_column="created_at",
+            max_age_days=180,
+            max_rows=250_000,
+            keep_where="status = 'open'",
+        ),
+        RetentionPolicy.from_env(
+            table="signal_outbox",
+            component="signal_outbox",
+            ts_column="created_at",
+            max_age_days=30,
+            max_rows=100_000,
+            keep_where="status = 'pending'",
+        ),
+        RetentionPolicy.from_env(table="control_events", component="control", ts_column="created_at", max_age_days=365, max_rows=250_000),
+    ]
+
+
+def _archive_dir() -> Path:
+    raw = os.getenv("ETHER_RETENTION_ARCHIVE_DIR", "").strip() or "runtime/archive"
+    return Path(raw)
+
+
+class RetentionEngine:
+    """
+    Chunked archival of expired rows from the SQLite operational stores.
+
+    Each chunk is read, appended to ``<archive>/<table>/<YYYY-MM-DD>.ndjson.gz`` by
+    the row's own day, then deleted in a short write transaction so writers are
+    only blocked for one chunk at a time. Afterwards freed pages are returned to the
+    filesystem with ``incremental_vacuum``. Archival is at-least-once: a crash
+    between archive append and delete can repeat a chunk in the archive.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_run: Optional[Dict[str, Any]] = None
+        self._totals: Dict[str, int] = {"runs": 0, "archived_rows": 0, "reclaimed_bytes": 0}
+
+    @property
+    def chunk_size(self) -> int:
+        return max(1, _int_env("ETHER_RETENTION_CHUNK_SIZE", 500))
+
+    @property
+    def chunk_pause_ms(self) -> int:
+        return max(0, _int_env("ETHER_RETENTION_CHUNK_PAUSE_MS", 25))
+
+    @property
+    def interval_seconds(self) -> int:
+        return max(0, _int_env("ETHER_RETENTION_INTERVAL_SECONDS", 3600))
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ether-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10.0)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.run()
+            except Exception as exc:
+                log.warning("ether_retention_run_failed=%s", exc)
+
+    def run(
+        self,
+        *,
+        tables: Optional[Sequence[str]] = None,
+        dry_run: bool = False,
+        convert_auto_vacuum: bool = False,
+    ) -> Dict[str, Any]:
+        if not self._lock.acquire(blocking=False):
+            return {"ok": False, "error": "A retention run is already in progress."}
+        try:
+            started = time.perf_counter()
+            selected = [policy for policy in retention_policies() if not tables or policy.table in tables]
+            table_results = {policy.table: self._apply(policy, dry_run=dry_run) for policy in selected}
+            compaction: Optional[Dict[str, Any]] = None
+            if not dry_run and any(policy.table == "webhook_events" for policy in selected):
+                compaction = webhook_store.compact_inline_payloads(chunk_size=self.chunk_size)
+            vacuum_results: Dict[str, Any] = {}
+            # Postgres reclaims space with its own autovacuum; only SQLite files are compacted here.
+            if not dry_run and get_storage_backend().supports_vacuum:
+                for path in sorted({str(schema_registry.db_path(policy.component)) for policy in selected}):
+                    vacuum_results[path] = self._vacuum(path, convert_auto_vacuum=convert_auto_vacuum)
+            archived = sum(item.get("archived_rows", 0) for item in table_results.values())
+            reclaimed = sum(item.get("reclaimed_bytes", 0) for item in vacuum_results.values())
+            result = {
+                "ok": all(item.get("ok") for item in table_results.values()),
+                "dry_run": dry_run,
+                "finished_at": _now().isoformat(),
+                "duration_ms": round((time.perf_counter() - started) * 1000.0, 1),
+                "archived_rows": archived,
+                "reclaimed_bytes": reclaimed,
+                "tables": table_results,
+                "payload_compaction": compaction,
+                "vacuum": vacuum_results,
+            }
+            if not dry_run:
+                self._totals["runs"] += 1
+                self._totals["archived_rows"] += archived
+                self._totals["reclaimed_bytes"] += reclaimed
+                self._last_run = result
+            return result
+        finally:
+            self._lock.release()
+
+    def _expired_where(self, policy: RetentionPolicy, conn: Any) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if policy.max_age_days:
+            clauses.append(f"{policy.ts_column} < ?")
+            params.append((_now() - timedelta(days=policy.max_age_days)).isoformat())
+        if policy.max_rows:
+            boundary = conn.execute(
+                f"select id from {policy.table} order by id desc limit 1 offset ?",
+                (policy.max_rows,),
+            ).fetchone()
+            if boundary is not None:
+                clauses.append("id <= ?")
+                params.append(int(boundary["id"]))
+        if not clauses:
+            return "", []
+        where = f"({' or '.join(clauses)})"
+        if policy.keep_where:
+            where = f"{where} and not ({policy.keep_where})"
+        return where, params
+
+    def _apply(self, policy: RetentionPolicy, *, dry_run: bool) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"ok": True, "policy": asdict(policy), "archived_rows": 0, "chunks": 0, "archive_files": []}
+        path = schema_registry.db_path(policy.component)
+        try:
+            schema_registry.ensure(policy.component)
+            backend = get_storage_backend()
+            with backend.connection(path) as conn:
+                where, params = self._expired_where(policy, conn)
+                if not where:
+                    result["eligible_rows"] = 0
+                    return result
+                result["eligible_rows"] = int(conn.execute(f"select count(*) from {policy.table} where {where}", params).fetchone()[0])
+            if dry_run or not result["eligible_rows"]:
+                return result
+            files: set[str] = set()
+            last_id = 0
+            while True:
+                with backend.connection(path) as conn:
+                    rows = conn.execute(
+                        f"select * from {policy.table} where {where} and id > ? order by id limit ?",
+                        [*params, last_id, self.chunk_size],
+                    ).fetchall()
+                if not rows:
+                    break
+                records = [dict(row) for row in rows]
+                if policy.table == "webhook_events":
+                    # Payload bodies live in webhook_payloads; archive them with their events.
+                    webhook_store.attach_payloads(records)
+                files.update(self._archive(policy, records))
+                ids = [record["id"] for record in records]
+                placeholders = ",".join("?" for _ in ids)
+                with backend.connection(path, write=True) as conn:
+                    conn.execute(f"delete from {policy.table} where id in ({placeholders})", ids)
+                last_id = ids[-1]
+                result["archived_rows"] += len(ids)
+                result["chunks"] += 1
+                if self.chunk_pause_ms:
+                    time.sleep(self.chunk_pause_ms / 1000.0)
+            result["archive_files"] = sorted(files)
+            if policy.table == "webhook_events":
+                result["pruned_payloads"] = webhook_store.prune_orphan_payloads(chunk_size=self.chunk_size)
+        except Exception as exc:
+            log.warning("ether_retention_table_failed table=%s error=%s", policy.table, exc)
+            result["ok"] = False
+            result["error"] = str(exc)[:240]
+        return result
+
+    def _archive(self, policy: RetentionPolicy, records: List[Dict[str, Any]]) -> List[str]:
+        by_day: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            day = str(record.get(policy.ts_column) or "")[:10] or "undated"
+            by_day.setdefault(day, []).append(record)
+        target_dir = _archive_dir() / policy.table
+        target_dir.mkdir(parents=True, exist_ok=True)
+        written: List[str] = []
+        for day, items in by_day.items():
+            target = target_dir / f"{day}.ndjson.gz"
+            with gzip.open(target, "at", encoding="utf-8") as handle:
+                for item in items:
+                    handle.write(json.dumps(item, sort_keys=True, default=str) + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            written.append(str(target))
+        return written
+
+    def _page_state(self, path: str) -> Dict[str, int]:
+        with sqlite_pool.connection(path) as conn:
+            return {
+                "page_size": int(conn.execute("pragma page_size").fetchone()[0]),
+                "page_count": int(conn.execute("pragma page_count").fetchone()[0]),
+                "freelist_count": int(conn.execute("pragma freelist_count").fetchone()[0]),
+                "auto_vacuum": int(conn.execute("pragma auto_vacuum").fetchone()[0]),
+            }
+
+    def _vacuum(self, path: str, *, convert_auto_vacuum: bool) -> Dict[str, Any]:
+        pages_per_step = max(1, _int_env("ETHER_RETENTION_VACUUM_PAGES", 256))
+        try:
+            before = self._page_state(path)
+            mode = "incremental"
+            if before["auto_vacuum"] != 2:
+                if not convert_auto_vacuum:
+                    return {
+                        "ok": True,
+                        "mode": "skipped",
+                        "note": "Database is not in auto_vacuum=incremental mode; run with convert_auto_vacuum=true once during a quiet window.",
+                        "freelist_bytes": before["freelist_count"] * before["page_size"],
+                    }
+                # One-time conversion: a full VACUUM must run outside any transaction.
+                with sqlite_pool.connection(path) as conn:
+                    conn.execute("pragma auto_vacuum = incremental")
+                    conn.execute("vacuum")
+                mode = "converted"
+            else:
+                steps = before["freelist_count"] // pages_per_step + 1
+                while steps > 0 and self._page_state(path)["freelist_count"] > 0:
+                    steps -= 1
+                    with sqlite_pool.connection(path) as conn:
+                        conn.execute(f"pragma incremental_vacuum({pages_per_step})").fetchall()
+                    if self.chunk_pause_ms:
+                        time.sleep(self.chunk_pause_ms / 1000.0)
+            after = self._page_state(path)
+            with sqlite_pool.connection(path) as conn:
+                conn.execute("pragma wal_checkpoint(truncate)")
+            reclaimed = max(0, (before["page_count"] - after["page_count"]) * before["page_size"])
+            return {"ok": True, "mode": mode, "before": before, "after": after, "reclaimed_bytes": reclaimed}
+        except Exception as exc:
+            log.warning("ether_retention_vacuum_failed path=%s error=%s", path, exc)
+            return {"ok": False, "error": str(exc)[:240], "reclaimed_bytes": 0}
+
+    def status(self) -> Dict[str, Any]:
+        backend = get_storage_backend()
+        policies: Dict[str, Any] = {}
+        for policy in retention_policies():
+            path = str(schema_registry.db_path(policy.component))
+            entry: Dict[str, Any] = {"policy": asdict(policy), "db_path": backend.location(path)}
+            try:
+                schema_registry.ensure(policy.component)
+                with backend.connection(path) as conn:
+                    where, params = self._expired_where(policy, conn)
+                    entry["row_count"] = int(conn.execute(f"select count(*) from {policy.table}").fetchone()[0])
+                    oldest = conn.execute(f"select min({policy.ts_column}) from {policy.table}").fetchone()[0]
+                    entry["oldest"] = oldest
+                    entry["eligible_rows"] = (
+                        int(conn.execute(f"select count(*) from {policy.table} where {where}", params).fetchone()[0]) if where else 0
+                    )
+            except Exception as exc:
+                entry["error"] = str(exc)[:240]
+            policies[policy.table] = entry
+        databases: Dict[str, Any] = {}
+        vacuum_paths = {entry["db_path"] for entry in policies.values()} if backend.supports_vacuum else set()
+        for path in sorted(vacuum_paths):
+            try:
+                state = self._page_state(path)
+                databases[path] = {
+                    **state,
+                    "auto_vacuum_mode": {0: "none", 1: "full", 2: "incremental"}.get(state["auto_vacuum"], "unknown"),
+                    "file_bytes": Path(path).stat().st_size if Path(path).exists() else 0,
+                    "freelist_bytes": state["freelist_count"] * state["page_size"],
+                }
+            except Exception as exc:
+                databases[path] = {"error": str(exc)[:240]}
+        return {
+            "archive_dir": str(_archive_dir()),
+            "interval_seconds": self.interval_seconds,
+            "scheduler_running": self._thread is not None and self._thread.is_alive(),
+            "chunk_size": self.chunk_size,
+            "chunk_pause_ms": self.chunk_pause_ms,
+            "totals": dict(self._totals),
+            "last_run": self._last_run,
+            "policies": policies,
+            "databases": databases,
+        }
+
+
+retention_engine = RetentionEngine()
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from app.utils.pagination import Keyset
 from app.utils.sentinel_store import (
     find_active_quarantines,
     init_sentinel_store,
@@ -408,12 +409,30 @@ class SentinelEngine:
         self._quarantines = [record if item.id == record.id else item for item in self._quarantines]
         return record
 
-    def list_threats(self, project_slug: Optional[str] = None, limit: Optional[int] = None, status: Optional[str] = None) -> List[ThreatRecord]:
-        rows = list_threat_rows(project_slug=project_slug, status=status, limit=limit or 100)
+    def list_threats(
+        self,
+        project_slug: Optional[str] = None,
+        limit: Optional[int] = None,
+        status: Optional[str] = None,
+        *,
+        before: Optional[Keyset] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[ThreatRecord]:
+        rows = list_threat_rows(project_slug=project_slug, status=status, limit=limit or 100, before=before, since=since, until=until)
         return [_threat_from_row(row) for row in rows]
 
-    def list_quarantines(self, project_slug: Optional[str] = None, status: Optional[str] = None, limit: int = 100) -> List[QuarantineRecord]:
-        rows = list_quarantine_rows(project_slug=project_slug, status=status, limit=limit)
+    def list_quarantines(
+        self,
+        project_slug: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        *,
+        before: Optional[Keyset] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[QuarantineRecord]:
+        rows = list_quarantine_rows(project_slug=project_slug, status=status, limit=limit, before=before, since=since, until=until)
         return [_quarantine_from_row(row) for row in rows]
 
     def snapshot(self, project_slug: Optional[str] = None) -> Dict[str, Any]:
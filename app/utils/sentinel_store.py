@@ -1,34 +1,30 @@
 from __future__ import annotations
 
 import json
-import os
 import sqlite3
-from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional
+
+from app.utils.pagination import Keyset, keyset_clauses, page_limit
+from app.utils.sqlite_pool import resolve_db_path
+from app.utils.sqlite_schema import Migration, schema_registry
+from app.utils.storage_backend import get_storage_backend
+from app.utils.store_counters import counter_statements, read_counters
 
 
 def _db_path() -> Path:
-    raw = os.getenv("ETHER_SENTINEL_DB_PATH", os.getenv("ETHER_AUDIT_DB_PATH", "runtime/ether_audit.sqlite3")).strip() or "runtime/ether_audit.sqlite3"
-    path = Path(raw)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return path
+    return resolve_db_path("ETHER_SENTINEL_DB_PATH")
 
 
-@contextmanager
-def _connect() -> Iterator[sqlite3.Connection]:
-    conn = sqlite3.connect(_db_path())
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+def _connect(*, write: bool = False) -> ContextManager[Any]:
+    return get_storage_backend().connection(_db_path(), write=write)
 
 
-def init_sentinel_store() -> None:
-    with _connect() as conn:
-        conn.execute(
+SENTINEL_MIGRATIONS = (
+    Migration(
+        version=1,
+        name="baseline",
+        statements=(
             """
             create table if not exists sentinel_threats (
               id integer primary key autoincrement,
@@ -47,9 +43,7 @@ def init_sentinel_store() -> None:
               reviewer text,
               review_notes text
             )
-            """
-        )
-        conn.execute(
+            """,
             """
             create table if not exists sentinel_quarantines (
               id integer primary key autoincrement,
@@ -65,14 +59,65 @@ def init_sentinel_store() -> None:
               released_by text,
               release_reason text
             )
+            """,
+            "create index if not exists sentinel_threats_project_created_idx on sentinel_threats (project_slug, created_at desc)",
+            "create index if not exists sentinel_threats_status_idx on sentinel_threats (status, created_at desc)",
+            "create index if not exists sentinel_threats_disposition_idx on sentinel_threats (disposition, created_at desc)",
+            "create index if not exists sentinel_quarantines_project_status_idx on sentinel_quarantines (project_slug, status)",
+            "create index if not exists sentinel_quarantines_target_idx on sentinel_quarantines (target_type, target_id)",
+            "create index if not exists sentinel_quarantines_enforcement_idx on sentinel_quarantines (project_slug, target_type, target_id, status)",
+        ),
+    ),
+    Migration(
+        version=2,
+        name="keyset_pagination_indexes",
+        statements=(
+            "create index if not exists sentinel_threats_created_idx on sentinel_threats (created_at desc)",
+            "create index if not exists sentinel_quarantines_created_idx on sentinel_quarantines (created_at desc)",
+        ),
+    ),
+    Migration(
+        version=3,
+        name="sentinel_counters",
+        statements=(
+            *counter_statements(
+                table="sentinel_threats",
+                counter_table="sentinel_threat_counters",
+                ts_column="created_at",
+                project="{row}.project_slug",
+                dimensions={"status": "{row}.status", "disposition": "{row}.disposition"},
+                mutable=("status",),
+            ),
+            *counter_statements(
+                table="sentinel_quarantines",
+                counter_table="sentinel_quarantine_counters",
+                ts_column="created_at",
+                project="{row}.project_slug",
+                dimensions={"status": "{row}.status"},
+                mutable=("status",),
+            ),
+        ),
+    ),
+    Migration(
+        version=4,
+        name="quarantine_recency_indexes",
+        statements=(
+            "drop index if exists sentinel_quarantines_project_status_idx",
+            "drop index if exists sentinel_quarantines_enforcement_idx",
+            "create index if not exists sentinel_quarantines_project_status_idx on sentinel_quarantines (project_slug, status, created_at desc)",
             """
-        )
-        conn.execute("create index if not exists sentinel_threats_project_created_idx on sentinel_threats (project_slug, created_at desc)")
-        conn.execute("create index if not exists sentinel_threats_status_idx on sentinel_threats (status, created_at desc)")
-        conn.execute("create index if not exists sentinel_threats_disposition_idx on sentinel_threats (disposition, created_at desc)")
-        conn.execute("create index if not exists sentinel_quarantines_project_status_idx on sentinel_quarantines (project_slug, status)")
-        conn.execute("create index if not exists sentinel_quarantines_target_idx on sentinel_quarantines (target_type, target_id)")
-        conn.execute("create index if not exists sentinel_quarantines_enforcement_idx on sentinel_quarantines (project_slug, target_type, target_id, status)")
+            create index if not exists sentinel_quarantines_enforcement_idx
+            on sentinel_quarantines (project_slug, target_type, target_id, status, created_at desc)
+            """,
+        ),
+    ),
+)
+
+schema_registry.register("sentinel", _db_path, SENTINEL_MIGRATIONS)
+
+
+def init_sentinel_store() -> None:
+    schema_registry.ensure("sentinel")
 
 
 def _json(value: Dict[str, Any]) -> str:
@@ -100,14 +145,15 @@ def save_threat(
     details: Dict[str, Any],
     created_at: str,
 ) -> int:
-    init_sentinel_store()
-    with _connect() as conn:
+    schema_registry.ensure("sentinel")
+    with _connect(write=True) as conn:
         cursor = conn.execute(
             """
             insert into sentinel_threats (
               project_slug, event_type, severity, risk_score, disposition, quarantined,
               actor_id, source_ip, status, details_json, created_at
             ) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            returning id
             """,
             (
                 project_slug,
@@ -123,7 +169,7 @@ def save_threat(
                 created_at,
             ),
         )
-        return int(cursor.lastrowid)
+        return int(cursor.fetchone()["id"])
 
 
 def save_quarantine(
@@ -137,21 +183,30 @@ def save_quarantine(
     details: Dict[str, Any],
     created_at: str,
 ) -> int:
-    init_sentinel_store()
-    with _connect() as conn:
+    schema_registry.ensure("sentinel")
+    with _connect(write=True) as conn:
         cursor = conn.execute(
             """
             insert into sentinel_quarantines (
               project_slug, target_type, target_id, reason, status, expires_at, details_json, created_at
             ) values (?, ?, ?, ?, ?, ?, ?, ?)
+            returning id
             """,
             (project_slug, target_type, target_id, reason, status, expires_at, _json(details), created_at),
         )
-        return int(cursor.lastrowid)
+        return int(cursor.fetchone()["id"])
 
 
-def list_threat_rows(project_slug: Optional[str] = None, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
-    init_sentinel_store()
+def list_threat_rows(
+    project_slug: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 50,
+    *,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    schema_registry.ensure("sentinel")
     clauses: list[str] = []
     params: list[Any] = []
     if project_slug:
@@ -160,15 +215,26 @@ def list_threat_rows(project_slug: Optional[str] = None, status: Optional[str] =
     if status:
         clauses.append("status = ?")
         params.append(status.strip().lower())
+    keyset, keyset_params = keyset_clauses("created_at", before=before, since=since, until=until)
+    clauses.extend(keyset)
+    params.extend(keyset_params)
     where = f"where {' and '.join(clauses)}" if clauses else ""
-    params.append(max(1, min(limit, 500)))
+    params.append(page_limit(limit))
     with _connect() as conn:
         rows = conn.execute(f"select * from sentinel_threats {where} order by created_at desc, id desc limit ?", params).fetchall()
     return [_threat_row(row) for row in rows]
 
 
-def list_quarantine_rows(project_slug: Optional[str] = None, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
-    init_sentinel_store()
+def list_quarantine_rows(
+    project_slug: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 50,
+    *,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    schema_registry.ensure("sentinel")
     clauses: list[str] = []
     params: list[Any] = []
     if project_slug:
@@ -177,8 +243,11 @@ def list_quarantine_rows(project_slug: Optional[str] = None, status: Optional[st
     if status:
         clauses.append("status = ?")
         params.append(status.strip().lower())
+    keyset, keyset_params = keyset_clauses("created_at", before=before, since=since, until=until)
+    clauses.extend(keyset)
+    params.extend(keyset_params)
     where = f"where {' and '.join(clauses)}" if clauses else ""
-    params.append(max(1, min(limit, 500)))
+    params.append(page_limit(limit))
     with _connect() as conn:
         rows = conn.execute(f"select * from sentinel_quarantines {where} order by created_at desc, id desc limit ?", params).fetchall()
     return [_quarantine_row(row) for row in rows]
@@ -191,7 +260,7 @@ def find_active_quarantines(
     target_id: Optional[str] = None,
     limit: int = 50,
 ) -> List[Dict[str, Any]]:
-    init_sentinel_store()
+    schema_registry.ensure("sentinel")
     clauses = ["project_slug = ?", "status = 'active'"]
     params: list[Any] = [project_slug.strip().lower()]
     if target_type:
@@ -208,8 +277,8 @@ def find_active_quarantines(
 
 
 def mark_threat_reviewed(*, threat_id: int, reviewer: Optional[str], status: str, review_notes: Optional[str], reviewed_at: str) -> Optional[Dict[str, Any]]:
-    init_sentinel_store()
-    with _connect() as conn:
+    schema_registry.ensure("sentinel")
+    with _connect(write=True) as conn:
         conn.execute(
             """
             update sentinel_threats
@@ -223,8 +292,8 @@ def mark_threat_reviewed(*, threat_id: int, reviewer: Optional[str], status: str
 
 
 def release_quarantine(*, quarantine_id: int, released_by: Optional[str], release_reason: str, released_at: str) -> Optional[Dict[str, Any]]:
-    init_sentinel_store()
-    with _connect() as conn:
+    schema_registry.ensure("sentinel")
+    with _connect(write=True) as conn:
         conn.execute(
             """
             update sentinel_quarantines
@@ -238,32 +307,40 @@ def release_quarantine(*, quarantine_id: int, released_by: Optional[str], releas
 
 
 def sentinel_snapshot(project_slug: Optional[str] = None) -> Dict[str, Any]:
-    threats = list_threat_rows(project_slug=project_slug, limit=100)
-    quarantines = list_quarantine_rows(project_slug=project_slug, limit=100)
-    threat_status_counts: Dict[str, int] = {}
-    disposition_counts: Dict[str, int] = {}
-    for threat in threats:
-        threat_status_counts[threat["status"]] = threat_status_counts.get(threat["status"], 0) + 1
-        disposition_counts[threat["disposition"]] = disposition_counts.get(threat["disposition"], 0) + 1
-    quarantine_status_counts: Dict[str, int] = {}
-    for quarantine in quarantines:
-        quarantine_status_counts[quarantine["status"]] = quarantine_status_counts.get(quarantine["status"], 0) + 1
-    active_by_target: Dict[str, int] = {}
-    for quarantine in quarantines:
-        if quarantine.get("status") != "active":
-            continue
-        key = f"{quarantine.get('target_type')}:{quarantine.get('target_id')}"
-        active_by_target[key] = active_by_target.get(key, 0) + 1
+    threats = list_threat_rows(project_slug=project_slug, limit=20)
+    quarantines = list_quarantine_rows(project_slug=project_slug, limit=20)
+    clauses = ["status = 'active'"]
+    params: list[Any] = []
+    if project_slug:
+        clauses.append("project_slug = ?")
+        params.append(project_slug.strip().lower())
+    with _connect() as conn:
+        threat_counters = read_counters(conn, "sentinel_threat_counters", project_slug=project_slug)
+        quarantine_counters = read_counters(conn, "sentinel_quarantine_counters", project_slug=project_slug)
+        active_rows = conn.execute(
+            f"""
+            select target_type, target_id, count(*) as total from sentinel_quarantines
+            where {' and '.join(clauses)} group by target_type, target_id
+            """,
+            params,
+        ).fetchall()
+    active_by_target = {f"{row['target_type']}:{row['target_id']}": int(row["total"]) for row in active_rows}
     return {
         "project_slug": project_slug,
-        "threat_count": len(threats),
-        "quarantine_count": len(quarantines),
+        "threat_count": threat_counters["total"],
+        "quarantine_count": quarantine_counters["total"],
         "active_quarantine_by_target": active_by_target,
-        "threat_status_counts": threat_status_counts,
-        "disposition_counts": disposition_counts,
-        "quarantine_status_counts": quarantine_status_counts,
-        "recent_threats": threats[:20],
-        "recent_quarantines": quarantines[:20],
+        "threat_status_counts": threat_counters["lifetime"].get("status", {}),
+        "disposition_counts": threat_counters["lifetime"].get("disposition", {}),
+        "quarantine_status_counts": quarantine_counters["lifetime"].get("status", {}),
+        "window": {
+            "days": threat_counters["window_days"],
+            "threat_count": threat_counters["window_total"],
+            "quarantine_count": quarantine_counters["window_total"],
+            "disposition_counts": threat_counters["window"].get("disposition", {}),
+        },
+        "recent_threats": threats,
+        "recent_quarantines": quarantines,
     }
 
 
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from app.utils.project_supabase_signal import (
+    ProjectSignalWriteResult,
+    record_project_signal,
+    record_project_signals,
+)
+
+log = logging.getLogger("ether_v2.signal_batcher")
+
+# Runs once per written lane: (project_slug, written payload, write result) -> settled result.
+SignalSettle = Callable[[str, Dict[str, Any], ProjectSignalWriteResult], Awaitable[Any]]
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+@dataclass
+class _PendingSignal:
+    payload: Dict[str, Any]
+    settle: SignalSettle
+    waiters: List["asyncio.Future[Any]"] = field(default_factory=list)
+
+
+@dataclass
+class _ProjectBuffer:
+    pending: Dict[Any, _PendingSignal] = field(default_factory=dict)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class SignalBatcher:
+    """
+    Per-project heartbeat buffer in front of the project Supabase write.
+
+    Heartbeat payloads are buffered per project and flushed as one batch RPC or
+    multi-row insert every ``ETHER_SIGNAL_BATCH_FLUSH_MS`` or as soon as
+    ``ETHER_SIGNAL_BATCH_MAX_ITEMS`` are waiting. A second heartbeat for a lane that
+    is still buffered replaces the first (coalescing), so a lane is written at
+    most once per flush. After the write, the ``settle`` callback runs once per
+    written lane and every submitter coalesced into that lane gets its result.
+    """
+
+    def __init__(self) -> None:
+        self._buffers: Dict[str, _ProjectBuffer] = {}
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self._lock = threading.Lock()
+        self._configure()
+        self._stats: Dict[str, Any] = {
+            "submitted": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "batched_items": 0,
+            "failed_batches": 0,
+            "max_batch_size": 0,
+            "flush_on_size": 0,
+            "flush_on_timer": 0,
+            "flush_on_shutdown": 0,
+            "modes": {},
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+            "last_flush_at": None,
+        }
+
+    def _configure(self) -> None:
+        self.enabled = os.getenv("ETHER_SIGNAL_BATCH_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+        self.flush_ms = max(1, _int_env("ETHER_SIGNAL_BATCH_FLUSH_MS", 250))
+        self.max_items = max(1, _int_env("ETHER_SIGNAL_BATCH_MAX_ITEMS", 100))
+
+    def submit(self, project_slug: str, payload: Dict[str, Any], settle: SignalSettle) -> "asyncio.Future[Any]":
+        """Buffer one heartbeat payload; must be called on the event loop."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Any]" = loop.create_future()
+        slug = project_slug.strip().lower()
+        with self._lock:
+            self._stats["submitted"] += 1
+        if not self.enabled:
+            self.track(self._flush(slug, [_PendingSignal(payload=payload, settle=settle, waiters=[future])], "direct"))
+            return future
+
+        buffer = self._buffers.setdefault(slug, _ProjectBuffer())
+        lane_key = payload.get("lane_id") or id(future)
+        pending = buffer.pending.get(lane_key)
+        if pending is None:
+            buffer.pending[lane_key] = _PendingSignal(payload=payload, settle=settle, waiters=[future])
+        else:
+            if int(payload.get("heartbeat_count") or 0) >= int(pending.payload.get("heartbeat_count") or 0):
+                pending.payload = payload
+            pending.waiters.append(future)
+            with self._lock:
+                self._stats["coalesced"] += 1
+
+        if len(buffer.pending) >= self.max_items:
+            self._flush_now(slug, "size")
+        elif buffer.timer is None:
+            buffer.timer = loop.call_later(self.flush_ms / 1000.0, self._flush_now, slug, "timer")
+        return future
+
+    def track(self, awaitable: Awaitable[Any]) -> "asyncio.Task[Any]":
+        """Run follow-up work for a submitter that did not wait, and drain it on shutdown."""
+        task = asyncio.ensure_future(awaitable)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _take(self, slug: str) -> List[_PendingSignal]:
+        buffer = self._buffers.get(slug)
+        if buffer is None:
+            return []
+        if buffer.timer is not None:
+            buffer.timer.cancel()
+            buffer.timer = None
+        pending = list(buffer.pending.values())
+        buffer.pending.clear()
+        return pending
+
+    def _flush_now(self, slug: str, reason: str) -> None:
+        batch = self._take(slug)
+        if batch:
+            self.track(self._flush(slug, batch, reason))
+
+    async def _flush(self, slug: str, batch: List[_PendingSignal], reason: str) -> None:
+        payloads = [pending.payload for pending in batch]
+        started = time.perf_counter()
+        try:
+            if reason == "direct":
+                write = await record_project_signal(project_slug=slug, payload=payloads[0])
+            else:
+                write = await record_project_signals(project_slug=slug, payloads=payloads)
+        except Exception as exc:
+            log.warning("ether_signal_batch_flush_failed project=%s error=%s", slug, exc)
+            write = ProjectSignalWriteResult(
+                attempted=True,
+                configured=True,
+                ok=False,
+                project_slug=slug,
+                mode=f"{'direct' if reason == 'direct' else 'batch'}_error",
+                error=str(exc)[:240] or exc.__class__.__name__,
+                batch_size=len(payloads),
+            )
+        except BaseException:
+            self._cancel(batch)
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if reason != "direct":
+            with self._lock:
+                self._stats["batches"] += 1
+                self._stats["batched_items"] += len(payloads)
+                self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(payloads))
+                self._stats[f"flush_on_{reason}"] += 1
+                self._stats["failed_batches"] += 0 if write.ok else 1
+                self._stats["modes"][write.mode] = self._stats["modes"].get(write.mode, 0) + 1
+                self._stats["last_flush_ms"] = round(elapsed_ms, 3)
+                self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], round(elapsed_ms, 3))
+                self._stats["total_flush_ms"] += elapsed_ms
+                self._stats["last_flush_at"] = time.time()
+        try:
+            await asyncio.gather(*(self._settle(slug, pending, write) for pending in batch))
+        except BaseException:
+            self._cancel(batch)
+            raise
+
+    async def _settle(self, slug: str, pending: _PendingSignal, write: ProjectSignalWriteResult) -> None:
+        # One settle per written lane; coalesced submitters share its result.
+        try:
+            result = await pending.settle(slug, pending.payload, write)
+        except Exception as exc:
+            log.warning("ether_signal_settle_failed project=%s error=%s", slug, exc)
+            for future in pending.waiters:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future in pending.waiters:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _cancel(batch: List[_PendingSignal]) -> None:
+        # Cancelled (e.g. on shutdown): waiting heartbeats must not hang.
+        for pending in batch:
+            for future in pending.waiters:
+                if not future.done():
+                    future.cancel()
+
+    async def aclose(self) -> None:
+        """Flush every buffered heartbeat and wait for in-flight writes."""
+        for slug in list(self._buffers):
+            batch = self._take(slug)
+            if batch:
+                self.track(self._flush(slug, batch, "shutdown"))
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["modes"] = dict(self._stats["modes"])
+        pending = {slug: len(buffer.pending) for slug, buffer in self._buffers.items() if buffer.pending}
+        batches = int(stats["batches"])
+        return {
+            "enabled": self.enabled,
+            "flush_ms": self.flush_ms,
+            "max_items": self.max_items,
+            "pending": pending,
+            "in_flight": len(self._tasks),
+            **stats,
+            "total_flush_ms": round(stats["total_flush_ms"], 3),
+            "avg_batch_size": round(stats["batched_items"] / batches, 2) if batches else 0.0,
+            "avg_flush_ms": round(stats["total_flush_ms"] / batches, 3) if batches else 0.0,
+            "writes_saved": max(0, int(stats["batched_items"]) + int(stats["coalesced"]) - batches),
+        }
+
+
+signal_batcher = SignalBatcher()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+@dataclass
+class _ProjectWindow:
+    last_ok_at: Optional[float] = None
+    pending_since: Optional[float] = None
+    written: int = 0
+    suppressed: int = 0
+    status_change_writes: int = 0
+    window_writes: int = 0
+    failed_writes: int = 0
+    unverified_writes: int = 0
+    confirmations: int = 0
+    invalidations: int = 0
+
+
+@dataclass(frozen=True)
+class KeepaliveDecision:
+    write: bool
+    reason: str
+    window_seconds: int
+    last_write_age_seconds: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "write": self.write,
+            "reason": self.reason,
+            "window_seconds": self.window_seconds,
+            "last_write_age_seconds": self.last_write_age_seconds,
+        }
+
+
+class KeepaliveWindow:
+    """
+    Per-project keepalive write suppression.
+
+    A heartbeat only needs to reach the project Supabase often enough to keep it
+    active. Once a signal write for a project has succeeded, further heartbeats
+    inside ``<PROJECT>_SIGNAL_KEEPALIVE_WINDOW_SECONDS`` (default
+    ``ETHER_SIGNAL_KEEPALIVE_WINDOW_SECONDS``; ``0`` disables suppression) update
+    lane state and are counted but not written, unless the heartbeat changes the
+    lane's status. While the first write of a window is in flight, concurrent
+    heartbeats are suppressed as well; a failed write reopens the window
+    immediately, as does a deferred readback that fails. A write that is not
+    verified yet releases the claim without opening the window; the window opens
+    once its deferred readback succeeds.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._projects: Dict[str, _ProjectWindow] = {}
+
+    @staticmethod
+    def window_seconds(project_slug: Optional[str] = None) -> int:
+        raw = ""
+        if project_slug:
+            raw = os.getenv(f"{project_slug.strip().upper()}_SIGNAL_KEEPALIVE_WINDOW_SECONDS", "").strip()
+        if raw:
+            try:
+                return max(0, int(raw))
+            except ValueError:
+                pass
+        return max(0, _int_env("ETHER_SIGNAL_KEEPALIVE_WINDOW_SECONDS", 300))
+
+    def _project(self, slug: str) -> _ProjectWindow:
+        state = self._projects.get(slug)
+        if state is None:
+            state = self._projects[slug] = _ProjectWindow()
+        return state
+
+    def decide(self, project_slug: str, *, status_changed: bool = False) -> KeepaliveDecision:
+        """Whether this heartbeat should be written; a ``write`` decision claims the window."""
+        slug = project_slug.strip().lower()
+        window = self.window_seconds(slug)
+        now = time.monotonic()
+        with self._lock:
+            state = self._project(slug)
+            age = round(now - state.last_ok_at, 3) if state.last_ok_at is not None else None
+            if not window:
+                reason = "window_disabled"
+            elif status_changed:
+                reason = "status_changed"
+            elif age is not None and age < window:
+                state.suppressed += 1
+                return KeepaliveDecision(write=False, reason="within_window", window_seconds=window, last_write_age_seconds=age)
+            elif state.pending_since is not None and now - state.pending_since < window:
+                state.suppressed += 1
+                return KeepaliveDecision(write=False, reason="write_in_flight", window_seconds=window, last_write_age_seconds=age)
+            else:
+                reason = "window_expired" if age is not None else "first_write"
+            state.pending_since = now
+            if reason == "status_changed":
+                state.status_change_writes += 1
+            else:
+                state.window_writes += 1
+        return KeepaliveDecision(write=True, reason=reason, window_seconds=window, last_write_age_seconds=age)
+
+    def record_write(self, project_slug: str, *, verification: str) -> None:
+        """
+        Record the outcome of a signal write (heartbeat, manual or cron).
+
+        Only a ``verified`` write (readback or RPC receipt) opens the window; a
+        ``deferred`` or ``skipped`` one only releases the claim.
+        """
+        with self._lock:
+            state = self._project(project_slug.strip().lower())
+            state.pending_since = None
+            if verification == "failed":
+                state.failed_writes += 1
+                return
+            state.written += 1
+            if verification == "verified":
+                state.last_ok_at = time.monotonic()
+            else:
+                state.unverified_writes += 1
+
+    def confirm(self, project_slug: str) -> None:
+        """Open the window after a deferred readback verified a write."""
+        with self._lock:
+            state = self._project(project_slug.strip().lower())
+            state.last_ok_at = time.monotonic()
+            state.confirmations += 1
+
+    def invalidate(self, project_slug: str) -> None:
+        """Reopen the window, e.g. after a deferred readback failed."""
+        with self._lock:
+            state = self._project(project_slug.strip().lower())
+            state.last_ok_at = None
+            state.pending_since = None
+            state.invalidations += 1
+
+    def stats(self, project_slug: Optional[str] = None) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            items = [
+                (slug, state)
+                for slug, state in self._projects.items()
+                if not project_slug or slug == project_slug.strip().lower()
+            ]
+            projects = {
+                slug: {
+                    "window_seconds": self.window_seconds(slug),
+                    "last_write_age_seconds": round(now - state.last_ok_at, 1) if state.last_ok_at is not None else None,
+                    "write_in_flight": state.pending_since is not None,
+                    "written": state.written,
+                    "suppressed": state.suppressed,
+                    "window_writes": state.window_writes,
+                    "status_change_writes": state.status_change_writes,
+                    "failed_writes": state.failed_writes,
+                    "unverified_writes": state.unverified_writes,
+                    "confirmations": state.confirmations,
+                    "invalidations": state.invalidations,
+                    "suppression_ratio": round(state.suppressed / (state.suppressed + state.written), 4)
+                    if state.suppressed + state.written
+                    else 0.0,
+                }
+                for slug, state in items
+            }
+        return {
+            "default_window_seconds": self.window_seconds(),
+            "suppressed": sum(item["suppressed"] for item in projects.values()),
+            "written": sum(item["written"] for item in projects.values()),
+            "projects": projects,
+        }
+
+
+signal_keepalive = KeepaliveWindow()
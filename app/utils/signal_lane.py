@@ -1,17 +1,78 @@
 from __future__ import annotations
 
+import asyncio
+import bisect
 import hashlib
+import heapq
 import hmac
+import itertools
+import logging
+import os
 import secrets
-from dataclasses import asdict, dataclass, field
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.utils.signal_lane_store import (
+    lane_row,
+    load_recent_signal_lanes_async,
+    load_signal_lane_async,
+    prune_signal_lanes_async,
+    save_signal_lanes_async,
+)
+
+log = logging.getLogger("ether_v2.signal_lane")
+
+# Client meta kept on a lane record; other keys are dropped so a lane stays small
+# no matter what an instance sends with its heartbeats.
+LANE_META_KEYS = frozenset(
+    {"app_version", "build", "platform", "os", "os_version", "sdk_version", "environment", "region", "locale"}
+)
+_MAX_DETAIL_CHARS = 64
+_MAX_CAPABILITIES = 16
+_MAX_FIELD_CHARS = 128
+
+_SWEEP_INTERVAL_SECONDS = 30.0
+# Newest lanes per project measured for the memory estimate.
+_MEMORY_SAMPLE = 256
+_PRUNE_INTERVAL_SECONDS = 300.0
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _float_env(key: str, default: float) -> float:
+    try:
+        return float(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
 
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _epoch_iso(value: float) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).isoformat()
+
+
+def _iso_epoch(value: Any) -> float:
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return time.time()
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
 def _slugify(value: str) -> str:
     safe = []
     for ch in (value or "").strip().lower():
@@ -22,7 +83,41 @@ def _slugify(value: str) -> str:
     return "".join(safe) or "unknown"
 
 
-@dataclass
+def _clip(value: Any, limit: int = _MAX_FIELD_CHARS) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value)
+    return text[:limit]
+
+
+def _lane_details(
+    previous: Dict[str, Any],
+    *,
+    meta: Optional[Dict[str, Any]] = None,
+    requested_capabilities: Optional[Iterable[Any]] = None,
+    client_nonce_present: bool,
+    proof_present: bool,
+) -> Dict[str, Any]:
+    """Bounded lane details: whitelisted scalar meta, clipped, plus presence flags."""
+    details: Dict[str, Any] = {}
+    for source in (previous, meta or {}):
+        for key in LANE_META_KEYS.intersection(source):
+            value = source[key]
+            if isinstance(value, bool) or isinstance(value, (int, float)):
+                details[key] = value
+            elif isinstance(value, str):
+                details[key] = value[:_MAX_DETAIL_CHARS]
+    if requested_capabilities is None:
+        capabilities = previous.get("requested_capabilities") or []
+    else:
+        capabilities = [str(item)[:_MAX_DETAIL_CHARS] for item in list(requested_capabilities)[:_MAX_CAPABILITIES]]
+    details["requested_capabilities"] = list(capabilities)[:_MAX_CAPABILITIES]
+    details["client_nonce_present"] = client_nonce_present
+    details["proof_present"] = proof_present
+    return details
+
+
+@dataclass(slots=True)
 class SignalLaneRecord:
     project_slug: str
     lane_id: str
@@ -37,9 +132,107 @@ class SignalLaneRecord:
     handshake_count: int = 0
     heartbeat_count: int = 0
     last_status: str = "bootstrapped"
-    issued_at: str = field(default_factory=_utc_now_iso)
-    last_seen_at: str = field(default_factory=_utc_now_iso)
+    issued_at: float = field(default_factory=time.time)
+    last_seen_at: float = field(default_factory=time.time)
     details: Dict[str, Any] = field(default_factory=dict)
+    # Monotonic time this copy was last read from or written to the store.
+    cached_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "project_slug": self.project_slug,
+            "lane_id": self.lane_id,
+            "app_id": self.app_id,
+            "instance_id": self.instance_id,
+            "domain": self.domain,
+            "verified": self.verified,
+            "verification_mode": self.verification_mode,
+            "proof_required": self.proof_required,
+            "accepted": self.accepted,
+            "server_nonce": self.server_nonce,
+            "handshake_count": self.handshake_count,
+            "heartbeat_count": self.heartbeat_count,
+            "last_status": self.last_status,
+            "issued_at": _epoch_iso(self.issued_at),
+            "last_seen_at": _epoch_iso(self.last_seen_at),
+            "details": dict(self.details),
+        }
+
+    def approx_bytes(self) -> int:
+        size = sys.getsizeof(self) + sys.getsizeof(self.details)
+        for value in (self.project_slug, self.lane_id, self.app_id, self.instance_id, self.domain, self.server_nonce, self.last_status):
+            size += sys.getsizeof(value) if value is not None else 0
+        for key, value in self.details.items():
+            size += sys.getsizeof(key) + sys.getsizeof(value)
+            if isinstance(value, list):
+                size += sum(sys.getsizeof(item) for item in value)
+        return size
+
+
+class _ProjectLanes:
+    """
+    One project's cached lanes, indexed by recency.
+
+    ``order`` holds ``(last_seen_at, lane_key)`` ascending, kept sorted with
+    bisect. Heartbeats move a lane to the end with an append, newest-first reads
+    take the tail, and expiry and eviction take the head, so none of them touch
+    the other lanes. A cached record's ``last_seen_at`` is only changed through
+    ``put``, which keeps the index in step.
+    """
+
+    __slots__ = ("records", "order")
+
+    def __init__(self) -> None:
+        self.records: Dict[str, SignalLaneRecord] = {}
+        self.order: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, lane_key: str) -> Optional[SignalLaneRecord]:
+        return self.records.get(lane_key)
+
+    def _unindex(self, record: SignalLaneRecord, lane_key: str) -> None:
+        entry = (record.last_seen_at, lane_key)
+        index = bisect.bisect_left(self.order, entry)
+        if index < len(self.order) and self.order[index] == entry:
+            del self.order[index]
+
+    def put(self, lane_key: str, record: SignalLaneRecord, *, seen_at: Optional[float] = None) -> None:
+        current = self.records.get(lane_key)
+        if current is not None:
+            self._unindex(current, lane_key)
+        if seen_at is not None:
+            record.last_seen_at = seen_at
+        entry = (record.last_seen_at, lane_key)
+        if not self.order or entry >= self.order[-1]:
+            self.order.append(entry)
+        else:
+            bisect.insort(self.order, entry)
+        self.records[lane_key] = record
+
+    def pop(self, lane_key: str) -> Optional[SignalLaneRecord]:
+        record = self.records.pop(lane_key, None)
+        if record is not None:
+            self._unindex(record, lane_key)
+        return record
+
+    def pop_oldest(self) -> Tuple[str, SignalLaneRecord]:
+        _, lane_key = self.order.pop(0)
+        return lane_key, self.records.pop(lane_key)
+
+    def pop_seen_before(self, cutoff: float) -> List[Tuple[str, SignalLaneRecord]]:
+        index = bisect.bisect_left(self.order, (cutoff, ""))
+        expired, self.order = self.order[:index], self.order[index:]
+        return [(lane_key, self.records.pop(lane_key)) for _, lane_key in expired]
+
+    def newest(self, limit: int) -> List[SignalLaneRecord]:
+        """The ``limit`` most recently seen records, copied out so callers never iterate the live index."""
+        if limit <= 0:
+            return []
+        tail = self.order[-limit:]
+        records = self.records
+        return [record for record in (records.get(lane_key) for _, lane_key in reversed(tail)) if record is not None]
 
 
 @dataclass
@@ -50,11 +243,328 @@ class SignalHeartbeatResult:
     verification_mode: str
     proof_required: bool
     keepalive_recorded: bool
+    status_changed: bool = False
 
 
 class SignalLaneRegistry:
+    """
+    Signal lanes shared by every worker through the signal store.
+
+    Lanes live in a local cache in front of the ``signal_lanes`` table. A cached
+    lane is trusted for ``ETHER_SIGNAL_LANE_CACHE_SECONDS``; after that, or on a
+    miss, it is read again from the store, so a lane created by another worker or
+    a previous process resolves instead of failing with ``ETHER_SIGNAL_LANE_UNKNOWN``.
+    Handshakes and verification changes are written through; routine heartbeats
+    only mark the lane dirty and are flushed in batches every
+    ``ETHER_SIGNAL_LANE_FLUSH_MS``. ``initialize`` restores the most recently seen
+    ``ETHER_SIGNAL_LANE_RESTORE_MAX`` lanes at startup and ``aclose`` flushes.
+
+    The cache is bounded: a lane not seen for ``ETHER_SIGNAL_LANE_IDLE_SECONDS``
+    has expired (it no longer resolves, locally or from the store), and each
+    project keeps at most ``ETHER_SIGNAL_LANE_MAX_PER_PROJECT`` lanes, evicting the
+    least recently seen. Evicted lanes stay in the store and resolve again on
+    their next heartbeat unless they have expired.
+
+    The cache and its indexes are only read and mutated on the event loop, so no
+    lock guards them; ``_lock`` protects the stats counters alone.
+    """
+
     def __init__(self) -> None:
-        self._lanes: Dict[Tuple[str, str], SignalLaneRecord] = {}
+        self._projects: Dict[str, _ProjectLanes] = {}
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._evicted_rows: Dict[Tuple[str, str], tuple] = {}
+        self._lock = threading.Lock()
+        self._flusher: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_sweep = time.monotonic()
+        self._last_prune = 0.0
+        self._configure()
+        self._stats: Dict[str, int] = {
+            "cache_hits": 0,
+            "store_reads": 0,
+            "store_misses": 0,
+            "store_read_errors": 0,
+            "restored": 0,
+            "write_through": 0,
+            "flushes": 0,
+            "flushed_lanes": 0,
+            "flush_failures": 0,
+            "expired": 0,
+            "evicted_over_cap": 0,
+            "pruned_from_store": 0,
+            "ticket_heartbeats": 0,
+            "ticket_rebuilt": 0,
+        }
+
+    def _configure(self) -> None:
+        self.cache_seconds = max(0.0, _float_env("ETHER_SIGNAL_LANE_CACHE_SECONDS", 2.0))
+        self.flush_ms = max(10, _int_env("ETHER_SIGNAL_LANE_FLUSH_MS", 1000))
+        self.restore_max = max(0, _int_env("ETHER_SIGNAL_LANE_RESTORE_MAX", 10000))
+        self.idle_seconds = max(60, _int_env("ETHER_SIGNAL_LANE_IDLE_SECONDS", 3600))
+        self.max_per_project = max(1, _int_env("ETHER_SIGNAL_LANE_MAX_PER_PROJECT", 5000))
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    @staticmethod
+    def _record_from_lane(lane: Dict[str, Any]) -> SignalLaneRecord:
+        return SignalLaneRecord(
+            project_slug=lane["project_slug"],
+            lane_id=lane["lane_id"],
+            app_id=_clip(lane.get("app_id")),
+            instance_id=_clip(lane.get("instance_id")),
+            domain=_clip(lane.get("domain")),
+            verified=bool(lane.get("verified")),
+            verification_mode=lane.get("verification_mode") or "pending-secret",
+            proof_required=bool(lane.get("proof_required")),
+            accepted=bool(lane.get("accepted", True)),
+            server_nonce=lane["server_nonce"],
+            handshake_count=int(lane.get("handshake_count") or 0),
+            heartbeat_count=int(lane.get("heartbeat_count") or 0),
+            last_status=sys.intern(_clip(lane.get("last_status"), _MAX_DETAIL_CHARS) or "bootstrapped"),
+            issued_at=_iso_epoch(lane.get("issued_at")),
+            last_seen_at=_iso_epoch(lane.get("last_seen_at")),
+            details=_lane_details(
+                lane.get("details") or {},
+                client_nonce_present=bool((lane.get("details") or {}).get("client_nonce_present")),
+                proof_present=bool((lane.get("details") or {}).get("proof_present")),
+            ),
+        )
+
+    @staticmethod
+    def _newer(candidate: SignalLaneRecord, current: SignalLaneRecord) -> bool:
+        return (candidate.last_seen_at, candidate.handshake_count + candidate.heartbeat_count) > (
+            current.last_seen_at,
+            current.handshake_count + current.heartbeat_count,
+        )
+
+    def _expired(self, record: SignalLaneRecord, now: Optional[float] = None) -> bool:
+        return (now or time.time()) - record.last_seen_at > self.idle_seconds
+
+    def _get(self, key: Tuple[str, str]) -> Optional[SignalLaneRecord]:
+        lanes = self._projects.get(key[0])
+        return lanes.get(key[1]) if lanes else None
+
+    def _put(self, key: Tuple[str, str], record: SignalLaneRecord, *, seen_at: Optional[float] = None) -> None:
+        """Cache ``record`` (optionally seen at ``seen_at``), evicting the least recently seen beyond the cap."""
+        lanes = self._projects.get(key[0])
+        if lanes is None:
+            lanes = self._projects[key[0]] = _ProjectLanes()
+        lanes.put(key[1], record, seen_at=seen_at)
+        while len(lanes) > self.max_per_project:
+            lane_key, evicted = lanes.pop_oldest()
+            self._evict((key[0], lane_key), evicted, "evicted_over_cap")
+
+    def _evict(self, key: Tuple[str, str], record: SignalLaneRecord, reason: str) -> None:
+        if key in self._dirty:
+            # Keep the unflushed copy as a store row; the next flush writes it.
+            self._dirty.discard(key)
+            self._evicted_rows[key] = lane_row(record.to_dict(), updated_at=_utc_now_iso())
+        self._count(reason)
+
+    def _drop(self, key: Tuple[str, str], reason: str) -> None:
+        lanes = self._projects.get(key[0])
+        record = lanes.pop(key[1]) if lanes else None
+        if record is not None:
+            self._evict(key, record, reason)
+        if lanes is not None and not lanes:
+            self._projects.pop(key[0], None)
+
+    def sweep(self) -> int:
+        """Drop expired lanes from the cache."""
+        cutoff = time.time() - self.idle_seconds
+        expired = 0
+        for slug, lanes in list(self._projects.items()):
+            for lane_key, record in lanes.pop_seen_before(cutoff):
+                self._evict((slug, lane_key), record, "expired")
+                expired += 1
+            if not lanes:
+                self._projects.pop(slug, None)
+        self._last_sweep = time.monotonic()
+        return expired
+
+    async def _resolve(self, key: Tuple[str, str], *, refresh: bool = False) -> Optional[SignalLaneRecord]:
+        """Cached lane, re-read from the store when stale, missing or ``refresh`` is set."""
+        record = self._get(key)
+        if record is not None and self._expired(record):
+            self._drop(key, "expired")
+            record = None
+        if record is not None and key in self._dirty:
+            # Local changes not flushed yet are newer than anything stored.
+            self._count("cache_hits")
+            return record
+        if record is not None and not refresh and time.monotonic() - record.cached_at < self.cache_seconds:
+            self._count("cache_hits")
+            return record
+        if key in self._evicted_rows:
+            await self.flush()
+        try:
+            lane = await load_signal_lane_async(*key)
+        except Exception as exc:
+            self._count("store_read_errors")
+            log.warning("ether_signal_lane_load_failed=%s", exc)
+            return self._get(key)
+        self._count("store_reads" if lane is not None else "store_misses")
+        current = self._get(key)
+        stored = self._record_from_lane(lane) if lane is not None else None
+        if stored is None or self._expired(stored):
+            if current is not None:
+                current.cached_at = time.monotonic()
+            return current
+        if current is not None and (key in self._dirty or not self._newer(stored, current)):
+            current.cached_at = time.monotonic()
+            return current
+        stored.cached_at = time.monotonic()
+        self._put(key, stored)
+        return stored
+
+    async def _persist(self, key: Tuple[str, str], record: SignalLaneRecord, *, write_through: bool) -> None:
+        if write_through:
+            try:
+                await save_signal_lanes_async([lane_row(record.to_dict(), updated_at=_utc_now_iso())])
+                record.cached_at = time.monotonic()
+                self._count("write_through")
+                return
+            except Exception as exc:
+                log.warning("ether_signal_lane_write_failed=%s", exc)
+        if self._get(key) is record:
+            self._dirty.add(key)
+        else:
+            self._evicted_rows[key] = lane_row(record.to_dict(), updated_at=_utc_now_iso())
+        self._ensure_flusher()
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._flusher is None or self._flusher.done() or self._loop is not loop:
+            self._loop = loop
+            self._flusher = loop.create_task(self._run(), name="ether-signal-lane-flush")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_ms / 1000.0)
+            await self.flush()
+            if time.monotonic() - self._last_sweep >= _SWEEP_INTERVAL_SECONDS:
+                self.sweep()
+            if time.monotonic() - self._last_prune >= _PRUNE_INTERVAL_SECONDS:
+                await self._prune_store()
+
+    async def _prune_store(self) -> None:
+        self._last_prune = time.monotonic()
+        try:
+            pruned = await prune_signal_lanes_async(seen_before=_epoch_iso(time.time() - self.idle_seconds))
+        except Exception as exc:
+            log.warning("ether_signal_lane_prune_failed=%s", exc)
+            return
+        self._count("pruned_from_store", pruned)
+
+    async def flush(self) -> int:
+        """Write every dirty lane in one batch; failed lanes stay dirty for the next flush."""
+        if not self._dirty and not self._evicted_rows:
+            return 0
+        keys = [key for key in self._dirty if self._get(key) is not None]
+        evicted, self._evicted_rows = self._evicted_rows, {}
+        self._dirty.clear()
+        updated_at = _utc_now_iso()
+        records = [self._get(key) for key in keys]
+        rows = [lane_row(record.to_dict(), updated_at=updated_at) for record in records if record is not None]
+        rows.extend(row for key, row in evicted.items() if key not in keys)
+        try:
+            await save_signal_lanes_async(rows)
+        except Exception as exc:
+            self._dirty.update(keys)
+            self._evicted_rows = {**evicted, **self._evicted_rows}
+            self._count("flush_failures")
+            log.warning("ether_signal_lane_flush_failed=%s lanes=%s", exc, len(rows))
+            return 0
+        now = time.monotonic()
+        for record in records:
+            if record is not None:
+                record.cached_at = now
+        with self._lock:
+            self._stats["flushes"] += 1
+            self._stats["flushed_lanes"] += len(rows)
+        return len(rows)
+
+    async def initialize(self) -> int:
+        """Restore recently seen, unexpired lanes from the store."""
+        if not self.restore_max:
+            return 0
+        try:
+            lanes = await load_recent_signal_lanes_async(
+                limit=self.restore_max,
+                seen_since=_epoch_iso(time.time() - self.idle_seconds),
+            )
+        except Exception as exc:
+            log.warning("ether_signal_lane_restore_failed=%s", exc)
+            return 0
+        now = time.monotonic()
+        # Oldest first, so the most recently seen lanes end up most recently used.
+        for lane in reversed(lanes):
+            record = self._record_from_lane(lane)
+            key = self._lane_key(record.project_slug, record.lane_id)
+            if key in self._dirty:
+                continue
+            record.cached_at = now
+            self._put(key, record)
+        self._count("restored", len(lanes))
+        if lanes:
+            log.info("ether_signal_lanes_restored=%s", len(lanes))
+        return len(lanes)
+
+    async def aclose(self) -> None:
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.cancel()
+            try:
+                await flusher
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._loop = None
+        await self.flush()
+
+    def cached_lane_count(self) -> int:
+        return sum(len(lanes) for lanes in self._projects.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        return {
+            "cached_lanes": self.cached_lane_count(),
+            "dirty_lanes": len(self._dirty) + len(self._evicted_rows),
+            "cache_seconds": self.cache_seconds,
+            "flush_ms": self.flush_ms,
+            "flusher_running": self._flusher is not None and not self._flusher.done(),
+            **stats,
+        }
+
+    def memory(self) -> Dict[str, Any]:
+        """Approximate memory held by cached lane records, extrapolated from each project's newest lanes."""
+        per_project: Dict[str, Dict[str, int]] = {}
+        total_bytes = 0
+        # Loop-only, like every cache mutator: nothing changes the index while this copies it.
+        samples = [(slug, len(lanes), lanes.newest(_MEMORY_SAMPLE)) for slug, lanes in self._projects.items()]
+        for slug, lane_count, records in samples:
+            sample = [record.approx_bytes() for record in records]
+            project_bytes = int(sum(sample) / len(sample) * lane_count) if sample else 0
+            per_project[slug] = {"lanes": lane_count, "approx_bytes": project_bytes}
+            total_bytes += project_bytes
+        lanes_total = sum(item["lanes"] for item in per_project.values())
+        memory: Dict[str, Any] = {
+            "lanes": lanes_total,
+            "approx_bytes": total_bytes,
+            "avg_lane_bytes": round(total_bytes / lanes_total, 1) if lanes_total else 0.0,
+            "max_lanes_per_project": self.max_per_project,
+            "idle_seconds": self.idle_seconds,
+            "projects": per_project,
+        }
+        try:
+            import resource
+
+            memory["process_max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        except (ImportError, OSError):
+            pass
+        return memory
 
     def _lane_key(self, project_slug: str, lane_id: str) -> Tuple[str, str]:
         return (project_slug.strip().lower(), lane_id.strip().lower())
@@ -106,7 +616,7 @@ class SignalLaneRegistry:
         expected = hmac.new(secret.encode("utf-8"), material.encode("utf-8"), hashlib.sha256).hexdigest()
         return hmac.compare_digest(expected, presented_proof.strip().lower())
 
-    def handshake(
+    async def handshake(
         self,
         *,
         project_slug: str,
@@ -121,7 +631,7 @@ class SignalLaneRegistry:
     ) -> SignalLaneRecord:
         resolved_lane_id = (lane_id or "").strip() or self._build_lane_id(project_slug, app_id, instance_id)
         key = self._lane_key(project_slug, resolved_lane_id)
-        existing = self._lanes.get(key)
+        existing = await self._resolve(key, refresh=True)
         server_nonce = existing.server_nonce if existing else None
 
         proof_required = bool(signal_secret)
@@ -155,30 +665,31 @@ class SignalLaneRegistry:
         record = existing or SignalLaneRecord(
             project_slug=project_slug,
             lane_id=resolved_lane_id,
-            app_id=app_id,
-            instance_id=instance_id,
-            domain=domain,
+            app_id=_clip(app_id),
+            instance_id=_clip(instance_id),
+            domain=_clip(domain),
         )
-        record.app_id = app_id or record.app_id
-        record.instance_id = instance_id or record.instance_id
-        record.domain = domain or record.domain
+        record.app_id = _clip(app_id) or record.app_id
+        record.instance_id = _clip(instance_id) or record.instance_id
+        record.domain = _clip(domain) or record.domain
         record.verified = verified
         record.verification_mode = verification_mode
         record.proof_required = proof_required
         record.accepted = accepted
         record.handshake_count += 1
         record.last_status = "verified" if accepted else "awaiting-proof"
-        record.last_seen_at = _utc_now_iso()
         record.server_nonce = secrets.token_hex(16)
-        record.details = {
-            "requested_capabilities": list(requested_capabilities or []),
-            "client_nonce_present": bool(client_nonce),
-            "proof_present": bool(presented_proof),
-        }
-        self._lanes[key] = record
+        record.details = _lane_details(
+            {},
+            requested_capabilities=requested_capabilities or [],
+            client_nonce_present=bool(client_nonce),
+            proof_present=bool(presented_proof),
+        )
+        self._put(key, record, seen_at=time.time())
+        await self._persist(key, record, write_through=True)
         return record
 
-    def heartbeat(
+    async def heartbeat(
         self,
         *,
         project_slug: str,
@@ -192,10 +703,14 @@ class SignalLaneRegistry:
         meta: Optional[Dict[str, Any]] = None,
     ) -> Optional[SignalHeartbeatResult]:
         key = self._lane_key(project_slug, lane_id)
-        record = self._lanes.get(key)
+        record = await self._resolve(key)
+        if record is not None and signal_secret and not record.verified:
+            # Proof is checked against the server nonce; use the one last stored.
+            record = await self._resolve(key, refresh=True)
         if record is None:
             return None
 
+        was_verified = record.verified
         proof_required = bool(signal_secret)
         verified_now = False
         accepted = True
@@ -227,21 +742,15 @@ class SignalLaneRegistry:
             verification_mode = "pending-secret"
 
         keepalive_recorded = bool(accepted)
+        status_changed = False
         if accepted:
             record.verified = record.verified or verified_now or (not proof_required)
-            record.heartbeat_count += 1
-            record.last_status = status.strip() or "ok"
-            record.last_seen_at = _utc_now_iso()
             record.server_nonce = secrets.token_hex(16)
-            record.details = {
-                **record.details,
-                **(meta or {}),
-                "client_nonce_present": bool(client_nonce),
-                "proof_present": bool(presented_proof),
-            }
+            status_changed = self._beat(key, record, status=status, meta=meta, client_nonce=client_nonce, presented_proof=presented_proof)
         record.proof_required = proof_required
         record.accepted = accepted
         record.verification_mode = verification_mode
+        await self._persist(key, record, write_through=record.verified != was_verified)
         return SignalHeartbeatResult(
             record=record,
             accepted=accepted,
@@ -249,16 +758,108 @@ class SignalLaneRegistry:
             verification_mode=verification_mode,
             proof_required=proof_required,
             keepalive_recorded=keepalive_recorded,
+            status_changed=status_changed,
         )
 
-    def list_lanes(self, project_slug: Optional[str] = None, limit: int = 50) -> list[dict[str, Any]]:
-        rows = []
-        for record in self._lanes.values():
-            if project_slug and record.project_slug != project_slug:
-                continue
-            rows.append(asdict(record))
-        rows.sort(key=lambda item: item["last_seen_at"], reverse=True)
-        return rows[:limit]
+    def _beat(
+        self,
+        key: Tuple[str, str],
+        record: SignalLaneRecord,
+        *,
+        status: str,
+        meta: Optional[Dict[str, Any]],
+        client_nonce: Optional[str],
+        presented_proof: Optional[str],
+    ) -> bool:
+        """Count an accepted heartbeat on ``record``; returns whether its status changed."""
+        new_status = sys.intern(_clip(status.strip(), _MAX_DETAIL_CHARS) or "ok")
+        # The handshake's own status does not count; only a change between heartbeats does.
+        status_changed = record.heartbeat_count > 0 and new_status != record.last_status
+        record.heartbeat_count += 1
+        record.last_status = new_status
+        record.details = _lane_details(
+            record.details,
+            meta=meta,
+            client_nonce_present=bool(client_nonce),
+            proof_present=bool(presented_proof),
+        )
+        self._put(key, record, seen_at=time.time())
+        return status_changed
+
+    async def ticket_heartbeat(
+        self,
+        *,
+        project_slug: str,
+        lane_id: str,
+        app_id: Optional[str],
+        instance_id: Optional[str],
+        verification_mode: str,
+        proof_required: bool,
+        status: str,
+        client_nonce: Optional[str],
+        presented_proof: Optional[str],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> SignalHeartbeatResult:
+        """
+        Heartbeat for a lane proven by a valid lane ticket.
+
+        A cached lane is updated without reading the store. On a miss (another
+        worker, an evicted lane) the stored lane is read once so its counters carry
+        on; only a lane missing from the store too is rebuilt from the ticket claims.
+        """
+        key = self._lane_key(project_slug, lane_id)
+        record = self._get(key)
+        if record is not None and self._expired(record):
+            self._drop(key, "expired")
+            record = None
+        if record is None:
+            record = await self._resolve(key)
+        if record is None:
+            record = SignalLaneRecord(
+                project_slug=key[0],
+                lane_id=lane_id,
+                app_id=_clip(app_id),
+                instance_id=_clip(instance_id),
+                last_status="verified",
+            )
+            self._count("ticket_rebuilt")
+        was_verified = record.verified
+        record.verified = True
+        record.accepted = True
+        record.verification_mode = verification_mode
+        record.proof_required = proof_required
+        status_changed = self._beat(key, record, status=status, meta=meta, client_nonce=client_nonce, presented_proof=presented_proof)
+        self._count("ticket_heartbeats")
+        await self._persist(key, record, write_through=not was_verified)
+        return SignalHeartbeatResult(
+            record=record,
+            accepted=True,
+            verified=True,
+            verification_mode=verification_mode,
+            proof_required=proof_required,
+            keepalive_recorded=True,
+            status_changed=status_changed,
+        )
+
+    def list_lanes(self, project_slug: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recently seen lanes first; reads only the ``limit`` newest index entries per project."""
+        if limit <= 0:
+            return []
+        if project_slug:
+            lanes = self._projects.get(project_slug.strip().lower())
+            sources = [lanes] if lanes is not None else []
+        else:
+            sources = list(self._projects.values())
+        # Loop-only, like every cache mutator: the eager copies cannot interleave with a heartbeat.
+        snapshots = [lanes.newest(limit) for lanes in sources]
+        newest = heapq.merge(*snapshots, key=lambda record: record.last_seen_at, reverse=True)
+        return [record.to_dict() for record in itertools.islice(newest, limit)]
+
+    def lane_count(self, project_slug: Optional[str] = None) -> int:
+        if project_slug:
+            lanes = self._projects.get(project_slug.strip().lower())
+            return len(lanes) if lanes is not None else 0
+        return self.cached_lane_count()
 
 
 signal_lane_registry = SignalLaneRegistry()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, Optional, Sequence
+
+from app.utils.async_exec import store_async
+from app.utils.sqlite_pool import resolve_db_path
+from app.utils.sqlite_schema import Migration, schema_registry
+from app.utils.storage_backend import get_storage_backend
+
+
+def _db_path() -> Path:
+    return resolve_db_path("ETHER_SIGNAL_DB_PATH")
+
+
+def _connect(*, write: bool = False) -> ContextManager[Any]:
+    return get_storage_backend().connection(_db_path(), write=write)
+
+
+SIGNAL_LANE_MIGRATIONS = (
+    Migration(
+        version=1,
+        name="baseline",
+        statements=(
+            """
+            create table if not exists signal_lanes (
+              project_slug text not null,
+              lane_id text not null,
+              display_lane_id text not null,
+              app_id text,
+              instance_id text,
+              domain text,
+              verified integer not null default 0,
+              verification_mode text not null,
+              proof_required integer not null default 0,
+              accepted integer not null default 1,
+              server_nonce text not null,
+              handshake_count integer not null default 0,
+              heartbeat_count integer not null default 0,
+              last_status text not null,
+              issued_at text not null,
+              last_seen_at text not null,
+              details_json text not null default '{}',
+              updated_at text not null,
+              primary key (project_slug, lane_id)
+            )
+            """,
+            "create index if not exists signal_lanes_seen_idx on signal_lanes (last_seen_at desc)",
+        ),
+    ),
+)
+
+schema_registry.register("signal_lane", _db_path, SIGNAL_LANE_MIGRATIONS)
+
+LANE_COLUMNS = (
+    "project_slug",
+    "lane_id",
+    "display_lane_id",
+    "app_id",
+    "instance_id",
+    "domain",
+    "verified",
+    "verification_mode",
+    "proof_required",
+    "accepted",
+    "server_nonce",
+    "handshake_count",
+    "heartbeat_count",
+    "last_status",
+    "issued_at",
+    "last_seen_at",
+    "details_json",
+    "updated_at",
+)
+
+_COUNTER_COLUMNS = ("handshake_count", "heartbeat_count")
+
+
+def _merge_column(column: str) -> str:
+    if column in _COUNTER_COLUMNS:
+        newer = f"excluded.{column} > signal_lanes.{column}"
+    else:
+        newer = "excluded.last_seen_at >= signal_lanes.last_seen_at"
+    return f"{column} = case when {newer} then excluded.{column} else signal_lanes.{column} end"
+
+
+# The copy seen most recently wins, but counters never move backwards when
+# workers flush copies of the same lane in any order.
+_UPSERT_SQL = f"""
+insert into signal_lanes ({", ".join(LANE_COLUMNS)})
+values ({", ".join("?" for _ in LANE_COLUMNS)})
+on conflict(project_slug, lane_id) do update set
+  {", ".join(_merge_column(column) for column in LANE_COLUMNS[2:])}
+"""
+
+
+def init_signal_lane_store() -> None:
+    schema_registry.ensure("signal_lane")
+
+
+def _details(raw: str) -> Dict[str, Any]:
+    try:
+        value = json.loads(raw or "{}")
+        return value if isinstance(value, dict) else {}
+    except Exception:
+        return {}
+
+
+def lane_row(lane: Dict[str, Any], *, updated_at: str) -> tuple:
+    """Store row for one lane dict (``SignalLaneRecord`` fields)."""
+    return (
+        lane["project_slug"].strip().lower(),
+        lane["lane_id"].strip().lower(),
+        lane["lane_id"],
+        lane.get("app_id"),
+        lane.get("instance_id"),
+        lane.get("domain"),
+        1 if lane.get("verified") else 0,
+        lane.get("verification_mode") or "pending-secret",
+        1 if lane.get("proof_required") else 0,
+        1 if lane.get("accepted", True) else 0,
+        lane["server_nonce"],
+        int(lane.get("handshake_count") or 0),
+        int(lane.get("heartbeat_count") or 0),
+        lane.get("last_status") or "bootstrapped",
+        lane["issued_at"],
+        lane["last_seen_at"],
+        json.dumps(lane.get("details") or {}, sort_keys=True, default=str),
+        updated_at,
+    )
+
+
+def save_signal_lanes(rows: Sequence[Sequence[Any]]) -> int:
+    if not rows:
+        return 0
+    schema_registry.ensure("signal_lane")
+    with _connect(write=True) as conn:
+        conn.executemany(_UPSERT_SQL, rows)
+    return len(rows)
+
+
+def load_signal_lane(project_slug: str, lane_id: str) -> Optional[Dict[str, Any]]:
+    schema_registry.ensure("signal_lane")
+    with _connect() as conn:
+        row = conn.execute(
+            "select * from signal_lanes where project_slug = ? and lane_id = ?",
+            (project_slug.strip().lower(), lane_id.strip().lower()),
+        ).fetchone()
+    return _row_to_lane(row) if row else None
+
+
+def load_recent_signal_lanes(*, limit: int = 10000, seen_since: Optional[str] = None) -> List[Dict[str, Any]]:
+    schema_registry.ensure("signal_lane")
+    where = "where last_seen_at >= ?" if seen_since else ""
+    params: List[Any] = [seen_since] if seen_since else []
+    with _connect() as conn:
+        rows = conn.execute(
+            f"select * from signal_lanes {where} order by last_seen_at desc limit ?",
+            [*params, max(1, int(limit))],
+        ).fetchall()
+    return [_row_to_lane(row) for row in rows]
+
+
+def prune_signal_lanes(*, seen_before: str) -> int:
+    """Delete lanes last seen before ``seen_before``; they can no longer resolve."""
+    schema_registry.ensure("signal_lane")
+    with _connect(write=True) as conn:
+        cursor = conn.execute("delete from signal_lanes where last_seen_at < ?", (seen_before,))
+        return max(0, int(cursor.rowcount or 0))
+
+
+save_signal_lanes_async = store_async(save_signal_lanes)
+load_signal_lane_async = store_async(load_signal_lane)
+load_recent_signal_lanes_async = store_async(load_recent_signal_lanes)
+prune_signal_lanes_async = store_async(prune_signal_lanes)
+
+
+def _row_to_lane(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "project_slug": row["project_slug"],
+        "lane_id": row["display_lane_id"],
+        "app_id": row["app_id"],
+        "instance_id": row["instance_id"],
+        "domain": row["domain"],
+        "verified": bool(row["verified"]),
+        "verification_mode": row["verification_mode"],
+        "proof_required": bool(row["proof_required"]),
+        "accepted": bool(row["accepted"]),
+        "server_nonce": row["server_nonce"],
+        "handshake_count": row["handshake_count"],
+        "heartbeat_count": row["heartbeat_count"],
+        "last_status": row["last_status"],
+        "issued_at": row["issued_at"],
+        "last_seen_at": row["last_seen_at"],
+        "details": _details(row["details_json"]),
+    }
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from app.utils.project_supabase_signal import (
+    ProjectSignalVerificationResult,
+    ProjectSignalWriteResult,
+    record_project_signals,
+)
+from app.utils.signal_keepalive import signal_keepalive
+from app.utils.signal_outbox_store import (
+    claim_due_signal_outbox_async,
+    dead_letter_signal_outbox_async,
+    delete_signal_outbox_async,
+    enqueue_signal_outbox_async,
+    list_signal_outbox_async,
+    redrive_signal_outbox_async,
+    reschedule_signal_outbox_async,
+    signal_outbox_snapshot_async,
+)
+from app.utils.signal_verifier import signal_verifier
+
+log = logging.getLogger("ether_v2.signal_outbox")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _age_seconds(created_at: Optional[str], now: datetime) -> Optional[float]:
+    if not created_at:
+        return None
+    try:
+        created = datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return round(max(0.0, (now - created).total_seconds()), 1)
+
+
+class SignalOutbox:
+    """
+    Durable retry queue for signal writes that failed.
+
+    When a heartbeat, manual or cron signal write fails both the RPC and the table
+    insert, the payload is stored in ``signal_outbox`` next to the failed run. A
+    background worker claims due items, writes them per project as one batch and,
+    on success, deletes them and records a new run through the verifier. A failed
+    retry is rescheduled with exponential backoff and jitter
+    (``ETHER_SIGNAL_OUTBOX_BACKOFF_SECONDS`` doubling up to
+    ``ETHER_SIGNAL_OUTBOX_BACKOFF_MAX_SECONDS``); after
+    ``ETHER_SIGNAL_OUTBOX_MAX_ATTEMPTS`` retries the item is dead-lettered and
+    stays in the table until an operator redrives it.
+
+    Every worker process runs its own loop; claiming an item leases it for
+    ``ETHER_SIGNAL_OUTBOX_LEASE_SECONDS``, so items are not retried twice and an
+    item claimed by a process that died becomes due again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._configure()
+        self._stats: Dict[str, Any] = {
+            "enqueued": 0,
+            "duplicates": 0,
+            "enqueue_errors": 0,
+            "attempts": 0,
+            "delivered": 0,
+            "retried": 0,
+            "dead_lettered": 0,
+            "redriven": 0,
+            "poll_errors": 0,
+            "last_delivered_at": None,
+            "last_error": None,
+        }
+
+    def _configure(self) -> None:
+        self.enabled = os.getenv("ETHER_SIGNAL_OUTBOX_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+        self.max_attempts = max(1, _int_env("ETHER_SIGNAL_OUTBOX_MAX_ATTEMPTS", 8))
+        self.backoff_seconds = max(1, _int_env("ETHER_SIGNAL_OUTBOX_BACKOFF_SECONDS", 5))
+        self.backoff_max_seconds = max(self.backoff_seconds, _int_env("ETHER_SIGNAL_OUTBOX_BACKOFF_MAX_SECONDS", 600))
+        self.poll_ms = max(50, _int_env("ETHER_SIGNAL_OUTBOX_POLL_MS", 2000))
+        self.batch_max = max(1, _int_env("ETHER_SIGNAL_OUTBOX_BATCH_MAX", 50))
+        self.lease_seconds = max(1, _int_env("ETHER_SIGNAL_OUTBOX_LEASE_SECONDS", 60))
+
+    def retry_delay(self, attempts: int) -> float:
+        """Seconds before the next retry after ``attempts`` retries: half fixed, half jitter."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_seconds * (2 ** min(max(0, attempts), 20)))
+        return random.uniform(ceiling / 2.0, ceiling)
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def _ensure_worker(self) -> None:
+        if not self.enabled:
+            return
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._worker = loop.create_task(self._run(), name="ether-signal-outbox")
+
+    async def capture(
+        self,
+        *,
+        project_slug: str,
+        payload: Dict[str, Any],
+        result: ProjectSignalVerificationResult,
+    ) -> Optional[Dict[str, Any]]:
+        """Store the payload of a failed write for retry; readback-only failures are not retried."""
+        write = result.write or {}
+        if not self.enabled or result.ok or write.get("ok") or not write.get("configured"):
+            return None
+        now = _utc_now()
+        try:
+            item = await enqueue_signal_outbox_async(
+                project_slug=project_slug,
+                payload=payload,
+                run_id=(result.run or {}).get("id"),
+                error=write.get("error") or result.error,
+                write_mode=write.get("mode"),
+                created_at=now.isoformat(),
+                next_attempt_at=(now + timedelta(seconds=self.retry_delay(0))).isoformat(),
+            )
+        except Exception as exc:
+            self._count("enqueue_errors")
+            log.warning("ether_signal_outbox_enqueue_failed=%s", exc)
+            return None
+        if not item:
+            self._count("duplicates")
+            return None
+        self._count("enqueued")
+        self._ensure_worker()
+        return item
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.drain_once()
+            except Exception as exc:
+                claimed = 0
+                self._count("poll_errors")
+                log.warning("ether_signal_outbox_poll_failed=%s", exc)
+            if claimed < self.batch_max:
+                await asyncio.sleep(self.poll_ms / 1000.0)
+
+    async def drain_once(self) -> int:
+        """Claim one batch of due items and retry it; returns the number claimed."""
+        now = _utc_now()
+        items = await claim_due_signal_outbox_async(
+            now=now.isoformat(),
+            lease_until=(now + timedelta(seconds=self.lease_seconds)).isoformat(),
+            limit=self.batch_max,
+        )
+        if not items:
+            return 0
+        by_project: Dict[str, List[Dict[str, Any]]] = {}
+        for item in items:
+            by_project.setdefault(item["project_slug"], []).append(item)
+        await asyncio.gather(*(self._retry(slug, project_items) for slug, project_items in by_project.items()))
+        return len(items)
+
+    async def _retry(self, project_slug: str, items: List[Dict[str, Any]]) -> None:
+        self._count("attempts", len(items))
+        payloads = [item["payload"] for item in items]
+        try:
+            write = await record_project_signals(project_slug=project_slug, payloads=payloads)
+        except Exception as exc:
+            write = ProjectSignalWriteResult(
+                attempted=True,
+                configured=True,
+                ok=False,
+                project_slug=project_slug,
+                mode="outbox_error",
+                error=str(exc)[:240] or exc.__class__.__name__,
+                batch_size=len(payloads),
+            )
+        if write.ok:
+            await delete_signal_outbox_async([item["id"] for item in items])
+            with self._lock:
+                self._stats["delivered"] += len(items)
+                self._stats["last_delivered_at"] = _utc_now().isoformat()
+            outcomes = await asyncio.gather(
+                *(signal_verifier.verify(project_slug=project_slug, payload=payload, write=write) for payload in payloads),
+                return_exceptions=True,
+            )
+            verifications: Set[str] = set()
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    log.warning("ether_signal_outbox_verify_failed=%s", outcome)
+                else:
+                    verifications.add(outcome.verification)
+            # One verified row proves the project active; only failed readbacks reopen the window.
+            if "verified" in verifications:
+                verification = "verified"
+            else:
+                verification = "failed" if verifications == {"failed"} else "deferred"
+            signal_keepalive.record_write(project_slug, verification=verification)
+            return
+
+        signal_keepalive.record_write(project_slug, verification="failed")
+        now = _utc_now()
+        error = write.error or "Signal write failed."
+        dead = [(now.isoformat(), error, write.mode, item["id"]) for item in items if item["attempts"] >= self.max_attempts]
+        retry = [
+            ((now + timedelta(seconds=self.retry_delay(item["attempts"]))).isoformat(), error, write.mode, item["id"])
+            for item in items
+            if item["attempts"] < self.max_attempts
+        ]
+        await dead_letter_signal_outbox_async(dead)
+        await reschedule_signal_outbox_async(retry)
+        with self._lock:
+            self._stats["retried"] += len(retry)
+            self._stats["dead_lettered"] += len(dead)
+            self._stats["last_error"] = error
+        if dead:
+            log.warning("ether_signal_outbox_dead_lettered project=%s count=%s error=%s", project_slug, len(dead), error)
+
+    async def redrive(self, *, project_slug: Optional[str] = None, ids: Optional[Sequence[int]] = None) -> int:
+        """Return dead-lettered items to the queue with a fresh attempt budget."""
+        count = await redrive_signal_outbox_async(now=_utc_now().isoformat(), project_slug=project_slug, ids=ids)
+        self._count("redriven", count)
+        if count:
+            self._ensure_worker()
+        return count
+
+    async def items(self, *, status: str = "dead", project_slug: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        return await list_signal_outbox_async(status=status, project_slug=project_slug, limit=limit)
+
+    async def snapshot(self, project_slug: Optional[str] = None) -> Dict[str, Any]:
+        """Outbox depth, dead letters and the age of the oldest pending item."""
+        try:
+            snapshot = await signal_outbox_snapshot_async(project_slug=project_slug)
+        except Exception as exc:
+            log.warning("ether_signal_outbox_snapshot_failed=%s", exc)
+            return {**self.stats(), "error": str(exc)[:240]}
+        now = _utc_now()
+        pending = snapshot["totals"].get("pending", {})
+        dead = snapshot["totals"].get("dead", {})
+        return {
+            **self.stats(),
+            "depth": pending.get("depth", 0),
+            "oldest_pending_age_seconds": _age_seconds(pending.get("oldest_created_at"), now),
+            "dead_letters": dead.get("depth", 0),
+            "oldest_dead_age_seconds": _age_seconds(dead.get("oldest_created_at"), now),
+            "by_project": {
+                slug: {
+                    "depth": statuses.get("pending", {}).get("depth", 0),
+                    "oldest_pending_age_seconds": _age_seconds(statuses.get("pending", {}).get("oldest_created_at"), now),
+                    "dead_letters": statuses.get("dead", {}).get("depth", 0),
+                }
+                for slug, statuses in snapshot["by_project"].items()
+            },
+        }
+
+    async def initialize(self) -> None:
+        """Start the retry worker; items left by a previous process are already durable."""
+        self._ensure_worker()
+
+    async def aclose(self) -> None:
+        """Stop the retry worker; unfinished items stay in the outbox and their lease expires."""
+        worker = self._worker
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._worker = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        return {
+            "enabled": self.enabled,
+            "running": self._worker is not None and not self._worker.done(),
+            "max_attempts": self.max_attempts,
+            "backoff_seconds": self.backoff_seconds,
+            "backoff_max_seconds": self.backoff_max_seconds,
+            "batch_max": self.batch_max,
+            **stats,
+        }
+
+
+signal_outbox = SignalOutbox()
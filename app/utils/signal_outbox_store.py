@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, Optional, Sequence, Tuple
+
+from app.utils.async_exec import store_async
+from app.utils.pagination import page_limit
+from app.utils.sqlite_pool import resolve_db_path
+from app.utils.sqlite_schema import Migration, schema_registry
+from app.utils.storage_backend import get_storage_backend
+
+OUTBOX_STATUSES = ("pending", "dead")
+
+
+def _db_path() -> Path:
+    return resolve_db_path("ETHER_SIGNAL_DB_PATH")
+
+
+def _connect(*, write: bool = False) -> ContextManager[Any]:
+    return get_storage_backend().connection(_db_path(), write=write)
+
+
+SIGNAL_OUTBOX_MIGRATIONS = (
+    Migration(
+        version=1,
+        name="baseline",
+        statements=(
+            """
+            create table if not exists signal_outbox (
+              id integer primary key autoincrement,
+              project_slug text not null,
+              signal_kind text not null,
+              lane_id text,
+              run_id integer,
+              status text not null default 'pending',
+              attempts integer not null default 0,
+              payload_json text not null,
+              last_error text,
+              last_write_mode text,
+              created_at text not null,
+              next_attempt_at text not null,
+              last_attempt_at text,
+              dead_at text
+            )
+            """,
+            "create index if not exists signal_outbox_due_idx on signal_outbox (status, next_attempt_at)",
+            "create index if not exists signal_outbox_status_idx on signal_outbox (status, created_at desc)",
+            "create index if not exists signal_outbox_project_idx on signal_outbox (project_slug, status, created_at desc)",
+        ),
+    ),
+    Migration(
+        version=2,
+        name="unique_write",
+        statements=(
+            "alter table signal_outbox add column received_at text",
+            "create unique index if not exists signal_outbox_write_uidx on signal_outbox (project_slug, lane_id, received_at)",
+        ),
+    ),
+)
+
+schema_registry.register("signal_outbox", _db_path, SIGNAL_OUTBOX_MIGRATIONS)
+
+
+def init_signal_outbox_store() -> None:
+    schema_registry.ensure("signal_outbox")
+
+
+def enqueue_signal_outbox(
+    *,
+    project_slug: str,
+    payload: Dict[str, Any],
+    run_id: Optional[int],
+    error: Optional[str],
+    write_mode: Optional[str],
+    created_at: str,
+    next_attempt_at: str,
+) -> Dict[str, Any]:
+    """Store one failed write; a write already in the outbox (same lane and ``received_at``) is skipped."""
+    schema_registry.ensure("signal_outbox")
+    with _connect(write=True) as conn:
+        row = conn.execute(
+            """
+            insert into signal_outbox (
+              project_slug, signal_kind, lane_id, run_id, status, attempts, payload_json,
+              last_error, last_write_mode, created_at, next_attempt_at, received_at
+            ) values (?, ?, ?, ?, 'pending', 0, ?, ?, ?, ?, ?, ?)
+            on conflict do nothing
+            returning *
+            """,
+            (
+                project_slug.strip().lower(),
+                str(payload.get("signal_kind") or "unknown"),
+                str(payload.get("lane_id")) if payload.get("lane_id") is not None else None,
+                run_id,
+                json.dumps(payload, sort_keys=True, default=str),
+                error,
+                write_mode,
+                created_at,
+                next_attempt_at,
+                str(payload.get("received_at")) if payload.get("received_at") is not None else None,
+            ),
+        ).fetchone()
+    return _row_to_item(row) if row else {}
+
+
+def claim_due_signal_outbox(*, now: str, lease_until: str, limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    Claim pending items whose ``next_attempt_at`` has passed.
+
+    Claiming counts the attempt and pushes ``next_attempt_at`` to ``lease_until``
+    in the same statement, so another worker does not pick the item up, and an
+    item whose worker died mid-attempt becomes due again once the lease expires.
+    """
+    schema_registry.ensure("signal_outbox")
+    with _connect(write=True) as conn:
+        rows = conn.execute(
+            """
+            update signal_outbox set attempts = attempts + 1, last_attempt_at = ?, next_attempt_at = ?
+            where id in (
+              select id from signal_outbox
+              where status = 'pending' and next_attempt_at <= ?
+              order by next_attempt_at
+              limit ?
+            ) and status = 'pending' and next_attempt_at <= ?
+            returning *
+            """,
+            (now, lease_until, now, max(1, int(limit)), now),
+        ).fetchall()
+    return sorted((_row_to_item(row) for row in rows), key=lambda item: item["id"])
+
+
+def delete_signal_outbox(ids: Sequence[int]) -> int:
+    """Remove delivered items."""
+    if not ids:
+        return 0
+    schema_registry.ensure("signal_outbox")
+    placeholders = ", ".join("?" for _ in ids)
+    with _connect(write=True) as conn:
+        cursor = conn.execute(f"delete from signal_outbox where id in ({placeholders})", list(ids))
+        return max(0, int(cursor.rowcount or 0))
+
+
+def reschedule_signal_outbox(rows: Sequence[Tuple[str, Optional[str], Optional[str], int]]) -> int:
+    """Set ``(next_attempt_at, last_error, last_write_mode, id)`` for items that failed again."""
+    if not rows:
+        return 0
+    schema_registry.ensure("signal_outbox")
+    with _connect(write=True) as conn:
+        conn.executemany(
+            "update signal_outbox set next_attempt_at = ?, last_error = ?, last_write_mode = ? where id = ? and status = 'pending'",
+            rows,
+        )
+    return len(rows)
+
+
+def dead_letter_signal_outbox(rows: Sequence[Tuple[str, Optional[str], Optional[str], int]]) -> int:
+    """Set ``(dead_at, last_error, last_write_mode, id)`` for items out of attempts."""
+    if not rows:
+        return 0
+    schema_registry.ensure("signal_outbox")
+    with _connect(write=True) as conn:
+        conn.executemany(
+            "update signal_outbox set status = 'dead', dead_at = ?, last_error = ?, last_write_mode = ? where id = ? and status = 'pending'",
+            rows,
+        )
+    return len(rows)
+
+
+def redrive_signal_outbox(
+    *,
+    now: str,
+    project_slug: Optional[str] = None,
+    ids: Optional[Sequence[int]] = None,
+) -> int:
+    """Move dead-lettered items back to ``pending`` with a fresh attempt budget."""
+    schema_registry.ensure("signal_outbox")
+    clauses = ["status = 'dead'"]
+    params: List[Any] = [now]
+    if project_slug:
+        clauses.append("project_slug = ?")
+        params.append(project_slug.strip().lower())
+    if ids:
+        clauses.append(f"id in ({', '.join('?' for _ in ids)})")
+        params.extend(int(item) for item in ids)
+    with _connect(write=True) as conn:
+        cursor = conn.execute(
+            f"""
+            update signal_outbox set status = 'pending', attempts = 0, next_attempt_at = ?, dead_at = null
+            where {" and ".join(clauses)}
+            """,
+            params,
+        )
+        return max(0, int(cursor.rowcount or 0))
+
+
+def list_signal_outbox(
+    *,
+    status: str = "dead",
+    project_slug: Optional[str] = None,
+    limit: int = 50,
+) -> List[Dict[str, Any]]:
+    schema_registry.ensure("signal_outbox")
+    clauses = ["status = ?"]
+    params: List[Any] = [status]
+    if project_slug:
+        clauses.append("project_slug = ?")
+        params.append(project_slug.strip().lower())
+    with _connect() as conn:
+        rows = conn.execute(
+            f"select * from signal_outbox where {' and '.join(clauses)} order by created_at desc limit ?",
+            [*params, page_limit(limit)],
+        ).fetchall()
+    return [_row_to_item(row) for row in rows]
+
+
+def signal_outbox_snapshot(*, project_slug: Optional[str] = None) -> Dict[str, Any]:
+    """Depth and oldest ``created_at`` per status, overall and per project."""
+    schema_registry.ensure("signal_outbox")
+    where = "where project_slug = ?" if project_slug else ""
+    params: List[Any] = [project_slug.strip().lower()] if project_slug else []
+    with _connect() as conn:
+        rows = conn.execute(
+            f"""
+            select project_slug, status, count(*) as depth, min(created_at) as oldest_created_at
+            from signal_outbox {where}
+            group by project_slug, status
+            """,
+            params,
+        ).fetchall()
+    by_project: Dict[str, Dict[str, Any]] = {}
+    totals: Dict[str, Dict[str, Any]] = {status: {"depth": 0, "oldest_created_at": None} for status in OUTBOX_STATUSES}
+    for row in rows:
+        status = row["status"]
+        entry = {"depth": int(row["depth"]), "oldest_created_at": row["oldest_created_at"]}
+        by_project.setdefault(row["project_slug"], {})[status] = entry
+        total = totals.setdefault(status, {"depth": 0, "oldest_created_at": None})
+        total["depth"] += entry["depth"]
+        if entry["oldest_created_at"] and (total["oldest_created_at"] is None or entry["oldest_created_at"] < total["oldest_created_at"]):
+            total["oldest_created_at"] = entry["oldest_created_at"]
+    return {"totals": totals, "by_project": by_project}
+
+
+enqueue_signal_outbox_async = store_async(enqueue_signal_outbox)
+claim_due_signal_outbox_async = store_async(claim_due_signal_outbox)
+delete_signal_outbox_async = store_async(delete_signal_outbox)
+reschedule_signal_outbox_async = store_async(reschedule_signal_outbox)
+dead_letter_signal_outbox_async = store_async(dead_letter_signal_outbox)
+redrive_signal_outbox_async = store_async(redrive_signal_outbox)
+list_signal_outbox_async = store_async(list_signal_outbox)
+signal_outbox_snapshot_async = store_async(signal_outbox_snapshot)
+
+
+def _payload(raw: str) -> Dict[str, Any]:
+    try:
+        value = json.loads(raw or "{}")
+        return value if isinstance(value, dict) else {}
+    except Exception:
+        return {}
+
+
+def _row_to_item(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "project_slug": row["project_slug"],
+        "signal_kind": row["signal_kind"],
+        "lane_id": row["lane_id"],
+        "run_id": row["run_id"],
+        "status": row["status"],
+        "attempts": row["attempts"],
+        "payload": _payload(row["payload_json"]),
+        "last_error": row["last_error"],
+        "last_write_mode": row["last_write_mode"],
+        "created_at": row["created_at"],
+        "next_attempt_at": row["next_attempt_at"],
+        "last_attempt_at": row["last_attempt_at"],
+        "dead_at": row["dead_at"],
+    }
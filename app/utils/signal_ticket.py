@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.projects import ProjectRecord, get_project
+
+TICKET_VERSION = "v1"
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+@dataclass(frozen=True)
+class LaneTicketClaims:
+    project_slug: str
+    lane_id: str
+    app_id: Optional[str]
+    instance_id: Optional[str]
+    verified: bool
+    verification_mode: str
+    proof_required: bool
+    epoch: str
+    issued_at: int
+    expires_at: int
+
+
+@dataclass(frozen=True)
+class LaneTicketCheck:
+    status: str
+    claims: Optional[LaneTicketClaims] = None
+    project: Optional[ProjectRecord] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.status == "valid"
+
+
+class LaneTicketSigner:
+    """
+    Stateless, HMAC-signed lane tickets.
+
+    A handshake (or a heartbeat) that leaves a lane accepted and verified is
+    answered with a ticket ``v1.<claims>.<signature>`` naming the project, lane,
+    app, instance and verification state, with an expiry of
+    ``ETHER_SIGNAL_TICKET_TTL_SECONDS``. A heartbeat presenting a valid ticket is
+    checked with CPU work only, on any worker and across restarts, without
+    resolving the project or reading the lane from the store.
+
+    The signing key is derived per project from ``ETHER_SIGNAL_TICKET_SECRET``
+    (default ``ETHER_INTERNAL_TOKEN``), the project's ticket epoch
+    (``<PROJECT>_SIGNAL_TICKET_EPOCH``, default ``ETHER_SIGNAL_TICKET_EPOCH``) and a
+    fingerprint of the project's signal secret. Bumping the epoch or rotating the
+    signal secret revokes every outstanding ticket of that project;
+    ``ETHER_SIGNAL_TICKET_SECRET_PREVIOUS`` is still accepted while the master
+    secret rotates. Without a master secret no tickets are issued.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._configure()
+        self._stats: Dict[str, int] = {
+            "issued": 0,
+            "valid": 0,
+            "expired": 0,
+            "revoked": 0,
+            "mismatch": 0,
+            "invalid": 0,
+        }
+
+    def _configure(self) -> None:
+        self.ttl_seconds = max(60, _int_env("ETHER_SIGNAL_TICKET_TTL_SECONDS", 3600))
+        current = os.getenv("ETHER_SIGNAL_TICKET_SECRET", "").strip() or os.getenv("ETHER_INTERNAL_TOKEN", "").strip()
+        previous = os.getenv("ETHER_SIGNAL_TICKET_SECRET_PREVIOUS", "").strip()
+        self._master_keys: List[bytes] = [key.encode("utf-8") for key in (current, previous) if key]
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._master_keys)
+
+    @staticmethod
+    def epoch(project_slug: str) -> str:
+        value = os.getenv(f"{project_slug.strip().upper()}_SIGNAL_TICKET_EPOCH", "").strip()
+        return value or os.getenv("ETHER_SIGNAL_TICKET_EPOCH", "0").strip() or "0"
+
+    @staticmethod
+    def _project_key(master: bytes, project: ProjectRecord, epoch: str) -> bytes:
+        secret = project.signal_secret_value or ""
+        fingerprint = hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16] if secret else "-"
+        material = f"ether-lane-ticket|{project.slug}|{epoch}|{fingerprint}".encode("utf-8")
+        return hmac.new(master, material, hashlib.sha256).digest()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def issue(
+        self,
+        project: ProjectRecord,
+        *,
+        lane_id: str,
+        app_id: Optional[str],
+        instance_id: Optional[str],
+        verification_mode: str,
+        proof_required: bool,
+    ) -> Optional[Tuple[str, str]]:
+        """A signed ticket for a verified lane and its ISO expiry; ``None`` when tickets are disabled."""
+        if not self.enabled:
+            return None
+        now = int(time.time())
+        epoch = self.epoch(project.slug)
+        body = {
+            "p": project.slug,
+            "l": lane_id,
+            "a": app_id,
+            "i": instance_id,
+            "v": True,
+            "m": verification_mode,
+            "r": proof_required,
+            "e": epoch,
+            "iat": now,
+            "exp": now + self.ttl_seconds,
+        }
+        signed = f"{TICKET_VERSION}.{_b64encode(json.dumps(body, separators=(',', ':')).encode('utf-8'))}"
+        signature = hmac.new(self._project_key(self._master_keys[0], project, epoch), signed.encode("ascii"), hashlib.sha256).digest()
+        self._count("issued")
+        expires_at = datetime.fromtimestamp(now + self.ttl_seconds, tz=timezone.utc).isoformat()
+        return f"{signed}.{_b64encode(signature)}", expires_at
+
+    def verify(self, token: Optional[str], *, lane_id: str, project_slug: Optional[str] = None) -> LaneTicketCheck:
+        if not token:
+            return LaneTicketCheck(status="absent")
+        if not self.enabled:
+            return LaneTicketCheck(status="disabled")
+        check = self._verify(token.strip(), lane_id=lane_id, project_slug=project_slug)
+        self._count(check.status)
+        return check
+
+    def _verify(self, token: str, *, lane_id: str, project_slug: Optional[str]) -> LaneTicketCheck:
+        try:
+            version, body_b64, signature_b64 = token.split(".")
+            if version != TICKET_VERSION:
+                return LaneTicketCheck(status="invalid")
+            body = json.loads(_b64decode(body_b64))
+            signature = _b64decode(signature_b64)
+            claims = LaneTicketClaims(
+                project_slug=str(body["p"]),
+                lane_id=str(body["l"]),
+                app_id=body.get("a"),
+                instance_id=body.get("i"),
+                verified=bool(body.get("v")),
+                verification_mode=str(body.get("m") or "proof-verified"),
+                proof_required=bool(body.get("r")),
+                epoch=str(body.get("e") or "0"),
+                issued_at=int(body["iat"]),
+                expires_at=int(body["exp"]),
+            )
+        except (ValueError, KeyError, TypeError):
+            return LaneTicketCheck(status="invalid")
+
+        project = get_project(claims.project_slug)
+        if project is None:
+            return LaneTicketCheck(status="invalid")
+        signed = f"{version}.{body_b64}".encode("ascii")
+        if not any(
+            hmac.compare_digest(hmac.new(self._project_key(master, project, claims.epoch), signed, hashlib.sha256).digest(), signature)
+            for master in self._master_keys
+        ):
+            return LaneTicketCheck(status="invalid")
+        if claims.epoch != self.epoch(project.slug):
+            return LaneTicketCheck(status="revoked", claims=claims)
+        if claims.expires_at <= time.time():
+            return LaneTicketCheck(status="expired", claims=claims)
+        if not claims.verified or claims.lane_id.strip().lower() != lane_id.strip().lower():
+            return LaneTicketCheck(status="mismatch", claims=claims)
+        if project_slug and project_slug.strip().lower() != project.slug:
+            return LaneTicketCheck(status="mismatch", claims=claims)
+        return LaneTicketCheck(status="valid", claims=claims, project=project)
+
+    def should_renew(self, claims: LaneTicketClaims) -> bool:
+        """Renew once a ticket is past half its lifetime, so active lanes never present an expired one."""
+        return claims.expires_at - time.time() < (claims.expires_at - claims.issued_at) / 2
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        return {"enabled": self.enabled, "ttl_seconds": self.ttl_seconds, **stats}
+
+
+lane_tickets = LaneTicketSigner()
@@ -1,34 +1,37 @@
 from __future__ import annotations
 
 import json
-import os
 import sqlite3
-from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Sequence
+
+from app.utils.async_exec import store_async
+from app.utils.pagination import Keyset, keyset_clauses, page_limit
+from app.utils.sqlite_pool import resolve_db_path
+from app.utils.sqlite_schema import Migration, schema_registry
+from app.utils.storage_backend import get_storage_backend
+from app.utils.store_counters import counter_statements, counter_trigger_statements, read_counters
 
 
 def _db_path() -> Path:
-    raw = os.getenv("ETHER_SIGNAL_DB_PATH", os.getenv("ETHER_AUDIT_DB_PATH", "runtime/ether_audit.sqlite3")).strip() or "runtime/ether_audit.sqlite3"
-    path = Path(raw)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return path
+    return resolve_db_path("ETHER_SIGNAL_DB_PATH")
 
 
-@contextmanager
-def _connect() -> Iterator[sqlite3.Connection]:
-    conn = sqlite3.connect(_db_path())
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+def _connect(*, write: bool = False) -> ContextManager[Any]:
+    return get_storage_backend().connection(_db_path(), write=write)
 
 
-def init_signal_verification_store() -> None:
-    with _connect() as conn:
-        conn.execute(
+# Runs whose readback has not settled: "pending" waits for the deferred verifier,
+# "written" was not sampled for readback. Neither counts as a success or a failure.
+UNSETTLED_STATUSES = ("pending", "written")
+_UNSETTLED_SQL = ", ".join(f"'{status}'" for status in UNSETTLED_STATUSES)
+
+SIGNAL_VERIFICATION_MIGRATIONS = (
+    Migration(
+        version=1,
+        name="baseline",
+        statements=(
             """
             create table if not exists signal_runs (
               id integer primary key autoincrement,
@@ -49,11 +52,127 @@ def init_signal_verification_store() -> None:
               payload_summary_json text not null default '{}',
               recorded_at text not null
             )
+            """,
+            "create index if not exists signal_runs_project_recorded_idx on signal_runs (project_slug, recorded_at desc)",
+            "create index if not exists signal_runs_status_idx on signal_runs (status, recorded_at desc)",
+            "create index if not exists signal_runs_verified_idx on signal_runs (verified_ok, recorded_at desc)",
+        ),
+    ),
+    Migration(
+        version=2,
+        name="keyset_pagination_indexes",
+        statements=(
+            "create index if not exists signal_runs_recorded_idx on signal_runs (recorded_at desc)",
+        ),
+    ),
+    Migration(
+        version=3,
+        name="signal_counters",
+        statements=(
+            *counter_statements(
+                table="signal_runs",
+                counter_table="signal_counters",
+                ts_column="recorded_at",
+                project="{row}.project_slug",
+                dimensions={
+                    "status": "{row}.status",
+                    "verified": "case when {row}.verified_ok <> 0 then 'ok' else 'failed' end",
+                },
+            ),
             """
-        )
-        conn.execute("create index if not exists signal_runs_project_recorded_idx on signal_runs (project_slug, recorded_at desc)")
-        conn.execute("create index if not exists signal_runs_status_idx on signal_runs (status, recorded_at desc)")
-        conn.execute("create index if not exists signal_runs_verified_idx on signal_runs (verified_ok, recorded_at desc)")
+            create table if not exists signal_run_latest (
+              project_slug text not null,
+              outcome text not null,
+              run_id integer not null,
+              recorded_at text not null,
+              primary key (project_slug, outcome)
+            ) without rowid
+            """,
+            """
+            create trigger if not exists signal_runs_latest_insert after insert on signal_runs
+            begin
+              insert into signal_run_latest (project_slug, outcome, run_id, recorded_at)
+              values (new.project_slug, case when new.verified_ok <> 0 then 'success' else 'failure' end, new.id, new.recorded_at)
+              on conflict(project_slug, outcome) do update set run_id = excluded.run_id, recorded_at = excluded.recorded_at
+              where excluded.recorded_at >= signal_run_latest.recorded_at;
+            end
+            """,
+            """
+            insert into signal_run_latest (project_slug, outcome, run_id, recorded_at)
+            select r.project_slug, case when r.verified_ok <> 0 then 'success' else 'failure' end, r.id, r.recorded_at
+            from signal_runs r
+            where not exists (
+              select 1 from signal_runs n
+              where n.project_slug = r.project_slug
+                and (n.verified_ok <> 0) = (r.verified_ok <> 0)
+                and (n.recorded_at > r.recorded_at or (n.recorded_at = r.recorded_at and n.id > r.id))
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=4,
+        name="deferred_verification",
+        statements=(
+            "alter table signal_runs add column verified_at text",
+            "alter table signal_runs add column verification_lag_ms integer",
+            # Rebuilt so unsettled runs are counted apart and never become the latest failure.
+            "drop trigger if exists signal_runs_counters_insert",
+            "drop trigger if exists signal_runs_latest_insert",
+            *counter_trigger_statements(
+                table="signal_runs",
+                counter_table="signal_counters",
+                ts_column="recorded_at",
+                project="{row}.project_slug",
+                dimensions={
+                    "status": "{row}.status",
+                    "verified": (
+                        "case when {row}.verified_ok <> 0 then 'ok' "
+                        f"when {{row}}.status in ({_UNSETTLED_SQL}) then 'unsettled' else 'failed' end"
+                    ),
+                },
+                mutable=("status",),
+            ),
+            f"""
+            create trigger if not exists signal_runs_latest_insert after insert on signal_runs
+            when new.status not in ({_UNSETTLED_SQL})
+            begin
+              insert into signal_run_latest (project_slug, outcome, run_id, recorded_at)
+              values (new.project_slug, case when new.verified_ok <> 0 then 'success' else 'failure' end, new.id, new.recorded_at)
+              on conflict(project_slug, outcome) do update set run_id = excluded.run_id, recorded_at = excluded.recorded_at
+              where excluded.recorded_at >= signal_run_latest.recorded_at;
+            end
+            """,
+            f"""
+            create trigger if not exists signal_runs_latest_update_status after update of status on signal_runs
+            when old.status is not new.status and new.status not in ({_UNSETTLED_SQL})
+            begin
+              insert into signal_run_latest (project_slug, outcome, run_id, recorded_at)
+              values (new.project_slug, case when new.verified_ok <> 0 then 'success' else 'failure' end, new.id, new.recorded_at)
+              on conflict(project_slug, outcome) do update set run_id = excluded.run_id, recorded_at = excluded.recorded_at
+              where excluded.recorded_at >= signal_run_latest.recorded_at;
+            end
+            """,
+        ),
+    ),
+    Migration(
+        version=5,
+        name="stage_latency",
+        statements=(
+            "alter table signal_runs add column rpc_ms real",
+            "alter table signal_runs add column table_ms real",
+            "alter table signal_runs add column readback_ms real",
+            # Covers the per-project latency window read, so it never touches the run rows.
+            "create index if not exists signal_runs_latency_idx on signal_runs (project_slug, recorded_at, rpc_ms, table_ms, readback_ms)",
+        ),
+    ),
+)
+
+schema_registry.register("signal_verification", _db_path, SIGNAL_VERIFICATION_MIGRATIONS)
+
+
+def init_signal_verification_store() -> None:
+    schema_registry.ensure("signal_verification")
 
 
 def _json(value: Dict[str, Any]) -> str:
@@ -86,16 +205,23 @@ def save_signal_run(
     readback_result: Dict[str, Any],
     payload_summary: Dict[str, Any],
     recorded_at: str,
+    verified_at: Optional[str] = None,
+    verification_lag_ms: Optional[int] = None,
+    rpc_ms: Optional[float] = None,
+    table_ms: Optional[float] = None,
+    readback_ms: Optional[float] = None,
 ) -> Dict[str, Any]:
-    init_signal_verification_store()
-    with _connect() as conn:
+    schema_registry.ensure("signal_verification")
+    with _connect(write=True) as conn:
         cursor = conn.execute(
             """
             insert into signal_runs (
               project_slug, signal_kind, lane_id, status, write_ok, readback_ok, verified_ok,
               write_mode, write_target, readback_mode, readback_target, error,
-              write_result_json, readback_result_json, payload_summary_json, recorded_at
-            ) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+              write_result_json, readback_result_json, payload_summary_json, recorded_at,
+              verified_at, verification_lag_ms, rpc_ms, table_ms, readback_ms
+            ) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            returning *
             """,
             (
                 project_slug.strip().lower(),
@@ -114,19 +240,79 @@ def save_signal_run(
                 _json(readback_result),
                 _json(payload_summary),
                 recorded_at,
+                verified_at,
+                verification_lag_ms,
+                rpc_ms,
+                table_ms,
+                readback_ms,
             ),
         )
-        row = conn.execute("select * from signal_runs where id = ?", (cursor.lastrowid,)).fetchone()
+        row = cursor.fetchone()
+    return _row_to_signal_run(row) if row else {}
+
+
+def update_signal_run_verification(
+    run_id: int,
+    *,
+    readback_ok: bool,
+    verified_ok: bool,
+    readback_mode: Optional[str],
+    readback_target: Optional[str],
+    error: Optional[str],
+    readback_result: Dict[str, Any],
+    verified_at: str,
+    verification_lag_ms: Optional[int],
+    readback_ms: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Settle a pending run with its deferred readback; settled runs are left alone."""
+    schema_registry.ensure("signal_verification")
+    with _connect(write=True) as conn:
+        row = conn.execute(
+            """
+            update signal_runs set
+              status = ?, readback_ok = ?, verified_ok = ?, readback_mode = ?, readback_target = ?,
+              error = ?, readback_result_json = ?, verified_at = ?, verification_lag_ms = ?, readback_ms = ?
+            where id = ? and status = 'pending'
+            returning *
+            """,
+            (
+                "verified" if verified_ok else "failed",
+                1 if readback_ok else 0,
+                1 if verified_ok else 0,
+                readback_mode,
+                readback_target,
+                error,
+                _json(readback_result),
+                verified_at,
+                verification_lag_ms,
+                readback_ms,
+                run_id,
+            ),
+        ).fetchone()
     return _row_to_signal_run(row) if row else {}
 
 
+def list_pending_signal_runs(*, limit: int = 500) -> List[Dict[str, Any]]:
+    """Runs still waiting for a deferred readback, newest first."""
+    schema_registry.ensure("signal_verification")
+    with _connect() as conn:
+        rows = conn.execute(
+            "select * from signal_runs where status = ? order by recorded_at desc limit ?",
+            ("pending", page_limit(limit)),
+        ).fetchall()
+    return [_row_to_signal_run(row) for row in rows]
+
+
 def list_signal_runs(
     *,
     project_slug: Optional[str] = None,
     verified_ok: Optional[bool] = None,
     limit: int = 50,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    init_signal_verification_store()
+    schema_registry.ensure("signal_verification")
     clauses: list[str] = []
     params: list[Any] = []
     if project_slug:
@@ -135,44 +321,132 @@ def list_signal_runs(
     if verified_ok is not None:
         clauses.append("verified_ok = ?")
         params.append(1 if verified_ok else 0)
+    keyset, keyset_params = keyset_clauses("recorded_at", before=before, since=since, until=until)
+    clauses.extend(keyset)
+    params.extend(keyset_params)
     where = f"where {' and '.join(clauses)}" if clauses else ""
-    params.append(max(1, min(limit, 500)))
+    params.append(page_limit(limit))
     with _connect() as conn:
         rows = conn.execute(f"select * from signal_runs {where} order by recorded_at desc, id desc limit ?", params).fetchall()
     return [_row_to_signal_run(row) for row in rows]
 
 
 def signal_verification_snapshot(project_slug: Optional[str] = None) -> Dict[str, Any]:
-    runs = list_signal_runs(project_slug=project_slug, limit=200)
-    project_counts: Dict[str, int] = {}
-    verified_counts: Dict[str, int] = {"ok": 0, "failed": 0}
-    status_counts: Dict[str, int] = {}
+    runs = list_signal_runs(project_slug=project_slug, limit=25)
     last_success_by_project: Dict[str, Dict[str, Any]] = {}
     last_failure_by_project: Dict[str, Dict[str, Any]] = {}
+    where = "where l.project_slug = ?" if project_slug else ""
+    params = [project_slug.strip().lower()] if project_slug else []
+    with _connect() as conn:
+        counters = read_counters(conn, "signal_counters", project_slug=project_slug)
+        latest = conn.execute(
+            f"select l.outcome, r.* from signal_run_latest l join signal_runs r on r.id = l.run_id {where}",
+            params,
+        ).fetchall()
+    for row in latest:
+        target = last_success_by_project if row["outcome"] == "success" else last_failure_by_project
+        target[row["project_slug"]] = _row_to_signal_run(row)
 
-    for run in runs:
-        slug = run["project_slug"]
-        project_counts[slug] = project_counts.get(slug, 0) + 1
-        status_counts[run["status"]] = status_counts.get(run["status"], 0) + 1
-        if run["verified_ok"]:
-            verified_counts["ok"] += 1
-            last_success_by_project.setdefault(slug, run)
-        else:
-            verified_counts["failed"] += 1
-            last_failure_by_project.setdefault(slug, run)
-
+    window = counters["window"]
     return {
         "project_slug": project_slug,
-        "run_count": len(runs),
-        "project_counts": project_counts,
-        "verified_counts": verified_counts,
-        "status_counts": status_counts,
+        "run_count": counters["total"],
+        "project_counts": counters["projects"],
+        "verified_counts": {"ok": 0, "failed": 0, "unsettled": 0, **counters["lifetime"].get("verified", {})},
+        "status_counts": counters["lifetime"].get("status", {}),
+        "window": {
+            "days": counters["window_days"],
+            "run_count": counters["window_total"],
+            "verified_counts": {"ok": 0, "failed": 0, "unsettled": 0, **window.get("verified", {})},
+            "status_counts": window.get("status", {}),
+        },
         "last_success_by_project": last_success_by_project,
         "last_failure_by_project": last_failure_by_project,
-        "recent_runs": runs[:25],
+        "recent_runs": runs,
+    }
+
+
+def _percentiles(values: List[float]) -> Dict[str, Any]:
+    if not values:
+        return {"samples": 0, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(values)
+
+    def rank(quantile: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * quantile))], 1)
+
+    return {
+        "samples": len(ordered),
+        "p50_ms": rank(0.50),
+        "p95_ms": rank(0.95),
+        "p99_ms": rank(0.99),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+def _latency_window(rows: List[Any]) -> Dict[str, Any]:
+    writes = [row for row in rows if row["rpc_ms"] is not None or row["table_ms"] is not None]
+    fallbacks = sum(1 for row in writes if row["table_ms"] is not None)
+    return {
+        "writes": len(writes),
+        "table_fallbacks": fallbacks,
+        "table_fallback_share": round(fallbacks / len(writes), 4) if writes else 0.0,
+        "rpc": _percentiles([row["rpc_ms"] for row in rows if row["rpc_ms"] is not None]),
+        "table": _percentiles([row["table_ms"] for row in rows if row["table_ms"] is not None]),
+        "readback": _percentiles([row["readback_ms"] for row in rows if row["readback_ms"] is not None]),
     }
 
 
+def signal_latency_snapshot(
+    *,
+    project_slugs: Sequence[str],
+    windows_minutes: Sequence[int] = (15, 60, 1440),
+    sample_max: int = 5000,
+) -> Dict[str, Any]:
+    """
+    Per-project p50/p95/p99 latency of the RPC, table fallback and readback stages
+    over rolling windows, plus the share of writes that needed the table fallback.
+
+    Each project's runs in the widest window are read once from the covering
+    latency index, newest first and at most ``sample_max`` of them; narrower
+    windows are cut from the same rows. Runs of a batched write each carry the
+    batch's write latency.
+    """
+    schema_registry.ensure("signal_verification")
+    now = datetime.now(timezone.utc)
+    windows = sorted({max(1, int(minutes)) for minutes in windows_minutes}) or [60]
+    cutoffs = {minutes: (now - timedelta(minutes=minutes)).isoformat() for minutes in windows}
+    limit = max(1, int(sample_max))
+    projects: Dict[str, Dict[str, Any]] = {}
+    with _connect() as conn:
+        for slug in sorted({slug.strip().lower() for slug in project_slugs if slug.strip()}):
+            rows = conn.execute(
+                """
+                select recorded_at, rpc_ms, table_ms, readback_ms from signal_runs
+                where project_slug = ? and recorded_at >= ?
+                order by recorded_at desc limit ?
+                """,
+                (slug, cutoffs[windows[-1]], limit),
+            ).fetchall()
+            projects[slug] = {
+                "sampled_runs": len(rows),
+                "sample_truncated": len(rows) >= limit,
+                "windows": {
+                    f"{minutes}m": _latency_window([row for row in rows if row["recorded_at"] >= cutoffs[minutes]])
+                    for minutes in windows
+                },
+            }
+    return {"windows_minutes": windows, "sample_max": limit, "projects": projects}
+
+
+# Async variants for request handlers: the blocking call runs on the store executor.
+save_signal_run_async = store_async(save_signal_run)
+list_signal_runs_async = store_async(list_signal_runs)
+signal_verification_snapshot_async = store_async(signal_verification_snapshot)
+update_signal_run_verification_async = store_async(update_signal_run_verification)
+list_pending_signal_runs_async = store_async(list_pending_signal_runs)
+signal_latency_snapshot_async = store_async(signal_latency_snapshot)
+
+
 def _row_to_signal_run(row: sqlite3.Row) -> Dict[str, Any]:
     return {
         "id": row["id"],
@@ -192,4 +466,9 @@ def _row_to_signal_run(row: sqlite3.Row) -> Dict[str, Any]:
         "readback_result": _details(row["readback_result_json"]),
         "payload_summary": _details(row["payload_summary_json"]),
         "recorded_at": row["recorded_at"],
+        "verified_at": row["verified_at"],
+        "verification_lag_ms": row["verification_lag_ms"],
+        "rpc_ms": row["rpc_ms"],
+        "table_ms": row["table_ms"],
+        "readback_ms": row["readback_ms"],
     }
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from app.utils.project_supabase_signal import (
+    ProjectSignalVerificationResult,
+    ProjectSignalWriteResult,
+    readback_project_signals,
+    signal_payload_summary,
+    signal_receipt,
+    verify_project_signal_write,
+)
+from app.utils.signal_keepalive import signal_keepalive
+from app.utils.signal_verification_store import (
+    list_pending_signal_runs_async,
+    save_signal_run_async,
+    update_signal_run_verification_async,
+)
+
+log = logging.getLogger("ether_v2.signal_verifier")
+
+VERIFY_MODES = ("inline", "deferred", "sampled")
+DEFAULT_VERIFY_MODE = "deferred"
+
+_MAX_TRACKED_LANES = 50_000
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _lag_ms(recorded_at: str, settled: datetime) -> Optional[int]:
+    try:
+        recorded = datetime.fromisoformat(recorded_at)
+    except (TypeError, ValueError):
+        return None
+    if recorded.tzinfo is None:
+        recorded = recorded.replace(tzinfo=timezone.utc)
+    return max(0, int((settled - recorded).total_seconds() * 1000))
+
+
+@dataclass(frozen=True)
+class _PendingReadback:
+    run_id: int
+    project_slug: str
+    payload: Dict[str, Any]
+    recorded_at: str
+
+
+class SignalReadbackVerifier:
+    """
+    Heartbeat readback verification outside the response path.
+
+    ``ETHER_SIGNAL_VERIFY_MODE`` (or ``<PROJECT>_SIGNAL_VERIFY_MODE``) selects the
+    following; an unset or unknown value means ``deferred``:
+
+    - ``inline``: read back before responding, as manual and cron signals do
+    - ``deferred``: store the run as ``pending`` and let a background worker read
+      it back and settle the row to ``verified`` or ``failed``
+    - ``sampled``: like ``deferred``, but only every ``ETHER_SIGNAL_VERIFY_SAMPLE_EVERY``
+      write per lane plus the first write after a failure; the rest are stored
+      as ``written``
+
+    Writes whose RPC returned a receipt for the inserted row are verified at once
+    in every mode; only legacy RPCs and table fallbacks are read back.
+
+    The worker reads back queued runs of one project with a single query. Runs
+    still pending at shutdown stay ``pending`` in the store and are queued again on
+    the next startup.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queue: Optional["asyncio.Queue[_PendingReadback]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lane_writes: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._lanes_after_failure: Set[Tuple[str, str]] = set()
+        self._lags: Deque[int] = deque(maxlen=1000)
+        self._configure()
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "requeued_on_start": 0,
+            "verified": 0,
+            "failed": 0,
+            "verified_by_receipt": 0,
+            "skipped_sampled": 0,
+            "skipped_queue_full": 0,
+            "settle_batches": 0,
+            "settle_errors": 0,
+        }
+
+    def _configure(self) -> None:
+        self.sample_every = max(1, _int_env("ETHER_SIGNAL_VERIFY_SAMPLE_EVERY", 10))
+        self.batch_max = max(1, _int_env("ETHER_SIGNAL_VERIFY_BATCH_MAX", 50))
+        self.queue_max = max(1, _int_env("ETHER_SIGNAL_VERIFY_QUEUE_MAX", 5000))
+        self.drain_seconds = max(0, _int_env("ETHER_SIGNAL_VERIFY_DRAIN_SECONDS", 5))
+
+    @staticmethod
+    def mode(project_slug: Optional[str] = None) -> str:
+        keys = [f"{project_slug.strip().upper()}_SIGNAL_VERIFY_MODE"] if project_slug else []
+        for key in (*keys, "ETHER_SIGNAL_VERIFY_MODE"):
+            value = os.getenv(key, "").strip().lower()
+            if value in VERIFY_MODES:
+                return value
+        return DEFAULT_VERIFY_MODE
+
+    def _should_sample(self, lane_key: Tuple[str, str]) -> bool:
+        with self._lock:
+            if lane_key in self._lanes_after_failure:
+                return True
+            count = self._lane_writes.pop(lane_key, 0)
+            self._lane_writes[lane_key] = count + 1
+            while len(self._lane_writes) > _MAX_TRACKED_LANES:
+                self._lane_writes.popitem(last=False)
+        return count % self.sample_every == 0
+
+    def _record_outcome(self, lane_key: Tuple[str, str], ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._lanes_after_failure.discard(lane_key)
+            elif len(self._lanes_after_failure) < _MAX_TRACKED_LANES:
+                self._lanes_after_failure.add(lane_key)
+
+    def _ensure_worker(self) -> "asyncio.Queue[_PendingReadback]":
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop or self._worker is None or self._worker.done():
+            if self._loop is not loop or self._queue is None:
+                self._queue = asyncio.Queue(maxsize=self.queue_max)
+            self._loop = loop
+            self._worker = loop.create_task(self._run(self._queue), name="ether-signal-verifier")
+        return self._queue
+
+    def _enqueue(self, item: _PendingReadback) -> bool:
+        queue = self._ensure_worker()
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            return False
+        with self._lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def _has_room(self) -> bool:
+        return self._queue is None or self._queue.qsize() < self.queue_max
+
+    async def verify(
+        self,
+        *,
+        project_slug: str,
+        payload: Dict[str, Any],
+        write: ProjectSignalWriteResult,
+    ) -> ProjectSignalVerificationResult:
+        slug = project_slug.strip().lower()
+        mode = self.mode(slug)
+        lane_key = (slug, str(payload.get("lane_id")))
+        receipted = signal_receipt(write, payload) is not None
+        # An RPC receipt verifies the write without a readback, so there is nothing to defer.
+        if mode == "inline" or not write.ok or receipted:
+            result = await verify_project_signal_write(project_slug=slug, payload=payload, write=write)
+            self._record_outcome(lane_key, result.ok)
+            if receipted:
+                with self._lock:
+                    self._stats["verified_by_receipt"] += 1
+            return result
+
+        if mode == "sampled" and not self._should_sample(lane_key):
+            status, readback_mode = "written", "skipped_sampled"
+        elif not self._has_room():
+            status, readback_mode = "written", "skipped_queue_full"
+        else:
+            status, readback_mode = "pending", mode
+        if status == "written":
+            with self._lock:
+                self._stats[readback_mode] += 1
+
+        recorded_at = _utc_now().isoformat()
+        run = await save_signal_run_async(
+            project_slug=slug,
+            signal_kind=str(payload.get("signal_kind") or "unknown"),
+            lane_id=str(payload.get("lane_id")) if payload.get("lane_id") is not None else None,
+            status=status,
+            write_ok=True,
+            readback_ok=False,
+            verified_ok=False,
+            write_mode=write.mode,
+            write_target=write.target,
+            readback_mode=readback_mode,
+            readback_target=None,
+            error=None,
+            write_result=write.to_dict(),
+            readback_result={},
+            payload_summary=signal_payload_summary(payload),
+            recorded_at=recorded_at,
+            rpc_ms=write.rpc_ms,
+            table_ms=write.table_ms,
+        )
+        if status == "pending" and run.get("id") is not None:
+            if not self._enqueue(_PendingReadback(run_id=int(run["id"]), project_slug=slug, payload=payload, recorded_at=recorded_at)):
+                # Left pending in the store; picked up again on the next startup.
+                with self._lock:
+                    self._stats["skipped_queue_full"] += 1
+        # The write landed but is not verified: callers must not treat it as proof.
+        return ProjectSignalVerificationResult(
+            ok=None,
+            project_slug=slug,
+            signal_kind=str(payload.get("signal_kind") or "unknown"),
+            lane_id=str(payload.get("lane_id")) if payload.get("lane_id") is not None else None,
+            write=write.to_dict(),
+            readback={"attempted": False, "ok": False, "project_slug": slug, "mode": readback_mode},
+            run=run,
+            error=None,
+            verification="deferred" if status == "pending" else "skipped",
+        )
+
+    async def _run(self, queue: "asyncio.Queue[_PendingReadback]") -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_max:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                by_project: Dict[str, List[_PendingReadback]] = {}
+                for item in batch:
+                    by_project.setdefault(item.project_slug, []).append(item)
+                await asyncio.gather(*(self._settle(slug, items) for slug, items in by_project.items()))
+            except Exception as exc:
+                with self._lock:
+                    self._stats["settle_errors"] += 1
+                log.warning("ether_signal_verify_settle_failed=%s", exc)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _settle(self, project_slug: str, items: List[_PendingReadback]) -> None:
+        readbacks = await readback_project_signals(project_slug=project_slug, payloads=[item.payload for item in items])
+        settled = _utc_now()
+        for item, readback in zip(items, readbacks):
+            lag_ms = _lag_ms(item.recorded_at, settled)
+            await update_signal_run_verification_async(
+                item.run_id,
+                readback_ok=readback.ok,
+                verified_ok=readback.ok,
+                readback_mode=readback.mode,
+                readback_target=readback.target,
+                error=None if readback.ok else (readback.error or "Signal verification failed."),
+                readback_result=readback.to_dict(),
+                verified_at=settled.isoformat(),
+                verification_lag_ms=lag_ms,
+                readback_ms=readback.readback_ms,
+            )
+            self._record_outcome((project_slug, str(item.payload.get("lane_id"))), readback.ok)
+            if readback.ok:
+                signal_keepalive.confirm(project_slug)
+            else:
+                signal_keepalive.invalidate(project_slug)
+            with self._lock:
+                self._stats["verified" if readback.ok else "failed"] += 1
+                if lag_ms is not None:
+                    self._lags.append(lag_ms)
+        with self._lock:
+            self._stats["settle_batches"] += 1
+
+    async def initialize(self) -> int:
+        """Queue runs left pending by a previous process."""
+        try:
+            rows = await list_pending_signal_runs_async(limit=self.queue_max)
+        except Exception as exc:
+            log.warning("ether_signal_verify_requeue_failed=%s", exc)
+            return 0
+        queued = 0
+        for row in reversed(rows):
+            summary = row.get("payload_summary") or {}
+            payload = {"app_slug": row["project_slug"], **summary}
+            if self._enqueue(_PendingReadback(run_id=int(row["id"]), project_slug=row["project_slug"], payload=payload, recorded_at=row["recorded_at"])):
+                queued += 1
+        with self._lock:
+            self._stats["requeued_on_start"] += queued
+        if queued:
+            log.info("ether_signal_verify_requeued=%s", queued)
+        return queued
+
+    async def aclose(self) -> None:
+        """Give queued readbacks ``ETHER_SIGNAL_VERIFY_DRAIN_SECONDS`` to settle, then stop."""
+        queue, worker = self._queue, self._worker
+        if queue is not None and worker is not None and not worker.done() and self._loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(queue.join(), timeout=self.drain_seconds)
+            except asyncio.TimeoutError:
+                log.warning("ether_signal_verify_drain_timeout pending=%s", queue.qsize())
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            lags = sorted(self._lags)
+            lanes_after_failure = len(self._lanes_after_failure)
+        return {
+            "mode": self.mode(),
+            "sample_every": self.sample_every,
+            "batch_max": self.batch_max,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_max": self.queue_max,
+            "running": self._worker is not None and not self._worker.done(),
+            **stats,
+            "lanes_after_failure": lanes_after_failure,
+            "lag_samples": len(lags),
+            "lag_avg_ms": round(sum(lags) / len(lags), 1) if lags else 0.0,
+            "lag_p95_ms": lags[min(len(lags) - 1, int(len(lags) * 0.95))] if lags else 0,
+            "lag_max_ms": lags[-1] if lags else 0,
+        }
+
+
+signal_verifier = SignalReadbackVerifier()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+log = logging.getLogger("ether_v2.sqlite_pool")
+
+DEFAULT_DB_PATH = "runtime/ether_audit.sqlite3"
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _busy_timeout_ms() -> int:
+    return max(0, _int_env("ETHER_SQLITE_BUSY_TIMEOUT_MS", 5000))
+
+
+def _statement_cache_size() -> int:
+    return max(0, _int_env("ETHER_SQLITE_STATEMENT_CACHE", 256))
+
+
+def _synchronous_mode() -> str:
+    value = os.getenv("ETHER_SQLITE_SYNCHRONOUS", "NORMAL").strip().upper() or "NORMAL"
+    return value if value in {"OFF", "NORMAL", "FULL", "EXTRA"} else "NORMAL"
+
+
+def resolve_db_path(env_key: Optional[str] = None) -> Path:
+    """
+    Resolve a store database path: store-specific env var, then ETHER_AUDIT_DB_PATH,
+    then the shared runtime default.
+    """
+    raw = os.getenv(env_key, "").strip() if env_key else ""
+    raw = raw or os.getenv("ETHER_AUDIT_DB_PATH", "").strip() or DEFAULT_DB_PATH
+    return Path(raw)
+
+
+@dataclass
+class _PooledConnection:
+    conn: sqlite3.Connection
+    path: str
+    thread_name: str
+    depth: int = 0
+
+
+class SQLitePool:
+    """
+    Per-thread pooled SQLite connections shared by the Ether operational stores.
+
+    Each thread keeps one long-lived connection per database file, opened in WAL
+    mode with synchronous=NORMAL, a busy timeout and a prepared statement cache.
+    Write blocks take the write lock up front with BEGIN IMMEDIATE so lock waits
+    can be measured and deferred-transaction upgrade deadlocks cannot occur.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[_PooledConnection] = []
+        self._stats: Dict[str, Union[int, float]] = {
+            "connections_opened": 0,
+            "connections_closed": 0,
+            "checkouts": 0,
+            "reuses": 0,
+            "write_transactions": 0,
+            "rollbacks": 0,
+            "lock_waits": 0,
+            "lock_wait_total_ms": 0.0,
+            "lock_wait_max_ms": 0.0,
+            "busy_errors": 0,
+        }
+
+    def _bump(self, key: str, amount: Union[int, float] = 1) -> None:
+        with self._lock:
+            self._stats[key] = self._stats.get(key, 0) + amount
+
+    def _open(self, path: str) -> _PooledConnection:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            path,
+            timeout=_busy_timeout_ms() / 1000.0,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_statement_cache_size(),
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"pragma busy_timeout = {_busy_timeout_ms()}")
+        # Only takes effect on a new database file; lets retention reclaim pages incrementally.
+        conn.execute("pragma auto_vacuum = incremental")
+        conn.execute("pragma journal_mode = wal")
+        conn.execute(f"pragma synchronous = {_synchronous_mode()}")
+        conn.execute("pragma foreign_keys = on")
+        pooled = _PooledConnection(conn=conn, path=path, thread_name=threading.current_thread().name)
+        with self._lock:
+            self._connections.append(pooled)
+            self._stats["connections_opened"] += 1
+        return pooled
+
+    def _checkout(self, path: str) -> _PooledConnection:
+        slots: Optional[Dict[str, _PooledConnection]] = getattr(self._local, "slots", None)
+        if slots is None:
+            slots = {}
+            self._local.slots = slots
+        pooled = slots.get(path)
+        if pooled is None:
+            pooled = self._open(path)
+            slots[path] = pooled
+        else:
+            self._bump("reuses")
+        self._bump("checkouts")
+        return pooled
+
+    def _begin_immediate(self, conn: sqlite3.Connection) -> None:
+        started = time.perf_counter()
+        try:
+            conn.execute("begin immediate")
+        except sqlite3.OperationalError:
+            self._bump("busy_errors")
+            raise
+        waited_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self._stats["write_transactions"] += 1
+            self._stats["lock_wait_total_ms"] += waited_ms
+            if waited_ms >= 1.0:
+                self._stats["lock_waits"] += 1
+            if waited_ms > self._stats["lock_wait_max_ms"]:
+                self._stats["lock_wait_max_ms"] = waited_ms
+
+    @contextmanager
+    def connection(self, path: Union[str, Path], *, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow this thread's connection for ``path``.
+
+        Nested blocks on the same thread share the outermost transaction; only the
+        outermost write block commits or rolls back.
+        """
+        pooled = self._checkout(str(path))
+        conn = pooled.conn
+        owns_transaction = write and not conn.in_transaction
+        if owns_transaction:
+            self._begin_immediate(conn)
+        pooled.depth += 1
+        try:
+            yield conn
+        except BaseException as exc:
+            pooled.depth -= 1
+            if isinstance(exc, sqlite3.OperationalError) and "locked" in str(exc).lower():
+                self._bump("busy_errors")
+            if owns_transaction and conn.in_transaction:
+                conn.rollback()
+                self._bump("rollbacks")
+            raise
+        else:
+            pooled.depth -= 1
+            if owns_transaction and conn.in_transaction:
+                conn.commit()
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = list(self._connections)
+            self._connections = []
+        for pooled in connections:
+            try:
+                pooled.conn.close()
+            except Exception as exc:
+                log.warning("ether_sqlite_pool_close_failed=%s", exc)
+        with self._lock:
+            self._stats["connections_closed"] += len(connections)
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            connections = list(self._connections)
+        write_transactions = int(stats["write_transactions"]) or 0
+        return {
+            "journal_mode": "wal",
+            "synchronous": _synchronous_mode().lower(),
+            "busy_timeout_ms": _busy_timeout_ms(),
+            "statement_cache_size": _statement_cache_size(),
+            "open_connections": len(connections),
+            "borrowed_connections": sum(1 for pooled in connections if pooled.depth),
+            "databases": sorted({pooled.path for pooled in connections}),
+            "threads": sorted({pooled.thread_name for pooled in connections}),
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()},
+            "lock_wait_avg_ms": round(float(stats["lock_wait_total_ms"]) / write_transactions, 3) if write_transactions else 0.0,
+        }
+
+
+sqlite_pool = SQLitePool()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+from app.utils.storage_backend import get_storage_backend
+
+log = logging.getLogger("ether_v2.sqlite_schema")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    statements: Tuple[str, ...]
+
+
+@dataclass
+class _Component:
+    name: str
+    db_path: Callable[[], Path]
+    migrations: Tuple[Migration, ...]
+
+    @property
+    def target_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+
+class SchemaRegistry:
+    """
+    Ordered, versioned schema migrations for the operational stores.
+
+    Each store registers its migrations at import time, written in the SQLite
+    dialect; the active storage backend translates them when needed. ``bootstrap`` runs once at
+    startup and records per-component versions in ``ether_schema_versions``; store
+    hot paths only call ``ensure``, which is an in-memory check once a component is
+    current for its database file.
+    """
+
+    def __init__(self) -> None:
+        self._components: Dict[str, _Component] = {}
+        self._ready: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def register(self, component: str, db_path: Callable[[], Path], migrations: Sequence[Migration]) -> None:
+        ordered = tuple(sorted(migrations, key=lambda item: item.version))
+        versions = [item.version for item in ordered]
+        if len(set(versions)) != len(versions):
+            raise ValueError(f"Duplicate schema migration version for component {component}.")
+        self._components[component] = _Component(name=component, db_path=db_path, migrations=ordered)
+
+    def migrations(self, component: str) -> Tuple[Migration, ...]:
+        return self._components[component].migrations
+
+    def db_path(self, component: str) -> Path:
+        return self._components[component].db_path()
+
+    def ensure(self, component: str) -> None:
+        entry = self._components[component]
+        key = (component, str(entry.db_path()))
+        if key in self._ready:
+            return
+        with self._lock:
+            if key in self._ready:
+                return
+            self._migrate(entry)
+            self._ready.add(key)
+
+    def bootstrap(self) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        for name in list(self._components):
+            try:
+                self.ensure(name)
+                results[name] = {"ok": True, "version": self._components[name].target_version}
+            except Exception as exc:
+                log.warning("ether_schema_bootstrap_failed component=%s error=%s", name, exc)
+                results[name] = {"ok": False, "error": str(exc)[:240]}
+        return results
+
+    def _migrate(self, entry: _Component) -> None:
+        backend = get_storage_backend()
+        with backend.connection(entry.db_path(), write=True) as conn:
+            backend.lock_schema(conn)
+            conn.execute(
+                """
+                create table if not exists ether_schema_versions (
+                  component text primary key,
+                  version integer not null,
+                  updated_at text not null
+                )
+                """
+            )
+            conn.execute(
+                """
+                create table if not exists ether_schema_migrations (
+                  component text not null,
+                  version integer not null,
+                  name text not null,
+                  applied_at text not null,
+                  primary key (component, version)
+                )
+                """
+            )
+            row = conn.execute("select version from ether_schema_versions where component = ?", (entry.name,)).fetchone()
+            current = int(row["version"]) if row else 0
+            for migration in entry.migrations:
+                if migration.version <= current:
+                    continue
+                for statement in backend.schema_statements(migration.statements):
+                    conn.execute(statement)
+                applied_at = _now()
+                conn.execute(
+                    "insert into ether_schema_migrations (component, version, name, applied_at) values (?, ?, ?, ?)",
+                    (entry.name, migration.version, migration.name, applied_at),
+                )
+                conn.execute(
+                    """
+                    insert into ether_schema_versions (component, version, updated_at) values (?, ?, ?)
+                    on conflict(component) do update set version = excluded.version, updated_at = excluded.updated_at
+                    """,
+                    (entry.name, migration.version, applied_at),
+                )
+                log.info("ether_schema_migrated component=%s version=%s name=%s", entry.name, migration.version, migration.name)
+
+    def status(self) -> Dict[str, Any]:
+        components: Dict[str, Any] = {}
+        backend = get_storage_backend()
+        for name, entry in self._components.items():
+            path = str(entry.db_path())
+            current = None
+            history: List[Dict[str, Any]] = []
+            try:
+                with backend.connection(path) as conn:
+                    row = conn.execute("select version, updated_at from ether_schema_versions where component = ?", (name,)).fetchone()
+                    rows = conn.execute(
+                        "select version, name, applied_at from ether_schema_migrations where component = ? order by version",
+                        (name,),
+                    ).fetchall()
+                current = int(row["version"]) if row else 0
+                history = [dict(item) for item in rows]
+            except Exception as exc:
+                log.warning("ether_schema_status_failed component=%s error=%s", name, exc)
+            components[name] = {
+                "db_path": backend.location(path),
+                "current_version": current,
+                "target_version": entry.target_version,
+                "up_to_date": current == entry.target_version,
+                "ready_in_process": (name, path) in self._ready,
+                "migrations": history,
+            }
+        return components
+
+
+schema_registry = SchemaRegistry()
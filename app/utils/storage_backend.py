@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, Optional, Sequence, Union
+
+from app.utils.postgres_pool import postgres_dsn, postgres_pool, redacted_dsn
+from app.utils.sqlite_pool import sqlite_pool
+
+log = logging.getLogger("ether_v2.storage_backend")
+
+STORAGE_BACKENDS = ("sqlite", "postgres")
+
+
+class StorageBackend(ABC):
+    """
+    Connection and dialect surface the operational stores are written against.
+
+    Store SQL is written once in the SQLite dialect (``?`` parameters, plain
+    ``insert … on conflict``, ``returning``). Backends provide connections that
+    accept it, translate migration DDL, and supply the few operations that differ
+    (bulk inserts, migration locking, physical space reclamation). A backend must
+    implement the abstract methods; the rest default to the SQLite behaviour.
+    """
+
+    name = "base"
+    shared = False
+    supports_vacuum = False
+
+    @abstractmethod
+    def connection(self, path: Union[str, Path], *, write: bool = False) -> ContextManager[Any]:
+        ...
+
+    @abstractmethod
+    def location(self, path: Union[str, Path]) -> str:
+        ...
+
+    def schema_statements(self, statements: Sequence[str]) -> List[str]:
+        return list(statements)
+
+    def lock_schema(self, conn: Any) -> None:
+        return None
+
+    def bulk_insert(self, conn: Any, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> int:
+        placeholders = ", ".join("?" for _ in columns)
+        conn.executemany(f"insert into {table} ({', '.join(columns)}) values ({placeholders})", rows)
+        return len(rows)
+
+    @abstractmethod
+    def close_all(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        ...
+
+
+class SQLiteBackend(StorageBackend):
+    """One SQLite file per store path on local disk; state is per instance."""
+
+    name = "sqlite"
+    supports_vacuum = True
+
+    def connection(self, path: Union[str, Path], *, write: bool = False) -> ContextManager[Any]:
+        return sqlite_pool.connection(path, write=write)
+
+    def location(self, path: Union[str, Path]) -> str:
+        return str(path)
+
+    def close_all(self) -> None:
+        sqlite_pool.close_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return sqlite_pool.stats()
+
+
+_AUTOINCREMENT = re.compile(r"\binteger primary key autoincrement\b", re.IGNORECASE)
+_WITHOUT_ROWID = re.compile(r"\)\s*without rowid\s*$", re.IGNORECASE)
+_ADD_COLUMN = re.compile(r"^(\s*alter table \w+ add column) (?!if not exists)", re.IGNORECASE)
+_TRIGGER = re.compile(
+    r"^\s*create trigger if not exists (?P<name>\w+)\s+after (?P<event>insert|update of \w+) on (?P<table>\w+)"
+    r"\s*(?:when (?P<when>.*?))?\s*begin(?P<body>.*)\bend\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_DROP_TRIGGER = re.compile(r"^\s*drop trigger if exists (?P<name>\w+)\s*$", re.IGNORECASE)
+_IS_NOT = re.compile(r"\bis not\b(?! null\b)", re.IGNORECASE)
+_BLOB = re.compile(r"(?<=\w )blob\b(?= not null| null|,|\s*$)", re.IGNORECASE | re.MULTILINE)
+
+
+def postgres_ddl(statement: str) -> List[str]:
+    """Translate one SQLite migration statement to its Postgres equivalent(s)."""
+    trigger = _TRIGGER.match(statement)
+    if trigger:
+        name = trigger.group("name")
+        table = trigger.group("table")
+        body = trigger.group("body").strip()
+        when = trigger.group("when")
+        condition = f" when ({_IS_NOT.sub('is distinct from', when.strip())})" if when else ""
+        return [
+            f"create or replace function {name}_fn() returns trigger language plpgsql as $$\nbegin\n{body}\nreturn null;\nend\n$$",
+            f"drop trigger if exists {name} on {table}",
+            f"create trigger {name} after {trigger.group('event')} on {table} for each row{condition} execute function {name}_fn()",
+        ]
+    dropped = _DROP_TRIGGER.match(statement)
+    if dropped:
+        # Translated triggers run through a "<name>_fn" function; dropping it drops the trigger.
+        return [f"drop function if exists {dropped.group('name')}_fn() cascade"]
+    translated = _AUTOINCREMENT.sub("bigint generated by default as identity primary key", statement)
+    translated = _BLOB.sub("bytea", translated)
+    translated = _WITHOUT_ROWID.sub(")", translated.rstrip())
+    translated = _ADD_COLUMN.sub(r"\1 if not exists ", translated)
+    return [translated]
+
+
+class PostgresBackend(StorageBackend):
+    """
+    Shared managed Postgres (e.g. Supabase) for every store. All store paths map
+    to the one database, so multiple Ether instances see the same state.
+    """
+
+    name = "postgres"
+    shared = True
+
+    def connection(self, path: Union[str, Path], *, write: bool = False) -> ContextManager[Any]:
+        return postgres_pool.connection(write=write)
+
+    def location(self, path: Union[str, Path]) -> str:
+        return redacted_dsn(postgres_dsn())
+
+    def schema_statements(self, statements: Sequence[str]) -> List[str]:
+        translated: List[str] = []
+        for statement in statements:
+            translated.extend(postgres_ddl(statement))
+        return translated
+
+    def lock_schema(self, conn: Any) -> None:
+        # Serialises concurrent instance startups; released when the transaction ends.
+        conn.execute("select pg_advisory_xact_lock(hashtext('ether_schema_registry'))")
+
+    def bulk_insert(self, conn: Any, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> int:
+        copied = conn.copy_rows(table, columns, rows)
+        postgres_pool.record_copy(copied)
+        return copied
+
+    def close_all(self) -> None:
+        postgres_pool.close_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return postgres_pool.stats()
+
+
+_backend: Optional[StorageBackend] = None
+_backend_lock = threading.Lock()
+
+
+def _backend_name() -> str:
+    value = os.getenv("ETHER_STORAGE_BACKEND", "sqlite").strip().lower() or "sqlite"
+    if value not in STORAGE_BACKENDS:
+        log.warning("ether_storage_backend_unknown=%s falling_back=sqlite", value)
+        return "sqlite"
+    return value
+
+
+def get_storage_backend() -> StorageBackend:
+    """Backend selected by ``ETHER_STORAGE_BACKEND`` (``sqlite`` or ``postgres``)."""
+    global _backend
+    name = _backend_name()
+    if _backend is not None and _backend.name == name:
+        return _backend
+    with _backend_lock:
+        if _backend is None or _backend.name != name:
+            _backend = PostgresBackend() if name == "postgres" else SQLiteBackend()
+        return _backend
+
+
+def storage_status() -> Dict[str, Any]:
+    backend = get_storage_backend()
+    return {
+        "backend": backend.name,
+        "shared_across_instances": backend.shared,
+        "pool": backend.stats(),
+    }
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+LIFETIME_BUCKET = "all"
+TOTAL_DIMENSION = "total"
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def window_days() -> int:
+    return max(1, _int_env("ETHER_SNAPSHOT_WINDOW_DAYS", 7))
+
+
+def counter_table_statements(counter_table: str) -> Tuple[str, ...]:
+    return (
+        f"""
+        create table if not exists {counter_table} (
+          bucket text not null,
+          project_slug text not null,
+          dimension text not null,
+          value text not null,
+          count integer not null default 0,
+          primary key (bucket, project_slug, dimension, value)
+        ) without rowid
+        """,
+    )
+
+
+def _expr(template: str, row: str) -> str:
+    return template.format(row=row)
+
+
+def _counter_rows(
+    row: str,
+    *,
+    project: str,
+    ts_column: str,
+    dimensions: Mapping[str, str],
+    delta: int,
+) -> List[str]:
+    project_sql = _expr(project, row)
+    day_sql = f"substr({row}.{ts_column}, 1, 10)"
+    values: List[str] = []
+    for dimension, template in dimensions.items():
+        value_sql = _expr(template, row)
+        for bucket_sql in (f"'{LIFETIME_BUCKET}'", day_sql):
+            values.append(f"({bucket_sql}, {project_sql}, '{dimension}', {value_sql}, {delta})")
+    return values
+
+
+def _upsert(counter_table: str, values: Sequence[str]) -> str:
+    return (
+        f"insert into {counter_table} (bucket, project_slug, dimension, value, count) values "
+        + ", ".join(values)
+        + f" on conflict(bucket, project_slug, dimension, value) do update set count = {counter_table}.count + excluded.count;"
+    )
+
+
+def counter_trigger_statements(
+    *,
+    table: str,
+    counter_table: str,
+    ts_column: str,
+    project: str,
+    dimensions: Mapping[str, str],
+    mutable: Sequence[str] = (),
+) -> Tuple[str, ...]:
+    """
+    DDL that keeps ``counter_table`` in step with ``table``.
+
+    ``dimensions`` maps a dimension name to a SQL expression over ``{row}``
+    (``new``/``old`` inside triggers). Every insert adds one to the lifetime bucket
+    and to the row's day bucket of each dimension plus the ``total`` dimension.
+    Columns listed in ``mutable`` get an update trigger that moves the row's count
+    from the old value to the new one. Deletes (retention) leave counters alone so
+    lifetime totals survive archival.
+    """
+    all_dimensions = {TOTAL_DIMENSION: "'all'", **dimensions}
+    statements = [
+        f"""
+        create trigger if not exists {table}_counters_insert after insert on {table}
+        begin
+          {_upsert(counter_table, _counter_rows("new", project=project, ts_column=ts_column, dimensions=all_dimensions, delta=1))}
+        end
+        """
+    ]
+    for column in mutable:
+        moved = {name: template for name, template in dimensions.items() if f"{{row}}.{column}" in template}
+        rows = _counter_rows("new", project=project, ts_column=ts_column, dimensions=moved, delta=1)
+        rows += _counter_rows("old", project=project, ts_column=ts_column, dimensions=moved, delta=-1)
+        statements.append(
+            f"""
+            create trigger if not exists {table}_counters_update_{column} after update of {column} on {table}
+            when old.{column} is not new.{column}
+            begin
+              {_upsert(counter_table, rows)}
+            end
+            """
+        )
+    return tuple(statements)
+
+
+def counter_backfill_statements(
+    *,
+    table: str,
+    counter_table: str,
+    ts_column: str,
+    project: str,
+    dimensions: Mapping[str, str],
+) -> Tuple[str, ...]:
+    """Seed a freshly created counter table from the rows already in ``table``."""
+    statements: List[str] = []
+    project_sql = _expr(project, table)
+    day_sql = f"substr({table}.{ts_column}, 1, 10)"
+    for dimension, template in {TOTAL_DIMENSION: "'all'", **dimensions}.items():
+        value_sql = _expr(template, table)
+        for bucket_sql in (f"'{LIFETIME_BUCKET}'", day_sql):
+            statements.append(
+                f"""
+                insert into {counter_table} (bucket, project_slug, dimension, value, count)
+                select {bucket_sql}, {project_sql}, '{dimension}', {value_sql}, count(*)
+                from {table} group by 1, 2, 4
+                """
+            )
+    return tuple(statements)
+
+
+def counter_statements(
+    *,
+    table: str,
+    counter_table: str,
+    ts_column: str,
+    project: str,
+    dimensions: Mapping[str, str],
+    mutable: Sequence[str] = (),
+) -> Tuple[str, ...]:
+    return (
+        *counter_table_statements(counter_table),
+        *counter_trigger_statements(
+            table=table,
+            counter_table=counter_table,
+            ts_column=ts_column,
+            project=project,
+            dimensions=dimensions,
+            mutable=mutable,
+        ),
+        *counter_backfill_statements(
+            table=table,
+            counter_table=counter_table,
+            ts_column=ts_column,
+            project=project,
+            dimensions=dimensions,
+        ),
+    )
+
+
+def read_counters(
+    conn: Any,
+    counter_table: str,
+    *,
+    project_slug: Optional[str] = None,
+    days: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Lifetime and windowed totals per dimension, plus lifetime totals per project.
+
+    Reads only the counter table: the lifetime bucket is one primary-key range and
+    the window is the last ``days`` day buckets.
+    """
+    days = days or window_days()
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days - 1)).date().isoformat()
+    project_clause = "and project_slug = ?" if project_slug else ""
+    project_params: List[Any] = [project_slug.strip().lower()] if project_slug else []
+
+    def _grouped(bucket_clause: str, params: List[Any]) -> Dict[str, Dict[str, int]]:
+        rows = conn.execute(
+            f"""
+            select dimension, value, sum(count) as total from {counter_table}
+            where {bucket_clause} {project_clause}
+            group by dimension, value
+            """,
+            [*params, *project_params],
+        ).fetchall()
+        grouped: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            if int(row["total"] or 0) == 0:
+                continue
+            grouped.setdefault(row["dimension"], {})[row["value"]] = int(row["total"])
+        return grouped
+
+    lifetime = _grouped("bucket = ?", [LIFETIME_BUCKET])
+    window = _grouped("bucket >= ? and bucket <> ?", [cutoff, LIFETIME_BUCKET])
+    project_rows = conn.execute(
+        f"""
+        select project_slug, sum(count) as total from {counter_table}
+        where bucket = ? and dimension = ? {project_clause}
+        group by project_slug
+        """,
+        [LIFETIME_BUCKET, TOTAL_DIMENSION, *project_params],
+    ).fetchall()
+    return {
+        "total": sum(lifetime.pop(TOTAL_DIMENSION, {}).values()),
+        "lifetime": lifetime,
+        "window_total": sum(window.pop(TOTAL_DIMENSION, {}).values()),
+        "window": window,
+        "window_days": days,
+        "projects": {row["project_slug"]: int(row["total"]) for row in project_rows if int(row["total"] or 0)},
+    }
@@ -6,7 +6,9 @@ from typing import Optional, Tuple
 
 from supabase import Client, create_client
 
+from app.utils.async_exec import run_outbound
 from app.utils.projects import ProjectRecord
+from app.utils.supabase_guard import SupabaseCallRejected, supabase_guard
 
 log = logging.getLogger("ether_v2.supabase_auth")
 
@@ -24,7 +26,19 @@ def _project_anon_key(project: ProjectRecord) -> Optional[str]:
     return value or None
 
 
-def verify_project_access_token(project: ProjectRecord, access_token: Optional[str]) -> Tuple[bool, str, Optional[str]]:
+def _fetch_user_id(url: str, anon_key: str, access_token: str) -> Optional[str]:
+    client = _client_for(url, anon_key)
+    response = client.auth.get_user(access_token)
+    user = getattr(response, "user", None)
+    if user is None and isinstance(response, dict):
+        user = response.get("user")
+    user_id = getattr(user, "id", None) if user is not None else None
+    if user_id is None and isinstance(user, dict):
+        user_id = user.get("id")
+    return str(user_id) if user_id else None
+
+
+async def verify_project_access_token(project: ProjectRecord, access_token: Optional[str]) -> Tuple[bool, str, Optional[str]]:
     if not access_token:
         return False, "missing_access_token", None
 
@@ -36,17 +50,17 @@ def verify_project_access_token(project: ProjectRecord, access_token: Optional[s
         return False, "pending_project_supabase_anon_key", None
 
     try:
-        client = _client_for(project.supabase_url, anon_key)
-        response = client.auth.get_user(access_token)
-        user = getattr(response, "user", None)
-        if user is None and isinstance(response, dict):
-            user = response.get("user")
-        user_id = getattr(user, "id", None) if user is not None else None
-        if user_id is None and isinstance(user, dict):
-            user_id = user.get("id")
+        user_id = await supabase_guard.call(
+            project.slug,
+            "auth",
+            lambda: run_outbound(_fetch_user_id, project.supabase_url, anon_key, access_token),
+        )
         if user_id:
-            return True, "supabase_verified", str(user_id)
+            return True, "supabase_verified", user_id
         return False, "supabase_invalid_token", None
+    except SupabaseCallRejected as exc:
+        log.warning("Supabase verification skipped for project=%s: %s", project.slug, exc)
+        return False, f"supabase_{exc.reason}", None
     except Exception as exc:
         log.warning("Supabase verification failed for project=%s: %s", project.slug, exc)
         return False, "supabase_verification_error", None
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.utils.supabase_http import is_transport_error
+
+log = logging.getLogger("ether_v2.supabase_guard")
+
+T = TypeVar("T")
+
+TARGETS = ("rpc", "table", "auth")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _float_env(key: str, default: float) -> float:
+    try:
+        return float(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def is_outage(exc: BaseException) -> bool:
+    """Failures that say the project is unavailable: transport errors and 5xx responses."""
+    if is_transport_error(exc) or "Retryable" in exc.__class__.__name__:
+        return True
+    for attr in ("status", "status_code", "code"):
+        try:
+            status = int(getattr(exc, attr, None) or 0)
+        except (TypeError, ValueError):
+            continue
+        if status >= 500:
+            return True
+    return False
+
+
+class SupabaseCallRejected(Exception):
+    """Raised instead of calling a project whose breaker is open or whose bulkhead is full."""
+
+    def __init__(self, *, reason: str, project_slug: str, target: str, retry_after_seconds: Optional[float] = None) -> None:
+        self.reason = reason
+        self.project_slug = project_slug
+        self.target = target
+        self.retry_after_seconds = retry_after_seconds
+        if reason == "circuit_open":
+            message = f"Circuit open for {project_slug} {target}; retry in {retry_after_seconds or 0:.0f}s."
+        else:
+            message = f"Too many concurrent Supabase calls for {project_slug}."
+        super().__init__(message)
+
+
+@dataclass
+class _Breaker:
+    state: str = "closed"
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    probes_in_flight: int = 0
+    calls: int = 0
+    failures: int = 0
+    rejected: int = 0
+    trips: int = 0
+    last_error: Optional[str] = None
+    changed_at: Optional[float] = None
+
+
+@dataclass
+class _Bulkhead:
+    limit: int
+    semaphore: asyncio.Semaphore
+    in_flight: int = 0
+    waiting: int = 0
+    max_in_flight: int = 0
+    rejected: int = 0
+
+
+class SupabaseGuard:
+    """
+    Circuit breakers and bulkheads for outbound project Supabase calls.
+
+    Every project has a breaker per target (``rpc``, ``table``, ``auth``). After
+    ``ETHER_SUPABASE_BREAKER_FAILURES`` consecutive outages (transport errors,
+    timeouts and 5xx responses) the breaker opens and calls fail immediately for
+    ``ETHER_SUPABASE_BREAKER_OPEN_SECONDS``. It then goes half-open and lets
+    ``ETHER_SUPABASE_BREAKER_HALF_OPEN_PROBES`` calls through: a success closes it,
+    an outage opens it again. API errors such as a missing RPC or an invalid token
+    mean the project answered and do not count against it.
+
+    Every project also has its own bulkhead of ``<PROJECT>_SUPABASE_CONCURRENCY``
+    (default ``ETHER_SUPABASE_PROJECT_CONCURRENCY``) concurrent calls, so a slow
+    project cannot hold all of the shared pool's connections or outbound workers.
+    A call that waits longer than ``ETHER_SUPABASE_BULKHEAD_WAIT_MS`` for a slot is
+    rejected.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._breakers: Dict[Tuple[str, str], _Breaker] = {}
+        self._bulkheads: Dict[str, _Bulkhead] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._configure()
+
+    def _configure(self) -> None:
+        self.failure_threshold = max(1, _int_env("ETHER_SUPABASE_BREAKER_FAILURES", 5))
+        self.open_seconds = max(0.1, _float_env("ETHER_SUPABASE_BREAKER_OPEN_SECONDS", 30.0))
+        self.half_open_probes = max(1, _int_env("ETHER_SUPABASE_BREAKER_HALF_OPEN_PROBES", 1))
+        self.bulkhead_wait_ms = max(0, _int_env("ETHER_SUPABASE_BULKHEAD_WAIT_MS", 2000))
+
+    @staticmethod
+    def concurrency(project_slug: Optional[str] = None) -> int:
+        raw = ""
+        if project_slug:
+            raw = os.getenv(f"{project_slug.strip().upper()}_SUPABASE_CONCURRENCY", "").strip()
+        if raw:
+            try:
+                return max(1, int(raw))
+            except ValueError:
+                pass
+        return max(1, _int_env("ETHER_SUPABASE_PROJECT_CONCURRENCY", 8))
+
+    def _breaker(self, slug: str, target: str) -> _Breaker:
+        breaker = self._breakers.get((slug, target))
+        if breaker is None:
+            breaker = self._breakers[(slug, target)] = _Breaker()
+        return breaker
+
+    def _bulkhead(self, slug: str) -> _Bulkhead:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not loop:
+                # Semaphores belong to one event loop (scripts may call asyncio.run repeatedly).
+                self._bulkheads.clear()
+                self._loop = loop
+            bulkhead = self._bulkheads.get(slug)
+            if bulkhead is None:
+                limit = self.concurrency(slug)
+                bulkhead = self._bulkheads[slug] = _Bulkhead(limit=limit, semaphore=asyncio.Semaphore(limit))
+            return bulkhead
+
+    def _admit(self, slug: str, target: str) -> bool:
+        """Pass a call through the breaker; returns whether it is a half-open probe."""
+        now = time.monotonic()
+        with self._lock:
+            breaker = self._breaker(slug, target)
+            if breaker.state == "open" and now >= breaker.open_until:
+                breaker.state, breaker.probes_in_flight, breaker.changed_at = "half_open", 0, time.time()
+            if breaker.state == "closed":
+                breaker.calls += 1
+                return False
+            if breaker.state == "half_open" and breaker.probes_in_flight < self.half_open_probes:
+                breaker.probes_in_flight += 1
+                breaker.calls += 1
+                return True
+            breaker.rejected += 1
+            retry_after = max(0.0, breaker.open_until - now) if breaker.state == "open" else 0.0
+        raise SupabaseCallRejected(reason="circuit_open", project_slug=slug, target=target, retry_after_seconds=retry_after)
+
+    def _settle(self, slug: str, target: str, *, probe: bool, exc: Optional[BaseException]) -> None:
+        outage = exc is not None and is_outage(exc)
+        with self._lock:
+            breaker = self._breaker(slug, target)
+            if probe:
+                breaker.probes_in_flight = max(0, breaker.probes_in_flight - 1)
+            if not outage:
+                breaker.consecutive_failures = 0
+                if breaker.state == "half_open" and probe:
+                    breaker.state, breaker.changed_at = "closed", time.time()
+                return
+            breaker.failures += 1
+            breaker.consecutive_failures += 1
+            breaker.last_error = (str(exc).strip() or exc.__class__.__name__)[:240]
+            if breaker.state == "open":
+                return
+            if breaker.state == "half_open" or breaker.consecutive_failures >= self.failure_threshold:
+                breaker.state, breaker.changed_at = "open", time.time()
+                breaker.open_until = time.monotonic() + self.open_seconds
+                breaker.trips += 1
+                tripped = breaker.consecutive_failures
+            else:
+                return
+        log.warning("ether_supabase_circuit_open project=%s target=%s failures=%s", slug, target, tripped)
+
+    async def call(self, project_slug: str, target: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` behind the project's breaker for ``target`` and the project's bulkhead."""
+        slug = project_slug.strip().lower()
+        probe = self._admit(slug, target)
+        bulkhead = self._bulkhead(slug)
+        try:
+            if bulkhead.semaphore.locked():
+                with self._lock:
+                    bulkhead.waiting += 1
+                try:
+                    await asyncio.wait_for(bulkhead.semaphore.acquire(), timeout=self.bulkhead_wait_ms / 1000.0)
+                except asyncio.TimeoutError:
+                    with self._lock:
+                        bulkhead.rejected += 1
+                    raise SupabaseCallRejected(reason="bulkhead_full", project_slug=slug, target=target) from None
+                finally:
+                    with self._lock:
+                        bulkhead.waiting -= 1
+            else:
+                await bulkhead.semaphore.acquire()
+        except BaseException:
+            if probe:
+                with self._lock:
+                    breaker = self._breaker(slug, target)
+                    breaker.probes_in_flight = max(0, breaker.probes_in_flight - 1)
+            raise
+
+        with self._lock:
+            bulkhead.in_flight += 1
+            bulkhead.max_in_flight = max(bulkhead.max_in_flight, bulkhead.in_flight)
+        try:
+            result = await fn()
+        except Exception as exc:
+            self._settle(slug, target, probe=probe, exc=exc)
+            raise
+        except BaseException:
+            if probe:
+                with self._lock:
+                    breaker = self._breaker(slug, target)
+                    breaker.probes_in_flight = max(0, breaker.probes_in_flight - 1)
+            raise
+        finally:
+            with self._lock:
+                bulkhead.in_flight -= 1
+            bulkhead.semaphore.release()
+        self._settle(slug, target, probe=probe, exc=None)
+        return result
+
+    def state(self, project_slug: str, target: str) -> str:
+        with self._lock:
+            breaker = self._breakers.get((project_slug.strip().lower(), target))
+            if breaker is None:
+                return "closed"
+            if breaker.state == "open" and time.monotonic() >= breaker.open_until:
+                return "half_open"
+            return breaker.state
+
+    def snapshot(self, project_slug: Optional[str] = None) -> Dict[str, Any]:
+        now = time.monotonic()
+        wanted = project_slug.strip().lower() if project_slug else None
+        projects: Dict[str, Dict[str, Any]] = {}
+        open_circuits: List[str] = []
+        with self._lock:
+            for (slug, target), breaker in sorted(self._breakers.items()):
+                if wanted and slug != wanted:
+                    continue
+                state = breaker.state
+                if state == "open" and now >= breaker.open_until:
+                    state = "half_open"
+                if state != "closed":
+                    open_circuits.append(f"{slug}:{target}")
+                projects.setdefault(slug, {"breakers": {}})["breakers"][target] = {
+                    "state": state,
+                    "consecutive_failures": breaker.consecutive_failures,
+                    "retry_after_seconds": round(breaker.open_until - now, 1) if state == "open" else None,
+                    "calls": breaker.calls,
+                    "failures": breaker.failures,
+                    "rejected": breaker.rejected,
+                    "trips": breaker.trips,
+                    "last_error": breaker.last_error,
+                    "changed_at": breaker.changed_at,
+                }
+            for slug, bulkhead in sorted(self._bulkheads.items()):
+                if wanted and slug != wanted:
+                    continue
+                projects.setdefault(slug, {"breakers": {}})["bulkhead"] = {
+                    "limit": bulkhead.limit,
+                    "in_flight": bulkhead.in_flight,
+                    "waiting": bulkhead.waiting,
+                    "max_in_flight": bulkhead.max_in_flight,
+                    "rejected": bulkhead.rejected,
+                }
+        return {
+            "failure_threshold": self.failure_threshold,
+            "open_seconds": self.open_seconds,
+            "half_open_probes": self.half_open_probes,
+            "bulkhead_wait_ms": self.bulkhead_wait_ms,
+            "default_concurrency": self.concurrency(),
+            "open_circuits": open_circuits,
+            "projects": projects,
+        }
+
+
+supabase_guard = SupabaseGuard()
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from postgrest import AsyncPostgrestClient
+
+log = logging.getLogger("ether_v2.supabase_http")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _float_env(key: str, default: float) -> float:
+    try:
+        return float(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def supabase_timeout() -> httpx.Timeout:
+    read = max(0.1, _float_env("ETHER_SUPABASE_READ_TIMEOUT_SECONDS", 5.0))
+    return httpx.Timeout(
+        connect=max(0.1, _float_env("ETHER_SUPABASE_CONNECT_TIMEOUT_SECONDS", 3.0)),
+        read=read,
+        write=read,
+        pool=max(0.1, _float_env("ETHER_SUPABASE_POOL_TIMEOUT_SECONDS", 2.0)),
+    )
+
+
+def is_transport_error(exc: BaseException) -> bool:
+    """Connection, TLS and timeout failures, as opposed to PostgREST API errors."""
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError))
+
+
+@dataclass
+class _CachedClient:
+    client: AsyncPostgrestClient
+    url: str
+    created_at: float = field(default_factory=time.time)
+    last_ok_at: Optional[float] = None
+    consecutive_failures: int = 0
+    requests: int = 0
+
+
+class SupabaseClientCache:
+    """
+    Per-project PostgREST clients over one shared async HTTP pool.
+
+    Clients are cached by Supabase URL and service key, so each project builds its
+    headers once and reuses pooled keep-alive (HTTP/2 when ``h2`` is installed)
+    connections instead of repeating client construction and TLS setup on every
+    write and readback. A client that sees ``ETHER_SUPABASE_EVICT_AFTER_FAILURES``
+    consecutive transport failures is evicted and rebuilt on next use. The pool is
+    bound to the event loop that first uses it and is recreated if that loop goes
+    away (scripts that call ``asyncio.run`` more than once).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._http: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._clients: Dict[Tuple[str, str], _CachedClient] = {}
+        self._stats: Dict[str, int] = {
+            "clients_built": 0,
+            "client_hits": 0,
+            "evictions": 0,
+            "transport_failures": 0,
+            "pool_rebuilds": 0,
+            "warmups": 0,
+            "warmup_failures": 0,
+        }
+
+    @staticmethod
+    def _cache_key(url: str, key: str) -> Tuple[str, str]:
+        return url.rstrip("/"), hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _shared_http(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._http is not None and self._loop is loop and not self._http.is_closed:
+                return self._http
+            if self._http is not None:
+                # The old pool's connections belong to another loop; drop the clients built on it.
+                self._stats["pool_rebuilds"] += 1
+                self._clients.clear()
+            self._http = httpx.AsyncClient(
+                http2=_http2_available(),
+                timeout=supabase_timeout(),
+                limits=httpx.Limits(
+                    max_connections=max(1, _int_env("ETHER_SUPABASE_POOL_MAX", 20)),
+                    max_keepalive_connections=max(1, _int_env("ETHER_SUPABASE_KEEPALIVE_MAX", 10)),
+                    keepalive_expiry=max(1.0, _float_env("ETHER_SUPABASE_KEEPALIVE_EXPIRY_SECONDS", 60.0)),
+                ),
+                follow_redirects=True,
+            )
+            self._loop = loop
+            return self._http
+
+    def client(self, url: str, key: str) -> AsyncPostgrestClient:
+        """Cached PostgREST client for one project; must be called on the event loop."""
+        http = self._shared_http()
+        cache_key = self._cache_key(url, key)
+        with self._lock:
+            cached = self._clients.get(cache_key)
+            if cached is not None:
+                self._stats["client_hits"] += 1
+                cached.requests += 1
+                return cached.client
+            client = AsyncPostgrestClient(
+                f"{url.rstrip('/')}/rest/v1",
+                headers={
+                    "apikey": key,
+                    "Authorization": f"Bearer {key}",
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+                http_client=http,
+            )
+            self._clients[cache_key] = _CachedClient(client=client, url=url.rstrip("/"), requests=1)
+            self._stats["clients_built"] += 1
+            return client
+
+    def report(self, url: str, key: str, *, ok: bool, exc: Optional[BaseException] = None) -> None:
+        """Record a request outcome; only transport failures count against client health."""
+        cache_key = self._cache_key(url, key)
+        with self._lock:
+            cached = self._clients.get(cache_key)
+            if cached is None:
+                return
+            if ok or (exc is not None and not is_transport_error(exc)):
+                cached.consecutive_failures = 0
+                cached.last_ok_at = time.time()
+                return
+            self._stats["transport_failures"] += 1
+            cached.consecutive_failures += 1
+            if cached.consecutive_failures >= max(1, _int_env("ETHER_SUPABASE_EVICT_AFTER_FAILURES", 3)):
+                self._clients.pop(cache_key, None)
+                self._stats["evictions"] += 1
+                log.warning("ether_supabase_client_evicted url=%s failures=%s", cached.url, cached.consecutive_failures)
+
+    async def warm_up(self, url: str, key: str, table: str) -> bool:
+        """Open a pooled connection (DNS, TLS, HTTP/2 setup) with a one-row HEAD request; raises on failure."""
+        client = self.client(url, key)
+        try:
+            await client.session.head(
+                f"{url.rstrip('/')}/rest/v1/{table}",
+                params={"select": "id", "limit": "1"},
+                headers=dict(client.headers),
+            )
+            self.report(url, key, ok=True)
+            with self._lock:
+                self._stats["warmups"] += 1
+            return True
+        except Exception as exc:
+            self.report(url, key, ok=False, exc=exc)
+            with self._lock:
+                self._stats["warmup_failures"] += 1
+            log.warning("ether_supabase_warmup_failed url=%s error=%s", url, exc)
+            raise
+
+    async def aclose(self) -> None:
+        with self._lock:
+            http, self._http = self._http, None
+            self._loop = None
+            self._clients.clear()
+        if http is not None:
+            try:
+                await http.aclose()
+            except Exception as exc:
+                log.warning("ether_supabase_pool_close_failed=%s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            clients = [
+                {
+                    "url": cached.url,
+                    "age_seconds": round(now - cached.created_at, 1),
+                    "requests": cached.requests,
+                    "consecutive_failures": cached.consecutive_failures,
+                    "last_ok_seconds_ago": round(now - cached.last_ok_at, 1) if cached.last_ok_at else None,
+                }
+                for cached in self._clients.values()
+            ]
+            stats = dict(self._stats)
+            pool_open = self._http is not None and not self._http.is_closed
+        timeout = supabase_timeout()
+        return {
+            "pool_open": pool_open,
+            "http2": _http2_available(),
+            "connect_timeout_seconds": timeout.connect,
+            "read_timeout_seconds": timeout.read,
+            "pool_max": max(1, _int_env("ETHER_SUPABASE_POOL_MAX", 20)),
+            "keepalive_max": max(1, _int_env("ETHER_SUPABASE_KEEPALIVE_MAX", 10)),
+            **stats,
+            "clients": clients,
+        }
+
+
+supabase_clients = SupabaseClientCache()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, List
+
+from app.utils.webhook_store import recent_event_uids
+
+log = logging.getLogger("ether_v2.webhook_dedupe")
+
+
+def _int_env(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+def _float_env(key: str, default: float) -> float:
+    try:
+        return float(os.getenv(key, str(default)).strip() or default)
+    except ValueError:
+        return default
+
+
+class _BloomGeneration:
+    __slots__ = ("bits", "count")
+
+    def __init__(self, size_bits: int) -> None:
+        self.bits = bytearray((size_bits + 7) // 8)
+        self.count = 0
+
+
+class WebhookDedupeFilter:
+    """
+    Rotating Bloom filter over recently stored webhook ``event_uid`` values.
+
+    A negative answer is definitive, so new events go straight to the idempotent
+    insert. A positive answer may be a false positive and is confirmed against the
+    store with a read-only lookup. Two generations of ``capacity`` entries each are
+    kept; when the active one fills, the older one is discarded, so memory stays
+    fixed while the most recent ``capacity``..``2 * capacity`` uids remain covered.
+    The filter is an optimisation only: the store's unique ``event_uid`` still
+    decides duplicates, including those stored by other instances.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seeded = False
+        self._configure()
+        self._stats: Dict[str, int] = {
+            "checks": 0,
+            "definitely_new": 0,
+            "possible_hits": 0,
+            "confirmed_duplicates": 0,
+            "false_positives": 0,
+            "added": 0,
+            "rotations": 0,
+            "seeded_uids": 0,
+        }
+
+    def _configure(self) -> None:
+        self.capacity = max(1000, _int_env("ETHER_WEBHOOK_DEDUPE_CAPACITY", 100_000))
+        self.target_fp_rate = min(0.5, max(1e-6, _float_env("ETHER_WEBHOOK_DEDUPE_FP_RATE", 0.01)))
+        self.enabled = os.getenv("ETHER_WEBHOOK_DEDUPE_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+        self.size_bits = int(math.ceil(-self.capacity * math.log(self.target_fp_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size_bits / self.capacity * math.log(2))))
+        self._active = _BloomGeneration(self.size_bits)
+        self._previous = _BloomGeneration(self.size_bits)
+
+    def _positions(self, event_uid: str) -> List[int]:
+        digest = hashlib.blake2b(event_uid.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size_bits for index in range(self.hash_count)]
+
+    @staticmethod
+    def _contains(generation: _BloomGeneration, positions: List[int]) -> bool:
+        bits = generation.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in positions)
+
+    def _add_locked(self, positions: List[int]) -> None:
+        if self._active.count >= self.capacity:
+            self._previous = self._active
+            self._active = _BloomGeneration(self.size_bits)
+            self._stats["rotations"] += 1
+        bits = self._active.bits
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        self._active.count += 1
+        self._stats["added"] += 1
+
+    def might_contain(self, event_uid: str) -> bool:
+        """``False`` means the uid was definitely not stored by this instance recently."""
+        if not self.enabled or not self._seeded:
+            return True
+        positions = self._positions(event_uid)
+        with self._lock:
+            self._stats["checks"] += 1
+            hit = self._contains(self._active, positions) or self._contains(self._previous, positions)
+            self._stats["possible_hits" if hit else "definitely_new"] += 1
+        return hit
+
+    def add(self, event_uid: str) -> None:
+        if not self.enabled:
+            return
+        positions = self._positions(event_uid)
+        with self._lock:
+            self._add_locked(positions)
+
+    def record_confirmation(self, duplicate: bool) -> None:
+        with self._lock:
+            self._stats["confirmed_duplicates" if duplicate else "false_positives"] += 1
+
+    def seed(self, event_uids: List[str]) -> int:
+        """Load recent uids (oldest first) and start answering definitively."""
+        if not self.enabled:
+            return 0
+        with self._lock:
+            self._active = _BloomGeneration(self.size_bits)
+            self._previous = _BloomGeneration(self.size_bits)
+            for event_uid in event_uids:
+                self._add_locked(self._positions(event_uid))
+            self._stats["seeded_uids"] = len(event_uids)
+            self._seeded = True
+        return len(event_uids)
+
+    def initialize(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            seeded = self.seed(recent_event_uids(limit=self.capacity))
+            log.info("ether_webhook_dedupe_seeded=%s", seeded)
+        except Exception as exc:
+            # Unseeded, every check reports a possible hit and falls back to the store.
+            log.warning("ether_webhook_dedupe_seed_failed=%s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            entries = self._active.count + self._previous.count
+        possible = stats["possible_hits"]
+        confirmed = stats["confirmed_duplicates"] + stats["false_positives"]
+        return {
+            "enabled": self.enabled,
+            "seeded": self._seeded,
+            "capacity_per_generation": self.capacity,
+            "target_false_positive_rate": self.target_fp_rate,
+            "size_bytes": 2 * ((self.size_bits + 7) // 8),
+            "hash_count": self.hash_count,
+            "entries": entries,
+            **stats,
+            "hit_rate": round(possible / stats["checks"], 4) if stats["checks"] else 0.0,
+            "false_positive_rate": round(stats["false_positives"] / confirmed, 4) if confirmed else 0.0,
+        }
+
+
+webhook_dedupe = WebhookDedupeFilter()
@@ -4,32 +4,31 @@ import hashlib
 import json
 import os
 import sqlite3
-from contextlib import contextmanager
+import zlib
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+from app.utils.async_exec import store_async
+from app.utils.pagination import Keyset, keyset_clauses, page_limit
+from app.utils.sqlite_pool import resolve_db_path
+from app.utils.sqlite_schema import Migration, schema_registry
+from app.utils.storage_backend import get_storage_backend
+from app.utils.store_counters import counter_statements, read_counters
 
 
 def _db_path() -> Path:
-    raw = os.getenv("ETHER_WEBHOOK_DB_PATH", os.getenv("ETHER_AUDIT_DB_PATH", "runtime/ether_audit.sqlite3")).strip() or "runtime/ether_audit.sqlite3"
-    path = Path(raw)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return path
+    return resolve_db_path("ETHER_WEBHOOK_DB_PATH")
 
 
-@contextmanager
-def _connect() -> Iterator[sqlite3.Connection]:
-    conn = sqlite3.connect(_db_path())
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+def _connect(*, write: bool = False) -> ContextManager[Any]:
+    return get_storage_backend().connection(_db_path(), write=write)
 
 
-def init_webhook_store() -> None:
-    with _connect() as conn:
-        conn.execute(
+WEBHOOK_MIGRATIONS = (
+    Migration(
+        version=1,
+        name="baseline",
+        statements=(
             """
             create table if not exists webhook_events (
               id integer primary key autoincrement,
@@ -49,17 +48,103 @@ def init_webhook_store() -> None:
               processed_at text,
               notes text
             )
+            """,
+            "create index if not exists webhook_events_project_provider_idx on webhook_events (project_slug, provider, received_at desc)",
+            "create index if not exists webhook_events_status_idx on webhook_events (status, received_at desc)",
+            "create index if not exists webhook_events_provider_event_idx on webhook_events (provider, provider_event_id)",
+            "create index if not exists webhook_events_payload_hash_idx on webhook_events (payload_hash)",
+        ),
+    ),
+    Migration(
+        version=2,
+        name="keyset_pagination_indexes",
+        statements=(
+            "create index if not exists webhook_events_received_idx on webhook_events (received_at desc)",
+        ),
+    ),
+    Migration(
+        version=3,
+        name="webhook_counters",
+        statements=counter_statements(
+            table="webhook_events",
+            counter_table="webhook_counters",
+            ts_column="received_at",
+            project="{row}.project_slug",
+            dimensions={
+                "status": "{row}.status",
+                "provider": "{row}.provider",
+                "accepted": "case when {row}.accepted <> 0 then 'yes' else 'no' end",
+                "duplicate": "case when {row}.duplicate <> 0 then 'yes' else 'no' end",
+            },
+            mutable=("status",),
+        ),
+    ),
+    Migration(
+        version=4,
+        name="project_recency_index",
+        statements=(
+            "create index if not exists webhook_events_project_received_idx on webhook_events (project_slug, received_at desc)",
+        ),
+    ),
+    Migration(
+        version=5,
+        name="payload_blobs",
+        statements=(
             """
-        )
-        conn.execute("create index if not exists webhook_events_project_provider_idx on webhook_events (project_slug, provider, received_at desc)")
-        conn.execute("create index if not exists webhook_events_status_idx on webhook_events (status, received_at desc)")
-        conn.execute("create index if not exists webhook_events_provider_event_idx on webhook_events (provider, provider_event_id)")
-        conn.execute("create index if not exists webhook_events_payload_hash_idx on webhook_events (payload_hash)")
+            create table if not exists webhook_payloads (
+              payload_hash text primary key,
+              encoding text not null,
+              body blob not null,
+              raw_bytes integer not null,
+              stored_bytes integer not null,
+              created_at text not null
+            )
+            """,
+        ),
+    ),
+)
+
+# Event columns returned by list/read paths; payload bodies are only loaded on request.
+_EVENT_COLUMNS = (
+    "id",
+    "event_uid",
+    "project_slug",
+    "provider",
+    "event_type",
+    "provider_event_id",
+    "status",
+    "accepted",
+    "duplicate",
+    "payload_hash",
+    "headers_json",
+    "validation_json",
+    "received_at",
+    "processed_at",
+    "notes",
+)
+_EVENT_SELECT = ", ".join(_EVENT_COLUMNS)
+_EMPTY_PAYLOAD = "{}"
+
+schema_registry.register("webhook", _db_path, WEBHOOK_MIGRATIONS)
+
+
+def init_webhook_store() -> None:
+    schema_registry.ensure("webhook")
+
+
+def _canonical_payload(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload or {}, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
 def canonical_payload_hash(payload: Dict[str, Any]) -> str:
-    text = json.dumps(payload or {}, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return hashlib.sha256(_canonical_payload(payload)).hexdigest()
+
+
+def _compression_level() -> int:
+    try:
+        return min(9, max(1, int(os.getenv("ETHER_WEBHOOK_PAYLOAD_COMPRESSION_LEVEL", "6").strip() or 6)))
+    except ValueError:
+        return 6
 
 
 def make_event_uid(*, project_slug: str, provider: str, provider_event_id: Optional[str], payload_hash: str) -> str:
@@ -80,13 +165,31 @@ def _details(raw: str) -> Dict[str, Any]:
 
 
 def event_exists(event_uid: str) -> bool:
-    init_webhook_store()
+    schema_registry.ensure("webhook")
     with _connect() as conn:
         row = conn.execute("select id from webhook_events where event_uid = ?", (event_uid,)).fetchone()
     return row is not None
 
 
-def save_webhook_event(
+def find_webhook_event(event_uid: str) -> Optional[Dict[str, Any]]:
+    schema_registry.ensure("webhook")
+    with _connect() as conn:
+        row = conn.execute(f"select {_EVENT_SELECT} from webhook_events where event_uid = ?", (event_uid,)).fetchone()
+    return _row_to_event(row) if row else None
+
+
+def recent_event_uids(*, limit: int) -> List[str]:
+    """Most recent ``limit`` event uids, oldest first."""
+    schema_registry.ensure("webhook")
+    with _connect() as conn:
+        rows = conn.execute(
+            "select event_uid from webhook_events order by received_at desc, id desc limit ?",
+            (max(1, limit),),
+        ).fetchall()
+    return [row["event_uid"] for row in reversed(rows)]
+
+
+def record_webhook_event(
     *,
     event_uid: str,
     project_slug: str,
@@ -102,19 +205,27 @@ def save_webhook_event(
     validation: Dict[str, Any],
     received_at: str,
     notes: Optional[str] = None,
-) -> Dict[str, Any]:
-    init_webhook_store()
-    with _connect() as conn:
-        if event_exists(event_uid):
-            row = conn.execute("select * from webhook_events where event_uid = ?", (event_uid,)).fetchone()
-            return _row_to_event(row) if row else {}
-        cursor = conn.execute(
-            """
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Idempotently store one delivery. Returns ``(event, created)``: the new row and
+    ``True``, or the row already stored under ``event_uid`` and ``False``.
+
+    The insert itself decides new versus duplicate (``on conflict do nothing``), so
+    concurrent deliveries of one event cannot both be recorded as new.
+    """
+    schema_registry.ensure("webhook")
+    raw = _canonical_payload(payload)
+    body = zlib.compress(raw, _compression_level())
+    with _connect(write=True) as conn:
+        row = conn.execute(
+            f"""
             insert into webhook_events (
               event_uid, project_slug, provider, event_type, provider_event_id, status,
               accepted, duplicate, payload_hash, payload_json, headers_json, validation_json,
               received_at, notes
             ) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            on conflict(event_uid) do nothing
+            returning {_EVENT_SELECT}
             """,
             (
                 event_uid,
@@ -126,15 +237,170 @@ def save_webhook_event(
                 1 if accepted else 0,
                 1 if duplicate else 0,
                 payload_hash,
-                _json(payload),
+                _EMPTY_PAYLOAD,
                 _json(headers),
                 _json(validation),
                 received_at,
                 notes,
             ),
-        )
-        row = conn.execute("select * from webhook_events where id = ?", (cursor.lastrowid,)).fetchone()
-    return _row_to_event(row) if row else {}
+        ).fetchone()
+        if row is None:
+            row = conn.execute(f"select {_EVENT_SELECT} from webhook_events where event_uid = ?", (event_uid,)).fetchone()
+            return (_row_to_event(row) if row else {}), False
+        _store_payload(conn, payload_hash=payload_hash, raw=raw, body=body, created_at=received_at)
+    return _row_to_event(row), True
+
+
+def save_webhook_event(**fields: Any) -> Dict[str, Any]:
+    """``record_webhook_event`` for callers that only need the stored row."""
+    event, _ = record_webhook_event(**fields)
+    return event
+
+
+def _store_payload(conn: Any, *, payload_hash: str, raw: bytes, body: bytes, created_at: str) -> None:
+    # Content-addressed: a repeated delivery of the same payload adds no bytes.
+    conn.execute(
+        """
+        insert into webhook_payloads (payload_hash, encoding, body, raw_bytes, stored_bytes, created_at)
+        values (?, 'zlib', ?, ?, ?, ?)
+        on conflict(payload_hash) do nothing
+        """,
+        (payload_hash, body, len(raw), len(body), created_at),
+    )
+
+
+def _decode_payload(encoding: Optional[str], body: Any) -> Dict[str, Any]:
+    if body is None:
+        return {}
+    try:
+        data = bytes(body)
+        if encoding == "zlib":
+            data = zlib.decompress(data)
+        value = json.loads(data.decode("utf-8"))
+        return value if isinstance(value, dict) else {}
+    except Exception:
+        return {}
+
+
+def load_webhook_payloads(payload_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Payload bodies for ``payload_hashes``. Rows written before payloads moved to
+    ``webhook_payloads`` and not yet compacted are read from their inline column.
+    """
+    hashes = sorted({value for value in payload_hashes if value})
+    if not hashes:
+        return {}
+    schema_registry.ensure("webhook")
+    placeholders = ",".join("?" for _ in hashes)
+    with _connect() as conn:
+        rows = conn.execute(
+            f"select payload_hash, encoding, body from webhook_payloads where payload_hash in ({placeholders})",
+            hashes,
+        ).fetchall()
+        payloads = {row["payload_hash"]: _decode_payload(row["encoding"], row["body"]) for row in rows}
+        missing = [value for value in hashes if value not in payloads]
+        for payload_hash in missing:
+            row = conn.execute(
+                "select payload_json from webhook_events where payload_hash = ? and payload_json <> ? limit 1",
+                (payload_hash, _EMPTY_PAYLOAD),
+            ).fetchone()
+            if row is not None:
+                payloads[payload_hash] = _details(row["payload_json"])
+    return payloads
+
+
+def get_webhook_payload(payload_hash: str) -> Optional[Dict[str, Any]]:
+    return load_webhook_payloads([payload_hash]).get(payload_hash)
+
+
+def attach_payloads(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    payloads = load_webhook_payloads([str(event.get("payload_hash") or "") for event in events])
+    for event in events:
+        event["payload"] = payloads.get(str(event.get("payload_hash") or ""), {})
+    return events
+
+
+def compact_inline_payloads(*, chunk_size: int = 500) -> Dict[str, Any]:
+    """
+    Move payloads still stored inline on older event rows into ``webhook_payloads``
+    one chunk at a time, then clear the inline column.
+    """
+    schema_registry.ensure("webhook")
+    result: Dict[str, Any] = {"ok": True, "compacted_rows": 0, "raw_bytes": 0, "stored_bytes": 0}
+    last_id = 0
+    try:
+        while True:
+            with _connect() as conn:
+                rows = conn.execute(
+                    "select id, payload_hash, payload_json, received_at from webhook_events where id > ? and payload_json <> ? order by id limit ?",
+                    (last_id, _EMPTY_PAYLOAD, max(1, chunk_size)),
+                ).fetchall()
+            if not rows:
+                break
+            blobs: Dict[str, tuple[bytes, bytes, str]] = {}
+            for row in rows:
+                if row["payload_hash"] not in blobs:
+                    raw = _canonical_payload(_details(row["payload_json"]))
+                    blobs[row["payload_hash"]] = (raw, zlib.compress(raw, _compression_level()), row["received_at"])
+            ids = [row["id"] for row in rows]
+            placeholders = ",".join("?" for _ in ids)
+            with _connect(write=True) as conn:
+                for payload_hash, (raw, body, created_at) in blobs.items():
+                    _store_payload(conn, payload_hash=payload_hash, raw=raw, body=body, created_at=created_at)
+                conn.execute(f"update webhook_events set payload_json = ? where id in ({placeholders})", [_EMPTY_PAYLOAD, *ids])
+            last_id = ids[-1]
+            result["compacted_rows"] += len(ids)
+            result["raw_bytes"] += sum(len(raw) for raw, _, _ in blobs.values())
+            result["stored_bytes"] += sum(len(body) for _, body, _ in blobs.values())
+    except Exception as exc:
+        result["ok"] = False
+        result["error"] = str(exc)[:240]
+    return result
+
+
+def prune_orphan_payloads(*, chunk_size: int = 500) -> int:
+    """Delete payload blobs no remaining event row references (after retention)."""
+    schema_registry.ensure("webhook")
+    pruned = 0
+    while True:
+        with _connect() as conn:
+            rows = conn.execute(
+                """
+                select payload_hash from webhook_payloads
+                where not exists (select 1 from webhook_events where webhook_events.payload_hash = webhook_payloads.payload_hash)
+                limit ?
+                """,
+                (max(1, chunk_size),),
+            ).fetchall()
+        hashes = [row["payload_hash"] for row in rows]
+        if not hashes:
+            return pruned
+        placeholders = ",".join("?" for _ in hashes)
+        with _connect(write=True) as conn:
+            conn.execute(
+                f"""
+                delete from webhook_payloads where payload_hash in ({placeholders})
+                and not exists (select 1 from webhook_events where webhook_events.payload_hash = webhook_payloads.payload_hash)
+                """,
+                hashes,
+            )
+        pruned += len(hashes)
+
+
+def payload_storage_stats() -> Dict[str, Any]:
+    schema_registry.ensure("webhook")
+    with _connect() as conn:
+        row = conn.execute(
+            "select count(*) as blobs, coalesce(sum(raw_bytes), 0) as raw_bytes, coalesce(sum(stored_bytes), 0) as stored_bytes from webhook_payloads"
+        ).fetchone()
+    raw_bytes = int(row["raw_bytes"] or 0)
+    stored_bytes = int(row["stored_bytes"] or 0)
+    return {
+        "blobs": int(row["blobs"] or 0),
+        "raw_bytes": raw_bytes,
+        "stored_bytes": stored_bytes,
+        "compression_ratio": round(stored_bytes / raw_bytes, 3) if raw_bytes else None,
+    }
 
 
 def list_webhook_events(
@@ -143,8 +409,12 @@ def list_webhook_events(
     provider: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = 50,
+    before: Optional[Keyset] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    include_payload: bool = False,
 ) -> List[Dict[str, Any]]:
-    init_webhook_store()
+    schema_registry.ensure("webhook")
     clauses: list[str] = []
     params: list[Any] = []
     if project_slug:
@@ -156,35 +426,54 @@ def list_webhook_events(
     if status:
         clauses.append("status = ?")
         params.append(status.strip().lower())
+    keyset, keyset_params = keyset_clauses("received_at", before=before, since=since, until=until)
+    clauses.extend(keyset)
+    params.extend(keyset_params)
     where = f"where {' and '.join(clauses)}" if clauses else ""
-    params.append(max(1, min(limit, 500)))
+    params.append(page_limit(limit))
     with _connect() as conn:
-        rows = conn.execute(f"select * from webhook_events {where} order by received_at desc, id desc limit ?", params).fetchall()
-    return [_row_to_event(row) for row in rows]
+        rows = conn.execute(
+            f"select {_EVENT_SELECT} from webhook_events {where} order by received_at desc, id desc limit ?",
+            params,
+        ).fetchall()
+    events = [_row_to_event(row) for row in rows]
+    return attach_payloads(events) if include_payload else events
 
 
 def webhook_snapshot(project_slug: Optional[str] = None) -> Dict[str, Any]:
-    events = list_webhook_events(project_slug=project_slug, limit=200)
-    status_counts: Dict[str, int] = {}
-    provider_counts: Dict[str, int] = {}
-    duplicate_count = 0
-    accepted_count = 0
-    for event in events:
-        status_counts[event["status"]] = status_counts.get(event["status"], 0) + 1
-        provider_counts[event["provider"]] = provider_counts.get(event["provider"], 0) + 1
-        duplicate_count += 1 if event.get("duplicate") else 0
-        accepted_count += 1 if event.get("accepted") else 0
+    events = list_webhook_events(project_slug=project_slug, limit=25)
+    with _connect() as conn:
+        counters = read_counters(conn, "webhook_counters", project_slug=project_slug)
+    lifetime = counters["lifetime"]
+    window = counters["window"]
     return {
         "project_slug": project_slug,
-        "event_count": len(events),
-        "accepted_count": accepted_count,
-        "duplicate_count": duplicate_count,
-        "status_counts": status_counts,
-        "provider_counts": provider_counts,
-        "recent_events": events[:25],
+        "event_count": counters["total"],
+        "accepted_count": lifetime.get("accepted", {}).get("yes", 0),
+        "duplicate_count": lifetime.get("duplicate", {}).get("yes", 0),
+        "status_counts": lifetime.get("status", {}),
+        "provider_counts": lifetime.get("provider", {}),
+        "window": {
+            "days": counters["window_days"],
+            "event_count": counters["window_total"],
+            "accepted_count": window.get("accepted", {}).get("yes", 0),
+            "duplicate_count": window.get("duplicate", {}).get("yes", 0),
+            "status_counts": window.get("status", {}),
+            "provider_counts": window.get("provider", {}),
+        },
+        "recent_events": events,
     }
 
 
+# Async variants for request handlers: the blocking call runs on the store executor.
+find_webhook_event_async = store_async(find_webhook_event)
+record_webhook_event_async = store_async(record_webhook_event)
+get_webhook_payload_async = store_async(get_webhook_payload)
+payload_storage_stats_async = store_async(payload_storage_stats)
+list_webhook_events_async = store_async(list_webhook_events)
+webhook_snapshot_async = store_async(webhook_snapshot)
+
+
 def _row_to_event(row: sqlite3.Row) -> Dict[str, Any]:
     return {
         "id": row["id"],
@@ -197,7 +486,6 @@ def _row_to_event(row: sqlite3.Row) -> Dict[str, Any]:
         "accepted": bool(row["accepted"]),
         "duplicate": bool(row["duplicate"]),
         "payload_hash": row["payload_hash"],
-        "payload": _details(row["payload_json"]),
         "headers": _details(row["headers_json"]),
         "validation": _details(row["validation_json"]),
         "received_at": row["received_at"],
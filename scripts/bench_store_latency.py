@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _env(key: str, default: str = "") -> str:
+    return os.getenv(key, default).strip()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_us": round(statistics.fmean(ordered) * 1e6, 1),
+        "p50_us": round(ordered[len(ordered) // 2] * 1e6, 1),
+        "p95_us": round(ordered[int(len(ordered) * 0.95) - 1] * 1e6, 1),
+    }
+
+
+def main() -> None:
+    """
+    Per-call latency of the store hot paths with the legacy per-call DDL replay
+    ("before") versus the one-time schema bootstrap ("after").
+    """
+    iterations = int(_env("ETHER_BENCH_ITERATIONS", "500"))
+    workdir = tempfile.mkdtemp(prefix="ether-bench-")
+    os.environ["ETHER_STORAGE_BACKEND"] = "sqlite"
+    os.environ["ETHER_AUDIT_DB_PATH"] = os.path.join(workdir, "ether_bench.sqlite3")
+
+    from app.utils.audit_store import list_persistent_audit_events, persist_audit_event
+    from app.utils.sentinel_store import find_active_quarantines, save_threat
+    from app.utils.signal_verification_store import save_signal_run
+    from app.utils.sqlite_pool import sqlite_pool
+    from app.utils.sqlite_schema import schema_registry
+    from app.utils.webhook_store import event_exists, save_webhook_event
+
+    schema_registry.bootstrap()
+    counter = {"n": 0}
+
+    def _uid() -> str:
+        counter["n"] += 1
+        return f"bench-{counter['n']}"
+
+    operations: Dict[str, tuple[str, Callable[[], Any]]] = {
+        "persist_audit_event": ("audit", lambda: persist_audit_event({"ts": _now(), "action": "bench", "result": "ok", "details": {"n": 1}})),
+        "list_persistent_audit_events": ("audit", lambda: list_persistent_audit_events(limit=25)),
+        "save_signal_run": (
+            "signal_verification",
+            lambda: save_signal_run(
+                project_slug="circa_haus",
+                signal_kind="heartbeat",
+                lane_id="bench",
+                status="verified",
+                write_ok=True,
+                readback_ok=True,
+                verified_ok=True,
+                write_mode="rpc",
+                write_target="ether_signal",
+                readback_mode="table_readback",
+                readback_target="ether_signals",
+                error=None,
+                write_result={},
+                readback_result={},
+                payload_summary={},
+                recorded_at=_now(),
+            ),
+        ),
+        "event_exists": ("webhook", lambda: event_exists("missing-event")),
+        "save_webhook_event": (
+            "webhook",
+            lambda: save_webhook_event(
+                event_uid=_uid(),
+                project_slug="circa_haus",
+                provider="stripe",
+                event_type="bench",
+                provider_event_id=None,
+                status="accepted",
+                accepted=True,
+                duplicate=False,
+                payload_hash="0" * 64,
+                payload={"id": "bench"},
+                headers={},
+                validation={},
+                received_at=_now(),
+            ),
+        ),
+        "save_threat": (
+            "sentinel",
+            lambda: save_threat(
+                project_slug="circa_haus",
+                event_type="bench",
+                severity="low",
+                risk_score=10,
+                disposition="allow",
+                quarantined=False,
+                actor_id=None,
+                source_ip=None,
+                details={},
+                created_at=_now(),
+            ),
+        ),
+        "find_active_quarantines": ("sentinel", lambda: find_active_quarantines(project_slug="circa_haus", target_type="actor", target_id="x")),
+    }
+
+    def _replay_ddl(component: str) -> None:
+        path = schema_registry.db_path(component)
+        with sqlite_pool.connection(path, write=True) as conn:
+            # The legacy stores replayed only their baseline DDL on every call.
+            for statement in schema_registry.migrations(component)[0].statements:
+                conn.execute(statement)
+
+    results: Dict[str, Any] = {}
+    for name, (component, operation) in operations.items():
+        before: List[float] = []
+        after: List[float] = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            _replay_ddl(component)
+            operation()
+            before.append(time.perf_counter() - started)
+        for _ in range(iterations):
+            started = time.perf_counter()
+            operation()
+            after.append(time.perf_counter() - started)
+        before_summary = _summary(before)
+        after_summary = _summary(after)
+        results[name] = {
+            "before_per_call_ddl": before_summary,
+            "after_one_time_bootstrap": after_summary,
+            "mean_speedup": round(before_summary["mean_us"] / after_summary["mean_us"], 2) if after_summary["mean_us"] else None,
+        }
+
+    sqlite_pool.close_all()
+    print(json.dumps({"ok": True, "iterations": iterations, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Small, bounded tables where a full scan is the intended plan.
+BOUNDED_TABLES = {
+    "audit_counters",
+    "webhook_counters",
+    "signal_counters",
+    "sentinel_threat_counters",
+    "sentinel_quarantine_counters",
+    "signal_run_latest",
+    "project_controls",
+    "provider_controls",
+    "ether_schema_versions",
+    "ether_schema_migrations",
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _plan_problems(plan: List[str]) -> List[str]:
+    problems: List[str] = []
+    for detail in plan:
+        if detail.startswith("SCAN "):
+            table = detail.split()[1]
+            if "USING" not in detail and table not in BOUNDED_TABLES:
+                problems.append(detail)
+        if detail.startswith("USE TEMP B-TREE FOR ORDER BY"):
+            problems.append(detail)
+    return problems
+
+
+def main() -> None:
+    """
+    EXPLAIN QUERY PLAN regression check for the store read paths.
+
+    Runs every store query shape against a scratch database, captures the SQL the
+    stores actually execute, and fails when a query scans a growing table without
+    an index or sorts with a temporary b-tree.
+    """
+    workdir = tempfile.mkdtemp(prefix="ether-plans-")
+    os.environ["ETHER_STORAGE_BACKEND"] = "sqlite"
+    os.environ["ETHER_AUDIT_DB_PATH"] = os.path.join(workdir, "ether_plans.sqlite3")
+
+    from app.utils.audit_store import list_persistent_audit_events, persist_audit_event, persistent_audit_snapshot
+    from app.utils.control_store import list_control_events, load_control_snapshot
+    from app.utils.pagination import decode_cursor, encode_cursor
+    from app.utils.sentinel_store import find_active_quarantines, list_quarantine_rows, list_threat_rows, sentinel_snapshot
+    from app.utils.signal_lane_store import load_recent_signal_lanes, load_signal_lane
+    from app.utils.signal_outbox_store import list_signal_outbox, signal_outbox_snapshot
+    from app.utils.signal_verification_store import (
+        list_pending_signal_runs,
+        list_signal_runs,
+        signal_latency_snapshot,
+        signal_verification_snapshot,
+    )
+    from app.utils.sqlite_pool import resolve_db_path, sqlite_pool
+    from app.utils.sqlite_schema import schema_registry
+    from app.utils.webhook_store import event_exists, get_webhook_payload, list_webhook_events, webhook_snapshot
+
+    schema_registry.bootstrap()
+    persist_audit_event({"ts": _now(), "action": "Bench.Plan", "project_slug": "circa_haus", "result": "ok", "details": {}})
+    before = decode_cursor(encode_cursor(_now(), 1))
+
+    shapes: Dict[str, Callable[[], Any]] = {
+        "audit_recent": lambda: list_persistent_audit_events(limit=25),
+        "audit_project": lambda: list_persistent_audit_events(project_slug="Circa_Haus"),
+        "audit_action": lambda: list_persistent_audit_events(action="bench.plan"),
+        "audit_result": lambda: list_persistent_audit_events(result="OK"),
+        "audit_project_action": lambda: list_persistent_audit_events(project_slug="circa_haus", action="bench.plan"),
+        "audit_project_result": lambda: list_persistent_audit_events(project_slug="circa_haus", result="ok"),
+        "audit_cursor": lambda: list_persistent_audit_events(project_slug="circa_haus", before=before, since="2020-01-01"),
+        "audit_snapshot": lambda: persistent_audit_snapshot(limit=25),
+        "signal_recent": lambda: list_signal_runs(limit=25),
+        "signal_project": lambda: list_signal_runs(project_slug="circa_haus"),
+        "signal_verified": lambda: list_signal_runs(verified_ok=True),
+        "signal_cursor": lambda: list_signal_runs(project_slug="circa_haus", before=before),
+        "signal_snapshot": lambda: signal_verification_snapshot(project_slug="circa_haus"),
+        "signal_pending": lambda: list_pending_signal_runs(limit=25),
+        "signal_latency": lambda: signal_latency_snapshot(project_slugs=["circa_haus"]),
+        "signal_lane": lambda: load_signal_lane("circa_haus", "circa_haus:app:instance"),
+        "signal_lanes_restore": lambda: load_recent_signal_lanes(limit=25, seen_since="2020-01-01"),
+        "signal_outbox_dead": lambda: list_signal_outbox(status="dead", limit=25),
+        "signal_outbox_project": lambda: list_signal_outbox(status="pending", project_slug="circa_haus"),
+        "signal_outbox_snapshot": lambda: signal_outbox_snapshot(),
+        "signal_outbox_snapshot_project": lambda: signal_outbox_snapshot(project_slug="circa_haus"),
+        "webhook_exists": lambda: event_exists("missing"),
+        "webhook_recent": lambda: list_webhook_events(limit=25),
+        "webhook_project_provider": lambda: list_webhook_events(project_slug="circa_haus", provider="stripe"),
+        "webhook_status": lambda: list_webhook_events(status="accepted"),
+        "webhook_cursor": lambda: list_webhook_events(before=before),
+        "webhook_snapshot": lambda: webhook_snapshot(project_slug="circa_haus"),
+        "webhook_payloads": lambda: list_webhook_events(limit=25, include_payload=True),
+        "webhook_payload_legacy": lambda: get_webhook_payload("missing"),
+        "sentinel_threats": lambda: list_threat_rows(limit=25),
+        "sentinel_threats_project": lambda: list_threat_rows(project_slug="circa_haus"),
+        "sentinel_threats_open": lambda: list_threat_rows(status="open"),
+        "sentinel_quarantines": lambda: list_quarantine_rows(limit=25),
+        "sentinel_quarantines_project": lambda: list_quarantine_rows(project_slug="circa_haus", status="active"),
+        "sentinel_enforcement": lambda: find_active_quarantines(project_slug="circa_haus", target_type="actor", target_id="x"),
+        "sentinel_snapshot": lambda: sentinel_snapshot(),
+        "control_events": lambda: list_control_events(limit=25),
+        "control_events_project": lambda: list_control_events(project_slug="circa_haus"),
+        "control_events_incident": lambda: list_control_events(incident_id="inc-1"),
+        "control_snapshot": lambda: load_control_snapshot(),
+    }
+
+    results: Dict[str, Any] = {}
+    failures = 0
+    with sqlite_pool.connection(resolve_db_path()) as conn:
+        for name, shape in shapes.items():
+            captured: List[str] = []
+            conn.set_trace_callback(captured.append)
+            try:
+                shape()
+            finally:
+                conn.set_trace_callback(None)
+            queries = []
+            for sql in captured:
+                if not sql.lstrip().lower().startswith("select"):
+                    continue
+                plan = [row["detail"] for row in conn.execute(f"explain query plan {sql}").fetchall()]
+                problems = _plan_problems(plan)
+                failures += 1 if problems else 0
+                queries.append({"sql": " ".join(sql.split()), "plan": plan, "problems": problems})
+            results[name] = queries
+
+    sqlite_pool.close_all()
+    print(json.dumps({"ok": failures == 0, "failures": failures, "results": results}, indent=2))
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -94,14 +94,43 @@ begin
     incoming_received_at
   ) returning id into inserted_id;
 
+  -- Receipt contract: Ether treats the returned id and received_at as proof of the
+  -- write and skips the readback query. Keep these keys when changing this function.
   return jsonb_build_object(
     'ok', true,
+    'contract', 2,
     'id', inserted_id,
     'app_slug', incoming_app_slug,
+    'lane_id', incoming_lane,
+    'heartbeat_count', incoming_heartbeat_count,
     'received_at', incoming_received_at
   );
 end;
 $$;
 
+create or replace function public.ether_signal_batch(payloads jsonb)
+returns jsonb
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  item jsonb;
+  results jsonb := '[]'::jsonb;
+begin
+  if jsonb_typeof(payloads) <> 'array' then
+    raise exception 'ether_signal_batch requires a json array of payloads';
+  end if;
+
+  for item in select value from jsonb_array_elements(payloads)
+  loop
+    results := results || jsonb_build_array(public.ether_signal(item));
+  end loop;
+
+  return results;
+end;
+$$;
+
 comment on table public.ether_signals is 'Real Ether signal/keepalive records written by Ether into connected Supabase projects.';
-comment on function public.ether_signal(jsonb) is 'Records one Ether signal payload for project keepalive, health, and operational verification.';
+comment on function public.ether_signal(jsonb) is 'Records one Ether signal payload for project keepalive, health, and operational verification; returns the inserted id and received_at as the write receipt.';
+comment on function public.ether_signal_batch(jsonb) is 'Records a batch of Ether heartbeat payloads in one call; the batch is one transaction and returns one receipt per payload.';